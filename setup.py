@@ -14,15 +14,26 @@ setup(
         "flask-limiter",
     ],
     extras_require={
+        "prod": [
+            "gunicorn",
+            "brotli",
+        ],
+        "async": [
+            "aiomysql",
+            "flask[async]",
+        ],
         "dev": [
             "pytest",
             "pytest-flask",
             "pytest-cov",
+            "asgiref",
         ]
     },
     entry_points={
         "console_scripts": [
             "omni=omni.app:main",
+            "omni-rotar-claves=omni.modules.rotacion:main",
+            "omni-estaticos=omni.modules.estaticos:main",
         ]
     },
 )
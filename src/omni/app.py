@@ -2,12 +2,17 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 
 from omni.modules.limiter import limiter
-from omni.modules.config import Configuracion
+from omni.modules.config import obtener_configuracion
+from omni.modules.database import liberar_bd
+from omni.modules.estaticos import url_estatico
+from omni.modules.cifrado import CifradoSaturado, obtener_pool_cifrado
+from omni.modules.services_auth import iniciar_reconstruccion_filtro
 
 from omni.modules.logging import Logs
 from omni.modules.routes import omni_bp
 from omni.modules.routes_auth import auth_bp
 from omni.modules.routes_user import usuarios_bp
+from omni.modules.routes_async import registrar_vistas_async
 
 
 class Applicacion:
@@ -35,15 +40,17 @@ class Applicacion:
         """
         # Obtiene la configuración para la applicación
         self.__config: dict[str, str | bool | int] = (
-            Configuracion().obtener_config_app()
+            obtener_configuracion().obtener_config_app()
         )
 
         # Inicializar el logger
         self.logger: Logs = Logs()
         self.logger.info("Applicación Inicializada")
 
-        # Inicializa la applicación como un objeto con una sub ruta estatica
-        self.flask_app: Flask = Flask(__name__, static_folder="static")
+        # Inicializa la applicación con su carpeta estatica; la ruta /static la
+        # sirve omni_bp (archivos con huella), no la ruta propia de Flask
+        self.flask_app: Flask = Flask(__name__, static_folder=None)
+        self.flask_app.static_folder = "static"
 
         # Configuración modular
         self.__registrar_bp()
@@ -57,6 +64,8 @@ class Applicacion:
             - Habilita modo debug según configuración
             - Establece clave secreta
             - Inicializa limitador de tasas
+            - Libera la conexión de cada petición al terminar
+            - Expone url_estatico() a las plantillas
             - Configura políticas de cookies seguras
             - Habilita CORS con credenciales y orígenes permitidos
         """
@@ -67,6 +76,12 @@ class Applicacion:
         # Inicializar limitador
         limiter.init_app(self.flask_app)
 
+        # Devuelve al pool la conexión de cada petición
+        self.flask_app.teardown_appcontext(liberar_bd)
+
+        # URLs con huella de los archivos estaticos (ver omni-estaticos)
+        self.flask_app.add_template_global(url_estatico)
+
         # Se configuran cookies
         self.flask_app.config.update(
             SESSION_COOKIE_SECURE=True,
@@ -88,17 +103,24 @@ class Applicacion:
             - omni_bp: Rutas generales
             - auth_bp: Rutas de autenticación
             - usuarios_bp: Rutas de gestión de usuarios
+
+        Con DB_ASYNC las rutas de la API que consultan la base de datos usan
+        sus vistas async (ver routes_async).
         """
         # Registra los blueprints generados en otros modulos
         self.flask_app.register_blueprint(omni_bp)
         self.flask_app.register_blueprint(auth_bp)
         self.flask_app.register_blueprint(usuarios_bp)
 
+        if obtener_configuracion().obtener_config_pool()["Async"]:
+            registrar_vistas_async(self.flask_app)
+
     def __registrar_manejador_errores(self) -> None:
         """Registra manejadores globales para errores HTTP
 
         Errores manejados:
             - 500 (Internal Server Error): Registra en logs y retorna respuesta JSON
+            - CifradoSaturado: 503 con Retry-After cuando el pool de cifrado está lleno
         """
 
         @self.flask_app.errorhandler(500)
@@ -112,6 +134,18 @@ class Applicacion:
             self.logger.critical("Error interno de servidor", stack_info=True)
             return jsonify({"success": False, "message": "Error interno de servidor"})
 
+        @self.flask_app.errorhandler(CifradoSaturado)
+        def manejar_cifrado_saturado(err: CifradoSaturado):
+            """Rechaza la petición sin esperar cuando el pool de cifrado está lleno"""
+            self.logger.warning(
+                "Pool de cifrado saturado",
+                error=str(err),
+                **obtener_pool_cifrado().estadisticas(),
+            )
+            respuesta = jsonify({"success": False, "message": "Servidor ocupado"})
+            respuesta.headers["Retry-After"] = "1"
+            return respuesta, 503
+
     def ejecutar(self) -> None:
         """Inicia el servidor web con la configuración cargada
 
@@ -125,19 +159,79 @@ class Applicacion:
             port=self.__config["Port"],
         )
         # Ejecuta la applicación
+        iniciar_reconstruccion_filtro()
         self.flask_app.run(
             host=str(self.__config["Host"]), port=int(self.__config["Port"])
         )
 
 
+def crear_app() -> Flask:
+    """Fábrica de la aplicación para servidores WSGI
+
+    Cada worker llama a esta función después del fork, así que las conexiones,
+    los manejadores de logs y Fernet se crean dentro del proceso que los usa.
+    También inicia el hilo que reconstruye el filtro de nombres del worker.
+
+    Retorna:
+        Flask: Aplicación lista para servirse
+
+    Uso:
+        gunicorn -w 4 --threads 4 "omni.app:crear_app()"
+    """
+    app = Applicacion().flask_app
+    iniciar_reconstruccion_filtro()
+    return app
+
+
+def servir_produccion() -> None:
+    """Sirve la aplicación con gunicorn usando varios procesos e hilos
+
+    Detalles:
+        - Número de procesos: APP_WORKERS
+        - Hilos por proceso: APP_THREADS (worker "gthread")
+        - La aplicación se crea en cada worker con crear_app(), nunca en el maestro
+
+    Raises:
+        RuntimeError: Si gunicorn no está instalado (pip install omni[prod])
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError as err:
+        raise RuntimeError(
+            "El modo de produccion requiere gunicorn: pip install omni[prod]"
+        ) from err
+
+    config = obtener_configuracion().obtener_config_app()
+
+    class ServidorGunicorn(BaseApplication):
+        """Aplicación de gunicorn configurada desde Configuracion"""
+
+        def load_config(self) -> None:
+            self.cfg.set("bind", f"{config['Host']}:{config['Port']}")
+            self.cfg.set("workers", int(config["Workers"]))
+            self.cfg.set("threads", int(config["Threads"]))
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("preload_app", False)
+
+        def load(self) -> Flask:
+            return crear_app()
+
+    ServidorGunicorn().run()
+
+
 def main() -> None:
     """Punto de entrada principal de la aplicación
     Copy
 
     Flujo:
-        1. Crea instancia de Applicacion
-        2. Ejecuta el servidor web
+        1. Con APP_SERVER=prod sirve la aplicación con gunicorn (servir_produccion)
+        2. Si no, crea instancia de Applicacion
+        3. Ejecuta el servidor web de desarrollo
     """
+    if obtener_configuracion().obtener_config_app()["Server"] == "prod":
+        servir_produccion()
+        return
+
     app = Applicacion()
     app.ejecutar()
 
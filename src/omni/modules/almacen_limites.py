@@ -0,0 +1,226 @@
+import os
+import time
+import sqlite3
+import threading
+import urllib.parse
+from collections import OrderedDict
+
+from limits.storage import Storage
+
+
+class AlmacenMemoriaAcotada(Storage):
+    """Almacén de contadores en memoria con un máximo de claves.
+
+    Sirve para un solo proceso. Al superar "max_claves" se descarta la clave
+    usada hace más tiempo (LRU), y las claves vencidas se eliminan al leerse,
+    así que la memoria no crece con cada IP distinta que llega.
+
+    URI:
+        omni-memory://
+
+    Atributos:
+        max_claves (int): Máximo de contadores guardados
+        desalojados (int): Contadores descartados por LRU
+    """
+
+    STORAGE_SCHEME = ["omni-memory"]
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        max_claves: int = 100_000,
+        **_: float | str | bool,
+    ) -> None:
+        """Crea el almacén vacío."""
+        self.max_claves: int = int(max_claves)
+        self.desalojados: int = 0
+        self.__contadores: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self.__candado = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return ValueError
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Incrementa el contador; si venció, empieza una nueva ventana."""
+        ahora = time.time()
+
+        with self.__candado:
+            valor, expira = self.__contadores.pop(key, (0, 0.0))
+
+            if expira <= ahora:
+                valor, expira = 0, ahora + expiry
+
+            valor += amount
+            self.__contadores[key] = (valor, expira)
+
+            while len(self.__contadores) > self.max_claves:
+                self.__contadores.popitem(last=False)
+                self.desalojados += 1
+
+            return valor
+
+    def get(self, key: str) -> int:
+        """Valor del contador, 0 si no existe o ya venció."""
+        with self.__candado:
+            valor, expira = self.__contadores.get(key, (0, 0.0))
+
+            if expira <= time.time():
+                self.__contadores.pop(key, None)
+                return 0
+
+            return valor
+
+    def get_expiry(self, key: str) -> float:
+        """Momento (epoch) en que vence el contador."""
+        with self.__candado:
+            return self.__contadores.get(key, (0, time.time()))[1]
+
+    def check(self) -> bool:
+        return True
+
+    def reset(self) -> int | None:
+        with self.__candado:
+            total = len(self.__contadores)
+            self.__contadores.clear()
+            return total
+
+    def clear(self, key: str) -> None:
+        with self.__candado:
+            self.__contadores.pop(key, None)
+
+
+class AlmacenSQLite(Storage):
+    """Almacén de contadores en un archivo SQLite compartido entre procesos.
+
+    Pensado para varios workers en un mismo servidor: todos usan el mismo
+    archivo, así que el límite es global y no se multiplica por el número de
+    procesos. Cada incremento es una sola sentencia (UPSERT ... RETURNING).
+    Periódicamente se eliminan los contadores vencidos y, si se supera
+    "max_claves", los usados hace más tiempo.
+
+    URI:
+        omni-sqlite:///ruta/al/archivo.db
+
+    Atributos:
+        ruta (str): Archivo de la base de datos
+        max_claves (int): Máximo de contadores guardados
+    """
+
+    STORAGE_SCHEME = ["omni-sqlite"]
+
+    LIMPIAR_CADA = 1000
+    """Incrementos entre cada limpieza de contadores vencidos"""
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        max_claves: int = 100_000,
+        **_: float | str | bool,
+    ) -> None:
+        """Crea el almacén; la conexión se abre en el primer uso de cada hilo."""
+        ruta = urllib.parse.urlparse(uri or "").path
+        if not ruta:
+            raise ValueError(
+                "omni-sqlite requiere una ruta, ej. omni-sqlite:///tmp/x.db"
+            )
+
+        self.ruta: str = ruta
+        self.max_claves: int = int(max_claves)
+        self.__local = threading.local()
+        self.__incrementos = 0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return sqlite3.Error
+
+    def __conexion(self) -> sqlite3.Connection:
+        """Conexión del hilo actual, creada de nuevo después de un fork."""
+        conexion: sqlite3.Connection | None = getattr(self.__local, "conexion", None)
+
+        if conexion is None or self.__local.pid != os.getpid():
+            conexion = sqlite3.connect(self.ruta, timeout=5, isolation_level=None)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute(
+                "CREATE TABLE IF NOT EXISTS contadores ("
+                "clave TEXT PRIMARY KEY, valor INTEGER NOT NULL, "
+                "expira REAL NOT NULL, acceso REAL NOT NULL)"
+            )
+            conexion.execute(
+                "CREATE INDEX IF NOT EXISTS contadores_acceso ON contadores (acceso)"
+            )
+            self.__local.conexion = conexion
+            self.__local.pid = os.getpid()
+
+        return conexion
+
+    def __limpiar(self, conexion: sqlite3.Connection, ahora: float) -> None:
+        """Elimina contadores vencidos y, si sobran, los menos usados."""
+        conexion.execute("DELETE FROM contadores WHERE expira <= ?", (ahora,))
+        conexion.execute(
+            "DELETE FROM contadores WHERE clave IN (SELECT clave FROM contadores "
+            "ORDER BY acceso DESC LIMIT -1 OFFSET ?)",
+            (self.max_claves,),
+        )
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Incrementa el contador en una sola sentencia."""
+        conexion = self.__conexion()
+        ahora = time.time()
+
+        fila = conexion.execute(
+            "INSERT INTO contadores (clave, valor, expira, acceso) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (clave) DO UPDATE SET "
+            "valor = CASE WHEN expira <= excluded.acceso THEN excluded.valor "
+            "ELSE valor + excluded.valor END, "
+            "expira = CASE WHEN expira <= excluded.acceso THEN excluded.expira "
+            "ELSE expira END, "
+            "acceso = excluded.acceso "
+            "RETURNING valor",
+            (key, amount, ahora + expiry, ahora),
+        ).fetchone()
+
+        self.__incrementos += 1
+        if self.__incrementos % self.LIMPIAR_CADA == 0:
+            self.__limpiar(conexion, ahora)
+
+        return int(fila[0])
+
+    def get(self, key: str) -> int:
+        """Valor del contador, 0 si no existe o ya venció."""
+        fila = (
+            self.__conexion()
+            .execute(
+                "SELECT valor FROM contadores WHERE clave = ? AND expira > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return int(fila[0]) if fila else 0
+
+    def get_expiry(self, key: str) -> float:
+        """Momento (epoch) en que vence el contador."""
+        fila = (
+            self.__conexion()
+            .execute("SELECT expira FROM contadores WHERE clave = ?", (key,))
+            .fetchone()
+        )
+        return float(fila[0]) if fila else time.time()
+
+    def check(self) -> bool:
+        try:
+            self.__conexion().execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        return self.__conexion().execute("DELETE FROM contadores").rowcount
+
+    def clear(self, key: str) -> None:
+        self.__conexion().execute("DELETE FROM contadores WHERE clave = ?", (key,))
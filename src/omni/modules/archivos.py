@@ -0,0 +1,93 @@
+import os
+import stat
+import tempfile
+
+
+def _comprobar_privado(ruta: str, info: os.stat_result) -> None:
+    """Falla si el archivo es de otro usuario o lo pueden usar otros."""
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(
+            f"{ruta} debe ser del usuario {os.getuid()} y sin permisos "
+            "para el grupo ni para otros"
+        )
+
+
+def _crear_carpeta_privada(carpeta: str) -> str:
+    """Crea la carpeta con modo 0700 y comprueba que siga siendo privada."""
+    os.makedirs(carpeta, mode=0o700, exist_ok=True)
+
+    info = os.lstat(carpeta)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"{carpeta} no es un directorio")
+    _comprobar_privado(carpeta, info)
+
+    return carpeta
+
+
+def carpeta_privada() -> str:
+    """Carpeta temporal del usuario del proceso, solo accesible por él (0700).
+
+    Guarda los archivos que comparten los procesos de un servidor cuando no
+    se configuró otra ruta; en el directorio temporal común cualquier
+    usuario podría crearlos antes o cambiarlos por un enlace simbólico.
+
+    Retorna:
+        str: <tmp>/omniguard-<uid>
+
+    Raises:
+        PermissionError: Si la carpeta ya existe y no es un directorio del
+            usuario o la pueden usar otros
+    """
+    return _crear_carpeta_privada(
+        os.path.join(tempfile.gettempdir(), f"omniguard-{os.getuid()}")
+    )
+
+
+def carpeta_estado() -> str:
+    """Carpeta persistente del usuario para el estado de los comandos (0700).
+
+    A diferencia de carpeta_privada(), sobrevive a un reinicio (el
+    directorio temporal puede ser tmpfs).
+
+    Retorna:
+        str: $XDG_STATE_HOME/omniguard (por defecto ~/.local/state/omniguard)
+
+    Raises:
+        PermissionError: Si la carpeta ya existe y no es un directorio del
+            usuario o la pueden usar otros
+    """
+    base = os.environ.get("XDG_STATE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".local", "state"
+    )
+    return _crear_carpeta_privada(os.path.join(base, "omniguard"))
+
+
+def abrir_privado(ruta: str, flags: int = os.O_RDWR | os.O_CREAT) -> int:
+    """Abre un archivo que solo debe usar el usuario del proceso.
+
+    No sigue enlaces simbólicos y comprueba, sobre el descriptor abierto,
+    que sea un archivo regular del usuario sin permisos para otros.
+
+    Args:
+        ruta (str): Archivo a abrir; si se crea queda con modo 0600
+        flags (int): Flags de os.open() (O_NOFOLLOW se agrega siempre)
+
+    Retorna:
+        int: Descriptor del archivo
+
+    Raises:
+        OSError: Si no se puede abrir o la ruta es un enlace simbólico
+        PermissionError: Si el archivo es de otro usuario o lo pueden usar otros
+    """
+    fd = os.open(ruta, flags | os.O_NOFOLLOW, 0o600)
+
+    try:
+        info = os.fstat(fd)
+        if not stat.S_ISREG(info.st_mode):
+            raise PermissionError(f"{ruta} no es un archivo regular")
+        _comprobar_privado(ruta, info)
+    except BaseException:
+        os.close(fd)
+        raise
+
+    return fd
@@ -0,0 +1,240 @@
+import time
+import threading
+import dataclasses
+from collections import OrderedDict
+
+from omni.modules.models import Usuario
+from omni.modules.filtro_nombres import normalizar_nombre
+from omni.modules.invalidacion import CanalInvalidacion, claves_invalidacion
+
+
+class CacheUsuarios:
+    """Cache LRU con vencimiento de registros Usuario por id y por nombre.
+
+    Cada usuario se guarda una sola vez por id; los nombres consultados
+    apuntan a ese id, así que las búsquedas por nombre y por id comparten la
+    misma entrada y se invalidan juntas. Al superar "max_entradas" se
+    descarta el usuario usado hace más tiempo.
+
+    Para no guardar datos viejos cuando una escritura ocurre mientras otra
+    petición lee, guardar() recibe la marca() tomada antes de consultar la
+    base de datos y se ignora si hubo una invalidación entre medio.
+
+    Con un CanalInvalidacion, cada usuario guarda las versiones de sus
+    claves (id y nombre) y deja de ser vigente en cuanto otro proceso publica
+    un cambio sobre ellas.
+
+    Atributos:
+        max_entradas (int): Máximo de usuarios guardados
+        ttl (float): Segundos que un usuario se considera vigente
+        aciertos (int): Búsquedas respondidas desde la cache
+        fallos (int): Búsquedas que tuvieron que ir a la base de datos
+        desalojos (int): Usuarios descartados por LRU
+        generacion (int): Contador de invalidaciones locales
+        canal (CanalInvalidacion|None): Versiones compartidas entre procesos
+    """
+
+    def __init__(
+        self,
+        max_entradas: int = 10_000,
+        ttl: float = 60,
+        canal: CanalInvalidacion | None = None,
+    ) -> None:
+        """Crea la cache vacía."""
+        self.max_entradas: int = max_entradas
+        self.ttl: float = ttl
+        self.canal: CanalInvalidacion | None = canal
+        self.aciertos: int = 0
+        self.fallos: int = 0
+        self.desalojos: int = 0
+        self.generacion: int = 0
+        # id -> (usuario, vence, versión global, [(ranura, versión), ...])
+        self.__por_id: OrderedDict[
+            int, tuple[Usuario, float, int, list[tuple[int, int]]]
+        ] = OrderedDict()
+        self.__por_nombre: dict[str, int] = {}
+        self.__nombres_de: dict[int, set[str]] = {}
+        # normalizar_nombre() -> ids, para invalidar por nombre sin recorrer la cache
+        self.__ids_por_forma: dict[str, set[int]] = {}
+        self.__formas_de: dict[int, set[str]] = {}
+        self.__candado = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__por_id)
+
+    def __quitar(self, id_usuario: int) -> None:
+        """Elimina el usuario y los nombres que apuntan a él."""
+        self.__por_id.pop(id_usuario, None)
+        for nombre in self.__nombres_de.pop(id_usuario, ()):
+            self.__por_nombre.pop(nombre, None)
+
+        for forma in self.__formas_de.pop(id_usuario, ()):
+            ids = self.__ids_por_forma.get(forma)
+            if ids is not None:
+                ids.discard(id_usuario)
+                if not ids:
+                    del self.__ids_por_forma[forma]
+
+    def __cambio_en_otro_proceso(self, id_usuario: int) -> bool:
+        """True si alguna clave del usuario cambió desde que se guardó."""
+        if self.canal is None:
+            return False
+
+        usuario, vence, version_global, versiones = self.__por_id[id_usuario]
+        actual = self.canal.version_global()
+        if actual == version_global:
+            return False
+        if actual % 2:
+            # Otro proceso está publicando; se descarta por precaución
+            return True
+
+        if any(self.canal.version(ranura) != version for ranura, version in versiones):
+            return True
+
+        # Cambiaron otras claves: se evita revisar las ranuras la próxima vez
+        self.__por_id[id_usuario] = (usuario, vence, actual, versiones)
+        return False
+
+    def __vigente(self, id_usuario: int | None) -> Usuario | None:
+        """Copia del usuario si está guardado, no ha vencido ni cambió."""
+        entrada = self.__por_id.get(id_usuario) if id_usuario is not None else None
+
+        if entrada is None or entrada[1] <= time.monotonic():
+            if id_usuario is not None and entrada is not None:
+                self.__quitar(id_usuario)
+            self.fallos += 1
+            return None
+
+        if self.__cambio_en_otro_proceso(id_usuario):
+            self.__quitar(id_usuario)
+            self.fallos += 1
+            return None
+
+        self.__por_id.move_to_end(id_usuario)
+        self.aciertos += 1
+        return dataclasses.replace(entrada[0])
+
+    def obtener_por_nombre(self, nombre: str) -> Usuario | None:
+        """Usuario guardado para el nombre consultado, o None."""
+        with self.__candado:
+            return self.__vigente(self.__por_nombre.get(nombre))
+
+    def obtener_por_id(self, id_usuario: int) -> Usuario | None:
+        """Usuario guardado para el id, o None."""
+        with self.__candado:
+            return self.__vigente(id_usuario)
+
+    def marca(self) -> tuple[int, int]:
+        """Estado de las invalidaciones, a tomar antes de leer la base de datos."""
+        return (
+            self.generacion,
+            self.canal.version_global() if self.canal is not None else 0,
+        )
+
+    def guardar(
+        self, usuario: Usuario, marca: tuple[int, int], nombre: str | None = None
+    ) -> None:
+        """Guarda un usuario leído de la base de datos.
+
+        Args:
+            usuario (Usuario): Registro leído (debe tener id)
+            marca (tuple[int, int]): Valor de marca() antes de la lectura
+            nombre (str|None): Nombre tal como se consultó, si fue por nombre
+        """
+        if usuario.id is None:
+            return
+
+        formas = {normalizar_nombre(usuario.nombre)}
+        if nombre is not None:
+            formas.add(normalizar_nombre(nombre))
+
+        with self.__candado:
+            versiones = []
+            if self.canal is not None:
+                versiones = [
+                    (ranura, self.canal.version(ranura))
+                    for ranura in {
+                        self.canal.ranura(clave)
+                        for clave in claves_invalidacion(usuario.id, usuario.nombre)
+                    }
+                ]
+
+            # Las versiones se leen antes de comprobar la marca; un contador
+            # global impar indica una publicación a medias
+            if marca != self.marca() or marca[1] % 2:
+                return
+
+            self.__por_id[usuario.id] = (
+                dataclasses.replace(usuario),
+                time.monotonic() + self.ttl,
+                marca[1],
+                versiones,
+            )
+            self.__por_id.move_to_end(usuario.id)
+
+            self.__formas_de.setdefault(usuario.id, set()).update(formas)
+            for forma in formas:
+                self.__ids_por_forma.setdefault(forma, set()).add(usuario.id)
+
+            if nombre is not None:
+                anterior = self.__por_nombre.get(nombre)
+                if anterior is not None and anterior != usuario.id:
+                    self.__nombres_de.get(anterior, set()).discard(nombre)
+
+                self.__por_nombre[nombre] = usuario.id
+                self.__nombres_de.setdefault(usuario.id, set()).add(nombre)
+
+            while len(self.__por_id) > self.max_entradas:
+                self.__quitar(next(iter(self.__por_id)))
+                self.desalojos += 1
+
+    def invalidar(
+        self, id_usuario: int | None = None, nombre: str | None = None
+    ) -> None:
+        """Descarta un usuario por id y/o todos los que coincidan con un nombre.
+
+        La coincidencia por nombre ignora mayúsculas y acentos, igual o más
+        amplia que la colación de la base de datos. Solo afecta a este
+        proceso; los demás se enteran por CanalInvalidacion.publicar().
+        """
+        self.invalidar_muchos(
+            [] if id_usuario is None else [id_usuario],
+            [] if nombre is None else [nombre],
+        )
+
+    def invalidar_muchos(self, ids: list[int], nombres: list[str]) -> None:
+        """Como invalidar(), para varios ids y nombres con un solo candado.
+
+        Los nombres se buscan en el índice por forma normalizada, sin
+        recorrer la cache.
+        """
+        formas = {normalizar_nombre(nombre) for nombre in nombres}
+
+        with self.__candado:
+            self.generacion += 1
+
+            for id_usuario in ids:
+                self.__quitar(id_usuario)
+
+            for forma in formas:
+                for id_guardado in list(self.__ids_por_forma.get(forma, ())):
+                    self.__quitar(id_guardado)
+
+    def limpiar(self) -> None:
+        """Descarta todos los usuarios guardados."""
+        with self.__candado:
+            self.generacion += 1
+            self.__por_id.clear()
+            self.__por_nombre.clear()
+            self.__nombres_de.clear()
+            self.__ids_por_forma.clear()
+            self.__formas_de.clear()
+
+    def estadisticas(self) -> dict[str, int]:
+        """Contadores de uso para monitoreo."""
+        return {
+            "entradas": len(self.__por_id),
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+        }
@@ -0,0 +1,348 @@
+import os
+import sys
+import hmac
+import time
+import asyncio
+import hashlib
+import threading
+import statistics
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as TiempoAgotado,
+)
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+from omni.modules.config import obtener_configuracion
+
+T = TypeVar("T")
+
+
+class CifradoSaturado(RuntimeError):
+    """El pool de cifrado no admite más trabajo; se debe reintentar más tarde."""
+
+
+def unir_claves(principal: str, anteriores: str = "") -> str:
+    """Llavero de claves Fernet separadas por comas, la principal primero.
+
+    Args:
+        principal (str): Clave con la que se cifra (APP_KEY)
+        anteriores (str): Claves previas separadas por comas (APP_PREVIOUS_KEYS),
+            que solo se usan para descifrar
+
+    Ejemplo:
+        unir_claves("k2", "k1, k0")  # "k2,k1,k0"
+    """
+    claves = [principal.strip()]
+    for clave in anteriores.split(","):
+        if clave.strip() and clave.strip() not in claves:
+            claves.append(clave.strip())
+    return ",".join(claves)
+
+
+@lru_cache(maxsize=8)
+def _fernet(claves: str) -> MultiFernet:
+    """MultiFernet del llavero (la primera clave cifra), uno por proceso."""
+    return MultiFernet([Fernet(clave.encode()) for clave in claves.split(",")])
+
+
+def cifrar(claves: str, passwords: list[str]) -> list[str]:
+    """Cifra varias contraseñas con la clave principal en una sola tarea del pool."""
+    fernet = _fernet(claves)
+    return [fernet.encrypt(password.encode()).decode() for password in passwords]
+
+
+def descifrar(claves: str, password_encriptado: str) -> str:
+    """Descifra una contraseña con cualquiera de las claves del llavero.
+
+    Raises:
+        cryptography.fernet.InvalidToken: Si ninguna clave del llavero la descifra
+    """
+    return _fernet(claves).decrypt(password_encriptado.encode()).decode()
+
+
+def verificar(claves: str, password_encriptado: str, password: str) -> bool:
+    """True si la contraseña coincide con la cifrada, en tiempo constante.
+
+    Raises:
+        cryptography.fernet.InvalidToken: Si ninguna clave del llavero la descifra
+    """
+    return hmac.compare_digest(
+        descifrar(claves, password_encriptado).encode(), password.encode()
+    )
+
+
+def rotar(claves: str, tokens: list[str]) -> list[str | None]:
+    """Re-cifra con la clave principal los tokens cifrados con claves anteriores.
+
+    Retorna:
+        list: Por cada token, el token nuevo; el mismo token si ya usa la
+            clave principal; o None si ninguna clave del llavero lo descifra
+    """
+    fernet = _fernet(claves)
+    principal = _fernet(claves.split(",")[0])
+    rotados: list[str | None] = []
+
+    for token in tokens:
+        try:
+            principal.decrypt(token.encode())
+            rotados.append(token)
+            continue
+        except InvalidToken:
+            pass
+
+        try:
+            rotados.append(fernet.rotate(token.encode()).decode())
+        except InvalidToken:
+            rotados.append(None)
+
+    return rotados
+
+
+class PoolCifrado:
+    """Ejecuta las operaciones de contraseñas en un pool acotado de hilos o procesos.
+
+    Como mucho "trabajadores" operaciones corren al mismo tiempo y
+    "max_cola" esperan; una operación más se rechaza al momento con
+    CifradoSaturado en vez de ocupar otro hilo de petición. Con procesos el
+    trabajo no compite por el GIL con los hilos de las peticiones; las
+    funciones deben ser de nivel de módulo (cifrar, descifrar, verificar, rotar).
+    Con 0 trabajadores las operaciones se ejecutan en el hilo que las pide.
+
+    Atributos:
+        trabajadores (int): Operaciones ejecutándose al mismo tiempo
+        max_cola (int): Operaciones que pueden esperar un trabajador
+        procesos (bool): Usa procesos en lugar de hilos
+        tiempo_espera (float): Segundos máximos de espera por un resultado
+
+    Ejemplo:
+        pool = PoolCifrado(trabajadores=2, max_cola=32)
+        token = pool.ejecutar(cifrar, claves, ["secreto"])[0]
+    """
+
+    def __init__(
+        self,
+        trabajadores: int = 2,
+        max_cola: int = 64,
+        procesos: bool = False,
+        tiempo_espera: float = 10.0,
+    ) -> None:
+        """Crea el pool; los hilos o procesos se inician en el primer uso."""
+        self.trabajadores: int = max(0, trabajadores)
+        self.max_cola: int = max(0, max_cola)
+        self.procesos: bool = procesos
+        self.tiempo_espera: float = tiempo_espera
+        self.__ejecutor: Executor | None = None
+        self.__candado = threading.Lock()
+        self.__pendientes = 0
+        self.__max_pendientes = 0
+        self.__completadas = 0
+        self.__rechazadas = 0
+        self.__segundos = 0.0
+
+    def __obtener_ejecutor(self) -> Executor:
+        """Ejecutor del pool, creado en el primer uso (bajo el candado)."""
+        if self.__ejecutor is None:
+            if self.procesos:
+                # spawn: el worker de la aplicación puede tener otros hilos vivos
+                self.__ejecutor = ProcessPoolExecutor(
+                    self.trabajadores, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self.__ejecutor = ThreadPoolExecutor(
+                    self.trabajadores, thread_name_prefix="omni-cifrado"
+                )
+
+        return self.__ejecutor
+
+    def __terminar(self, inicio: float) -> None:
+        """Descuenta una operación terminada (o cancelada) y suma su latencia."""
+        with self.__candado:
+            self.__pendientes -= 1
+            self.__completadas += 1
+            self.__segundos += time.monotonic() - inicio
+
+    def enviar(self, funcion: Callable[..., T], *args: Any) -> "Future[T]":
+        """Encola funcion(*args) si hay lugar.
+
+        Raises:
+            CifradoSaturado: Si ya hay "trabajadores" + "max_cola" operaciones
+        """
+        with self.__candado:
+            if self.__pendientes >= self.trabajadores + self.max_cola:
+                self.__rechazadas += 1
+                raise CifradoSaturado("Demasiadas operaciones de cifrado en espera")
+
+            ejecutor = self.__obtener_ejecutor()
+            self.__pendientes += 1
+            self.__max_pendientes = max(self.__max_pendientes, self.__pendientes)
+
+        inicio = time.monotonic()
+        try:
+            futuro = ejecutor.submit(funcion, *args)
+        except BaseException:
+            self.__terminar(inicio)
+            raise
+
+        futuro.add_done_callback(lambda _: self.__terminar(inicio))
+        return futuro
+
+    def ejecutar(self, funcion: Callable[..., T], *args: Any) -> T:
+        """Ejecuta funcion(*args) en el pool y espera su resultado.
+
+        Raises:
+            CifradoSaturado: Si la cola está llena o el resultado no llega en
+                "tiempo_espera" segundos
+        """
+        if not self.trabajadores:
+            return funcion(*args)
+
+        futuro = self.enviar(funcion, *args)
+        try:
+            return futuro.result(timeout=self.tiempo_espera)
+        except TiempoAgotado as err:
+            futuro.cancel()
+            raise CifradoSaturado("La operación de cifrado tardó demasiado") from err
+
+    async def ejecutar_async(self, funcion: Callable[..., T], *args: Any) -> T:
+        """Como ejecutar(), pero espera sin bloquear el bucle de eventos."""
+        if not self.trabajadores:
+            return funcion(*args)
+
+        futuro = self.enviar(funcion, *args)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(futuro), self.tiempo_espera
+            )
+        except asyncio.TimeoutError as err:
+            raise CifradoSaturado("La operación de cifrado tardó demasiado") from err
+
+    def estadisticas(self) -> dict[str, int | float]:
+        """Profundidad de la cola y latencias para monitoreo."""
+        with self.__candado:
+            return {
+                "en_curso": min(self.__pendientes, self.trabajadores),
+                "en_cola": max(0, self.__pendientes - self.trabajadores),
+                "max_pendientes": self.__max_pendientes,
+                "completadas": self.__completadas,
+                "rechazadas": self.__rechazadas,
+                "latencia_ms": (
+                    1000 * self.__segundos / self.__completadas
+                    if self.__completadas
+                    else 0.0
+                ),
+            }
+
+    def cerrar(self) -> None:
+        """Detiene los hilos o procesos tras terminar las operaciones en curso."""
+        with self.__candado:
+            ejecutor, self.__ejecutor = self.__ejecutor, None
+
+        if ejecutor is not None:
+            ejecutor.shutdown(wait=True, cancel_futures=True)
+
+
+def calibrar_scrypt(
+    objetivo_ms: float = 100.0,
+    r: int = 8,
+    p: int = 1,
+    max_memoria: int = 256 * 1024 * 1024,
+    repeticiones: int = 3,
+) -> dict[str, int | float]:
+    """Elige el costo de scrypt para verificar en "objetivo_ms" en esta máquina.
+
+    Duplica N desde 2**10 midiendo hashlib.scrypt (mediana de "repeticiones")
+    y se queda con el N más alto que no supera el objetivo ni usa más de
+    "max_memoria" bytes (128 * r * N por verificación). Conviene calibrar en
+    el servidor de producción y sin carga.
+
+    Args:
+        objetivo_ms (float): Latencia buscada por verificación
+        r (int): Tamaño de bloque de scrypt
+        p (int): Paralelismo de scrypt
+        max_memoria (int): Memoria máxima por verificación, en bytes
+        repeticiones (int): Mediciones por cada N
+
+    Retorna:
+        dict: {"n": int, "r": int, "p": int, "ms": float, "memoria": int}
+
+    Ejemplo:
+        calibrar_scrypt(250)  # {'n': 65536, 'r': 8, 'p': 1, 'ms': 201.4, ...}
+    """
+    elegido: dict[str, int | float] | None = None
+    n = 2**10
+
+    while 128 * r * n <= max_memoria:
+        memoria = 128 * r * n
+        muestras = []
+        for _ in range(max(1, repeticiones)):
+            inicio = time.perf_counter()
+            hashlib.scrypt(
+                b"calibracion",
+                salt=os.urandom(16),
+                n=n,
+                r=r,
+                p=p,
+                maxmem=memoria + 1024 * 1024,
+                dklen=32,
+            )
+            muestras.append((time.perf_counter() - inicio) * 1000)
+
+        ms = statistics.median(muestras)
+        if elegido is not None and ms > objetivo_ms:
+            break
+
+        elegido = {"n": n, "r": r, "p": p, "ms": round(ms, 1), "memoria": memoria}
+        if ms > objetivo_ms:
+            break
+        n *= 2
+
+    return elegido or {"n": n, "r": r, "p": p, "ms": 0.0, "memoria": 128 * r * n}
+
+
+_pool_cifrado: PoolCifrado | None = None
+_candado = threading.Lock()
+
+
+def obtener_pool_cifrado() -> PoolCifrado:
+    """Retorna el pool de cifrado del proceso, creándolo en el primer uso.
+
+    Retorna:
+        PoolCifrado: Pool compartido por los hilos del proceso
+    """
+    global _pool_cifrado
+
+    if _pool_cifrado is None:
+        with _candado:
+            if _pool_cifrado is None:
+                config = obtener_configuracion().obtener_config_cifrado()
+                _pool_cifrado = PoolCifrado(
+                    trabajadores=int(config["Workers"]),
+                    max_cola=int(config["Queue"]),
+                    procesos=config["Mode"] == "process",
+                    tiempo_espera=float(config["Timeout"]),
+                )
+
+    return _pool_cifrado
+
+
+def _reiniciar_en_hijo() -> None:
+    """Olvida el pool heredado tras un fork; sus hilos no existen en el hijo."""
+    global _pool_cifrado, _candado
+    _pool_cifrado = None
+    _candado = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
+
+
+if __name__ == "__main__":
+    # python -m omni.modules.cifrado [objetivo_ms]
+    print(calibrar_scrypt(float(sys.argv[1]) if len(sys.argv) > 1 else 100.0))
@@ -1,13 +1,25 @@
 import os
+import threading
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 
+def _leer_bool(nombre: str, defecto: str) -> bool:
+    """Interpreta una variable de entorno como booleano ("true", "1", "si", "yes")."""
+    return os.getenv(nombre, defecto).strip().lower() in ("1", "true", "si", "yes")
+
+
+@dataclass(frozen=True, slots=True)
 class Configuracion:
     """Gestor centralizado de configuración de la aplicación.
 
     Carga y valida variables de entorno desde un archivo .env.
     Proporciona configuraciones estructuradas para diferentes módulos.
 
+    Es una instantánea inmutable: se carga una vez por proceso con
+    obtener_configuracion() y se comparte; recargar_configuracion() crea
+    una nueva instantánea a partir del .env actual.
+
     Atributos:
         DB_USER (str): Usuario de la base de datos
         DB_PASSWORD (str): Contraseña de la base de datos
@@ -15,36 +27,159 @@ class Configuracion:
         APP_SECRET (str): Clave secreta para sesiones Flask
 
     Métodos:
+        cargar(): Crea la configuración desde el .env y el entorno
         obtener_config_bd(): Retorna configuración para MySQL
+        obtener_config_pool(): Retorna configuración del pool de conexiones
         obtener_config_app(): Retorna configuración para Flask
         obtener_config_log(): Retorna configuración para logging
+        obtener_config_limites(): Retorna configuración del limitador de tasas
+        obtener_config_cifrado(): Retorna configuración del pool de cifrado
 
     Raises:
         RuntimeError: Si falta el archivo .env
     """
 
-    def __init__(self) -> None:
-        """Inicializa y valida la configuración desde variables de entorno."""
-        if not load_dotenv():
-            raise RuntimeError("No se encontro un archivo .env")
+    # Configuración de la base de datos
+    DB_USER: str
+    DB_PASSWORD: str
+    DB_HOST: str
+    DB_NAME: str
+    DB_PORT: int
+
+    # Configuración del pool de conexiones
+    DB_POOL_MIN: int
+    DB_POOL_MAX: int
+    DB_POOL_IDLE_TIMEOUT: float
+    DB_POOL_CHECK_AFTER: float
+    DB_POOL_TIMEOUT: float
+    DB_PREPARED: bool
+    DB_ASYNC: bool
+    DB_ASYNC_POOL_MAX: int
+
+    # Configuración de la applicación
+    APP_KEY: str
+    APP_PREVIOUS_KEYS: str
+    APP_HOST: str
+    APP_PORT: int
+    APP_DEBUG: bool
+    APP_SECRET: str
+    APP_SERVER: str
+    APP_WORKERS: int
+    APP_THREADS: int
+
+    # Configuración del limitador de tasas
+    RATELIMIT_STORAGE_URI: str
+    RATELIMIT_MAX_KEYS: int
+    RATELIMIT_DEFAULT: str
+    RATELIMIT_AUTH: str
+    RATELIMIT_LOGIN: str
+    RATELIMIT_USERS: str
 
-        # Configuración de la base de datos
-        self.DB_USER: str = os.getenv("DB_USER", "")
-        self.DB_PASSWORD: str = os.getenv("DB_PASSWORD", "")
-        self.DB_HOST: str = os.getenv("DB_HOST", "localhost")
-        self.DB_NAME: str = os.getenv("DB_NAME", "OmniGuard")
-        self.DB_PORT: int = int(os.getenv("DB_PORT", "3306"))
+    # Configuración del freno de intentos de login
+    LOGIN_USER_FAILURES: int
+    LOGIN_IP_FAILURES: int
+    LOGIN_WINDOW: int
+    LOGIN_MAX_KEYS: int
 
-        # Configuración de la applicación
-        self.APP_KEY: str = os.getenv("APP_KEY", "")
-        self.APP_HOST: str = os.getenv("APP_HOST", "localhost")
-        self.APP_PORT: int = int(os.getenv("APP_PORT", "5000"))
-        self.APP_DEBUG: bool = bool(os.getenv("APP_DEBUG", "False"))
-        self.APP_SECRET: str = os.getenv("APP_SECRET", "")
+    # Configuración del pool de cifrado de contraseñas
+    CRYPTO_WORKERS: int
+    CRYPTO_QUEUE: int
+    CRYPTO_MODE: str
+    CRYPTO_TIMEOUT: float
 
-        # Configuración del logger
-        self.LOG_FILE: str = os.getenv("LOG_FILE", "omniguard.log")
-        self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    # Configuración del filtro de nombres de usuario
+    USER_FILTER_REBUILD: int
+    USER_FILTER_ERROR_RATE: float
+
+    # Configuración de la cache de usuarios
+    USER_CACHE_SIZE: int
+    USER_CACHE_TTL: float
+    USER_CHANNEL_FILE: str
+    USER_CHANNEL_SLOTS: int
+
+    # Configuración del logger
+    LOG_FILE: str
+    LOG_LEVEL: str
+    LOG_ASYNC: bool
+    LOG_QUEUE_SIZE: int
+    LOG_OVERFLOW: str
+    LOG_FORMAT: str
+    LOG_ROTATION: str
+    LOG_MAX_BYTES: int
+    LOG_BACKUP_COUNT: int
+    LOG_WHEN: str
+
+    @classmethod
+    def cargar(cls, sobrescribir: bool = False) -> "Configuracion":
+        """Lee y valida la configuración desde el .env y las variables de entorno.
+
+        Args:
+            sobrescribir (bool): Los valores del .env reemplazan a las variables
+                de entorno ya definidas (usado al recargar)
+
+        Retorna:
+            Configuracion: Instantánea inmutable de la configuración
+
+        Raises:
+            RuntimeError: Si falta el archivo .env
+        """
+        if not load_dotenv(override=sobrescribir):
+            raise RuntimeError("No se encontro un archivo .env")
+
+        return cls(
+            DB_USER=os.getenv("DB_USER", ""),
+            DB_PASSWORD=os.getenv("DB_PASSWORD", ""),
+            DB_HOST=os.getenv("DB_HOST", "localhost"),
+            DB_NAME=os.getenv("DB_NAME", "OmniGuard"),
+            DB_PORT=int(os.getenv("DB_PORT", "3306")),
+            DB_POOL_MIN=int(os.getenv("DB_POOL_MIN", "1")),
+            DB_POOL_MAX=int(os.getenv("DB_POOL_MAX", "10")),
+            DB_POOL_IDLE_TIMEOUT=float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+            DB_POOL_CHECK_AFTER=float(os.getenv("DB_POOL_CHECK_AFTER", "30")),
+            DB_POOL_TIMEOUT=float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            DB_PREPARED=_leer_bool("DB_PREPARED", "False"),
+            DB_ASYNC=_leer_bool("DB_ASYNC", "False"),
+            DB_ASYNC_POOL_MAX=int(os.getenv("DB_ASYNC_POOL_MAX", "50")),
+            APP_KEY=os.getenv("APP_KEY", ""),
+            APP_PREVIOUS_KEYS=os.getenv("APP_PREVIOUS_KEYS", ""),
+            APP_HOST=os.getenv("APP_HOST", "localhost"),
+            APP_PORT=int(os.getenv("APP_PORT", "5000")),
+            APP_DEBUG=_leer_bool("APP_DEBUG", "False"),
+            APP_SECRET=os.getenv("APP_SECRET", ""),
+            APP_SERVER=os.getenv("APP_SERVER", "dev"),
+            APP_WORKERS=int(os.getenv("APP_WORKERS", str(os.cpu_count() or 1))),
+            APP_THREADS=int(os.getenv("APP_THREADS", "4")),
+            RATELIMIT_STORAGE_URI=os.getenv("RATELIMIT_STORAGE_URI", ""),
+            RATELIMIT_MAX_KEYS=int(os.getenv("RATELIMIT_MAX_KEYS", "100000")),
+            RATELIMIT_DEFAULT=os.getenv("RATELIMIT_DEFAULT", "200 per day;50 per hour"),
+            RATELIMIT_AUTH=os.getenv("RATELIMIT_AUTH", "60 per minute"),
+            RATELIMIT_LOGIN=os.getenv("RATELIMIT_LOGIN", "5 per minute"),
+            RATELIMIT_USERS=os.getenv("RATELIMIT_USERS", "600 per hour;120 per minute"),
+            LOGIN_USER_FAILURES=int(os.getenv("LOGIN_USER_FAILURES", "20")),
+            LOGIN_IP_FAILURES=int(os.getenv("LOGIN_IP_FAILURES", "5")),
+            LOGIN_WINDOW=int(os.getenv("LOGIN_WINDOW", "900")),
+            LOGIN_MAX_KEYS=int(os.getenv("LOGIN_MAX_KEYS", "100000")),
+            CRYPTO_WORKERS=int(os.getenv("CRYPTO_WORKERS", "2")),
+            CRYPTO_QUEUE=int(os.getenv("CRYPTO_QUEUE", "64")),
+            CRYPTO_MODE=os.getenv("CRYPTO_MODE", "thread"),
+            CRYPTO_TIMEOUT=float(os.getenv("CRYPTO_TIMEOUT", "10")),
+            USER_FILTER_REBUILD=int(os.getenv("USER_FILTER_REBUILD", "300")),
+            USER_FILTER_ERROR_RATE=float(os.getenv("USER_FILTER_ERROR_RATE", "0.01")),
+            USER_CACHE_SIZE=int(os.getenv("USER_CACHE_SIZE", "10000")),
+            USER_CACHE_TTL=float(os.getenv("USER_CACHE_TTL", "60")),
+            USER_CHANNEL_FILE=os.getenv("USER_CHANNEL_FILE", ""),
+            USER_CHANNEL_SLOTS=int(os.getenv("USER_CHANNEL_SLOTS", "4096")),
+            LOG_FILE=os.getenv("LOG_FILE", "omniguard.log"),
+            LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+            LOG_ASYNC=_leer_bool("LOG_ASYNC", "True"),
+            LOG_QUEUE_SIZE=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+            LOG_OVERFLOW=os.getenv("LOG_OVERFLOW", "drop-debug"),
+            LOG_FORMAT=os.getenv("LOG_FORMAT", "text"),
+            LOG_ROTATION=os.getenv("LOG_ROTATION", "none"),
+            LOG_MAX_BYTES=int(os.getenv("LOG_MAX_BYTES", "10485760")),
+            LOG_BACKUP_COUNT=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+            LOG_WHEN=os.getenv("LOG_WHEN", "midnight"),
+        )
 
     def obtener_config_bd(self) -> dict[str, str | int]:
         """Configuración para conexión a MySQL.
@@ -70,30 +205,76 @@ class Configuracion:
             "database": self.DB_NAME,
         }
 
+    def obtener_config_pool(self) -> dict[str, int | float | bool]:
+        """Configuración para el pool de conexiones a MySQL.
+
+        Un "Max" de 0 desactiva el pool y cada operación abre su propia conexión.
+        "Prepared" usa sentencias preparadas en el servidor, reutilizadas por
+        cada conexión del pool. "Async" sirve las rutas de la API con vistas
+        asíncronas sobre un pool asyncio de hasta "AsyncMax" conexiones.
+
+        Retorna:
+            dict: Parámetros del pool con estructura:
+                {
+                    "Min": int,
+                    "Max": int,
+                    "IdleTimeout": float,
+                    "CheckAfter": float,
+                    "Timeout": float,
+                    "Prepared": bool,
+                    "Async": bool,
+                    "AsyncMax": int
+                }
+
+        Ejemplo:
+            {'Min': 1, 'Max': 10, 'IdleTimeout': 300.0, ...}
+        """
+        return {
+            "Min": self.DB_POOL_MIN,
+            "Max": self.DB_POOL_MAX,
+            "IdleTimeout": self.DB_POOL_IDLE_TIMEOUT,
+            "CheckAfter": self.DB_POOL_CHECK_AFTER,
+            "Timeout": self.DB_POOL_TIMEOUT,
+            "Prepared": self.DB_PREPARED,
+            "Async": self.DB_ASYNC,
+            "AsyncMax": self.DB_ASYNC_POOL_MAX,
+        }
+
     def obtener_config_app(self) -> dict[str, bool | str | int]:
         """Configuración principal de la aplicación Flask.
 
+        "PreviousKeys" son claves Fernet anteriores separadas por comas: se
+        siguen aceptando al descifrar hasta que la rotación termine.
+
         Retorna:
             dict: Parámetros críticos para el funcionamiento:
                 {
                     "Key": str,
+                    "PreviousKeys": str,
                     "Port": int,
                     "Host": str,
                     "Debug": bool,
-                    "Secret": str
+                    "Secret": str,
+                    "Server": str,
+                    "Workers": int,
+                    "Threads": int
                 }
         Ejemplo:
             {'key': 'key', 'host': 'localhost', ...}
         """
         return {
             "Key": self.APP_KEY,
+            "PreviousKeys": self.APP_PREVIOUS_KEYS,
             "Port": self.APP_PORT,
             "Host": self.APP_HOST,
             "Debug": self.APP_DEBUG,
             "Secret": self.APP_SECRET,
+            "Server": self.APP_SERVER,
+            "Workers": self.APP_WORKERS,
+            "Threads": self.APP_THREADS,
         }
 
-    def obtener_config_log(self) -> dict[str, str]:
+    def obtener_config_log(self) -> dict[str, str | int | bool]:
         """Configuración para el sistema de registros
 
         Retorna:
@@ -101,6 +282,14 @@ class Configuracion:
                 {
                     "File": str,
                     "Level": str,
+                    "Async": bool,
+                    "QueueSize": int,
+                    "Overflow": str,
+                    "Format": str,
+                    "Rotation": str,
+                    "MaxBytes": int,
+                    "BackupCount": int,
+                    "When": str,
                 }
         Ejemplo:
             {'file': 'log.log', 'level': 'Debug', ...}
@@ -108,4 +297,180 @@ class Configuracion:
         return {
             "File": self.LOG_FILE,
             "Level": self.LOG_LEVEL,
+            "Async": self.LOG_ASYNC,
+            "QueueSize": self.LOG_QUEUE_SIZE,
+            "Overflow": self.LOG_OVERFLOW,
+            "Format": self.LOG_FORMAT,
+            "Rotation": self.LOG_ROTATION,
+            "MaxBytes": self.LOG_MAX_BYTES,
+            "BackupCount": self.LOG_BACKUP_COUNT,
+            "When": self.LOG_WHEN,
         }
+
+    def obtener_config_limites(self) -> dict[str, str | int]:
+        """Configuración del limitador de tasas
+
+        Un "StorageUri" vacío elige el almacén según el modo del servidor:
+        "omni-sqlite" compartido entre workers con APP_SERVER=prod y
+        "omni-memory" acotado en desarrollo. Las políticas son cadenas de
+        límites separados por ";" (ej. "600 per hour;120 per minute").
+
+        Retorna:
+            dict: Parámetros con estructura:
+                {
+                    "StorageUri": str,
+                    "MaxKeys": int,
+                    "Default": str,  # Rutas sin política propia
+                    "Auth": str,     # Blueprint de autenticación
+                    "Login": str,    # POST /api/login
+                    "Users": str,    # Blueprint de usuarios
+                }
+        Ejemplo:
+            {'StorageUri': 'redis://localhost:6379', 'MaxKeys': 100000,
+             'Default': '200 per day;50 per hour', 'Auth': '60 per minute',
+             'Login': '5 per minute', 'Users': '600 per hour;120 per minute'}
+        """
+        return {
+            "StorageUri": self.RATELIMIT_STORAGE_URI,
+            "MaxKeys": self.RATELIMIT_MAX_KEYS,
+            "Default": self.RATELIMIT_DEFAULT,
+            "Auth": self.RATELIMIT_AUTH,
+            "Login": self.RATELIMIT_LOGIN,
+            "Users": self.RATELIMIT_USERS,
+        }
+
+    def obtener_config_intentos(self) -> dict[str, int]:
+        """Configuración del freno de intentos fallidos de login
+
+        Retorna:
+            dict: Parámetros con estructura:
+                {
+                    "UserFailures": int,  # Fallos por usuario en la ventana
+                    "IpFailures": int,    # Fallos por IP+usuario en la ventana
+                    "Window": int,        # Segundos de la ventana deslizante
+                    "MaxKeys": int,       # Máximo de contadores en memoria
+                }
+        Ejemplo:
+            {'UserFailures': 20, 'IpFailures': 5, 'Window': 900, 'MaxKeys': 100000}
+        """
+        return {
+            "UserFailures": self.LOGIN_USER_FAILURES,
+            "IpFailures": self.LOGIN_IP_FAILURES,
+            "Window": self.LOGIN_WINDOW,
+            "MaxKeys": self.LOGIN_MAX_KEYS,
+        }
+
+    def obtener_config_cifrado(self) -> dict[str, int | float | str]:
+        """Configuración del pool que cifra y verifica contraseñas
+
+        Retorna:
+            dict: Parámetros con estructura:
+                {
+                    "Workers": int,    # Operaciones simultáneas (0: en el hilo de la petición)
+                    "Queue": int,      # Operaciones en espera antes de responder 503
+                    "Mode": str,       # "thread" o "process"
+                    "Timeout": float,  # Segundos máximos de espera por un resultado
+                }
+        Ejemplo:
+            {'Workers': 2, 'Queue': 64, 'Mode': 'thread', 'Timeout': 10.0}
+        """
+        return {
+            "Workers": self.CRYPTO_WORKERS,
+            "Queue": self.CRYPTO_QUEUE,
+            "Mode": self.CRYPTO_MODE,
+            "Timeout": self.CRYPTO_TIMEOUT,
+        }
+
+    def obtener_config_filtro(self) -> dict[str, int | float]:
+        """Configuración del filtro de nombres de usuario existentes
+
+        Retorna:
+            dict: Parámetros con estructura:
+                {
+                    "Rebuild": int,      # Segundos entre reconstrucciones (0 lo desactiva)
+                    "ErrorRate": float,  # Tasa de falsos positivos objetivo
+                }
+        Ejemplo:
+            {'Rebuild': 300, 'ErrorRate': 0.01}
+        """
+        return {
+            "Rebuild": self.USER_FILTER_REBUILD,
+            "ErrorRate": self.USER_FILTER_ERROR_RATE,
+        }
+
+    def obtener_config_cache(self) -> dict[str, str | int | float]:
+        """Configuración de la cache de usuarios del servicio
+
+        Un "ChannelFile" vacío usa un archivo por base de datos en la carpeta
+        temporal privada del usuario (0700), compartido por todos los workers
+        del servidor.
+
+        Retorna:
+            dict: Parámetros con estructura:
+                {
+                    "Size": int,          # Máximo de usuarios guardados (0 la desactiva)
+                    "Ttl": float,         # Segundos que un usuario se considera vigente
+                    "ChannelFile": str,   # Archivo de contadores de invalidación
+                    "ChannelSlots": int,  # Contadores por clave en el archivo
+                }
+        Ejemplo:
+            {'Size': 10000, 'Ttl': 60.0, 'ChannelFile': '', 'ChannelSlots': 4096}
+        """
+        return {
+            "Size": self.USER_CACHE_SIZE,
+            "Ttl": self.USER_CACHE_TTL,
+            "ChannelFile": self.USER_CHANNEL_FILE,
+            "ChannelSlots": self.USER_CHANNEL_SLOTS,
+        }
+
+
+_configuracion: Configuracion | None = None
+_candado = threading.Lock()
+
+
+def _reiniciar_en_hijo() -> None:
+    """Recrea el candado tras un fork por si el padre lo tenía tomado."""
+    global _candado
+    _candado = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
+
+
+def obtener_configuracion() -> Configuracion:
+    """Retorna la configuración del proceso, cargándola solo la primera vez.
+
+    Retorna:
+        Configuracion: Instantánea compartida por todos los módulos
+
+    Raises:
+        RuntimeError: Si falta el archivo .env
+
+    Ejemplo:
+        config_bd = obtener_configuracion().obtener_config_bd()
+    """
+    global _configuracion
+
+    if _configuracion is None:
+        with _candado:
+            if _configuracion is None:
+                _configuracion = Configuracion.cargar()
+
+    return _configuracion
+
+
+def recargar_configuracion() -> Configuracion:
+    """Vuelve a leer el .env y reemplaza la configuración compartida.
+
+    Los componentes ya creados (pool, logger) conservan la instantánea con
+    la que se construyeron; solo los que consulten después verán los cambios.
+
+    Retorna:
+        Configuracion: Nueva instantánea compartida
+    """
+    global _configuracion
+
+    with _candado:
+        _configuracion = Configuracion.cargar(sobrescribir=True)
+
+    return _configuracion
@@ -1,12 +1,537 @@
+import os
 import sys
+import time
+import weakref
+import threading
+from enum import Enum
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+
 import mysql.connector
+from flask import g
+from werkzeug.local import LocalProxy
+from mysql.connector import errorcode, errors
+from mysql.connector.constants import ClientFlag
 from mysql.connector.types import RowItemType, RowType
 
-from omni.modules.config import Configuracion
+from omni.modules.config import obtener_configuracion
 from mysql.connector.abstracts import MySQLConnectionAbstract, MySQLCursorAbstract
 
 from omni.modules.logging import Logs
 
+BANDERAS_CLIENTE: list[int] = [ClientFlag.FOUND_ROWS]
+"""Con FOUND_ROWS un UPDATE reporta las filas encontradas y no solo las
+modificadas, así que 0 significa "no existe" aunque los valores no cambien"""
+
+
+class EstadoEscritura(Enum):
+    """Resultado de una escritura sobre un registro."""
+
+    EXITO = "exito"
+    DUPLICADO = "duplicado"
+    NO_ENCONTRADO = "no_encontrado"
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoEscritura:
+    """Resultado tipado de las escrituras de BasedeDatos (una por registro).
+
+    Atributos:
+        estado (EstadoEscritura): EXITO, DUPLICADO (llave única repetida) o
+            NO_ENCONTRADO (ninguna fila cumplió las condiciones)
+        filas (int): Filas insertadas o encontradas
+        id_generado (int|None): Id AUTO_INCREMENT del registro insertado
+    """
+
+    estado: EstadoEscritura
+    filas: int = 0
+    id_generado: int | None = None
+
+    @property
+    def exito(self) -> bool:
+        """True si la escritura se aplicó."""
+        return self.estado is EstadoEscritura.EXITO
+
+
+def _lotes(elementos: Sequence, tamano: int) -> Iterator[Sequence]:
+    """Divide una secuencia en porciones consecutivas de "tamano" elementos."""
+    for inicio in range(0, len(elementos), max(1, tamano)):
+        yield elementos[inicio : inicio + tamano]
+
+
+SENTENCIAS_EN_CACHE = 256
+"""Formas de SQL distintas que se recuerdan por cada tipo de operación"""
+
+PREPARADAS_POR_CONEXION = 64
+"""Sentencias preparadas que se mantienen abiertas en cada conexión"""
+
+
+def _sql_where(
+    condiciones: tuple[str, ...],
+    prefijos: tuple[str, ...] = (),
+    orden: str | None = None,
+) -> str:
+    """Cláusula WHERE (o cadena vacía) con un marcador por columna.
+
+    Con "orden" agrega la condición del cursor keyset "orden > %s".
+    """
+    filtros = [f"`{campo}` = %s" for campo in condiciones]
+    filtros += [f"`{campo}` LIKE %s" for campo in prefijos]
+
+    if orden:
+        filtros.append(f"`{orden}` > %s")
+
+    return " WHERE " + " AND ".join(filtros) if filtros else ""
+
+
+def _valores_where(
+    condiciones: dict[str, str | int] | None = None,
+    prefijos: dict[str, str] | None = None,
+    despues_de: str | int | None = None,
+) -> list[str | int]:
+    """Parámetros de la cláusula de _sql_where(), en el mismo orden.
+
+    Args:
+        condiciones (dict|None): Igualdades "campo = valor"
+        prefijos (dict|None): Filtros "campo LIKE 'prefijo%'"
+        despues_de (str|int|None): Último valor visto del cursor keyset
+
+    Retorna:
+        list: Valores para los marcadores de la cláusula
+    """
+    valores: list[str | int] = list((condiciones or {}).values())
+
+    for prefijo in (prefijos or {}).values():
+        escapado = prefijo.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        valores.append(f"{escapado}%")
+
+    if despues_de is not None:
+        valores.append(despues_de)
+
+    return valores
+
+
+@lru_cache(maxsize=SENTENCIAS_EN_CACHE)
+def _sql_insertar(tabla: str, campos: tuple[str, ...]) -> str:
+    """INSERT de una fila con las columnas dadas."""
+    columnas = ", ".join(f"`{campo}`" for campo in campos)
+    marcadores = ", ".join(["%s"] * len(campos))
+    return f"INSERT INTO `{tabla}` ({columnas}) VALUES ({marcadores})"
+
+
+@lru_cache(maxsize=SENTENCIAS_EN_CACHE)
+def _sql_leer(
+    tabla: str,
+    campos: tuple[str, ...] | str,
+    condiciones: tuple[str, ...],
+    prefijos: tuple[str, ...],
+    orden: str | None,
+    con_cursor: bool,
+    con_limite: bool,
+) -> str:
+    """SELECT con filtros, orden, cursor keyset ("orden > %s") y LIMIT opcionales."""
+    if isinstance(campos, tuple):
+        campos = ", ".join(f"`{campo}`" for campo in campos)
+
+    clausula_where = _sql_where(condiciones, prefijos, orden if con_cursor else None)
+    consulta = f"SELECT {campos} FROM `{tabla}`{clausula_where}"
+
+    if orden:
+        consulta += f" ORDER BY `{orden}`"
+
+    if con_limite:
+        consulta += " LIMIT %s"
+
+    return consulta
+
+
+@lru_cache(maxsize=SENTENCIAS_EN_CACHE)
+def _sql_contar(
+    tabla: str, condiciones: tuple[str, ...], prefijos: tuple[str, ...]
+) -> str:
+    """SELECT COUNT(*) con filtros opcionales."""
+    return (
+        f"SELECT COUNT(*) AS `total` FROM `{tabla}`"
+        f"{_sql_where(condiciones, prefijos)}"
+    )
+
+
+@lru_cache(maxsize=SENTENCIAS_EN_CACHE)
+def _sql_actualizar(
+    tabla: str, campos: tuple[str, ...], condiciones: tuple[str, ...]
+) -> str:
+    """UPDATE de las columnas "campos" con igualdades en "condiciones"."""
+    clausula_set = ", ".join([f"`{campo}`=%s" for campo in campos])
+    clausula_where = " AND ".join([f"`{campo}`=%s" for campo in condiciones])
+    return f"UPDATE `{tabla}` SET {clausula_set} WHERE {clausula_where}"
+
+
+@lru_cache(maxsize=SENTENCIAS_EN_CACHE)
+def _sql_eliminar(tabla: str, condiciones: tuple[str, ...]) -> str:
+    """DELETE con igualdades en "condiciones"."""
+    clausula_where = " AND ".join([f"`{campo}`=%s" for campo in condiciones])
+    return f"DELETE FROM `{tabla}` WHERE {clausula_where}"
+
+
+_CONSTRUCTORES_SQL = (
+    _sql_insertar,
+    _sql_leer,
+    _sql_contar,
+    _sql_actualizar,
+    _sql_eliminar,
+)
+
+# Conexión física -> OrderedDict[texto de la sentencia, cursor preparado]
+_preparadas: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_preparadas_candado = threading.Lock()
+_preparadas_contadores = {"preparadas": 0, "reutilizadas": 0}
+
+
+def estadisticas_sentencias() -> dict[str, int | float]:
+    """Uso de la cache de SQL generado y de las sentencias preparadas.
+
+    Retorna:
+        dict: Contadores del proceso con estructura:
+            {
+                "aciertos": int,        # SQL reutilizado sin construirse
+                "fallos": int,          # SQL construido
+                "entradas": int,        # Formas de SQL guardadas
+                "tasa_aciertos": float, # aciertos / (aciertos + fallos)
+                "preparadas": int,      # Sentencias preparadas en el servidor
+                "reutilizadas": int     # Ejecuciones sin volver a prepararse
+            }
+    """
+    informes = [constructor.cache_info() for constructor in _CONSTRUCTORES_SQL]
+    aciertos = sum(informe.hits for informe in informes)
+    fallos = sum(informe.misses for informe in informes)
+
+    with _preparadas_candado:
+        contadores = dict(_preparadas_contadores)
+
+    return {
+        "aciertos": aciertos,
+        "fallos": fallos,
+        "entradas": sum(informe.currsize for informe in informes),
+        "tasa_aciertos": aciertos / (aciertos + fallos) if aciertos + fallos else 0.0,
+        **contadores,
+    }
+
+
+def _preparar_sesion(conexion: MySQLConnectionAbstract) -> None:
+    """Configura una conexión física recién creada.
+
+    Acciones:
+        - Desactiva autocommit
+        - Configura isolation level a READ COMMITTED
+    """
+    conexion.autocommit = False
+    _ = conexion.cmd_query("SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED")
+
+
+class PoolConexiones:
+    """Pool de conexiones físicas reutilizables a MySQL.
+
+    Las conexiones se crean bajo demanda hasta "maximo" y se reutilizan entre
+    operaciones, así que el handshake TCP, la autenticación y la configuración
+    de la sesión solo se pagan una vez por conexión física.
+
+    Atributos:
+        minimo (int): Conexiones que se mantienen abiertas aunque estén inactivas
+        maximo (int): Límite de conexiones físicas abiertas al mismo tiempo
+        tiempo_inactivo (float): Segundos tras los cuales se recicla una conexión inactiva
+        verificar_despues (float): Segundos de inactividad tras los cuales se hace ping al entregarla
+        tiempo_espera (float): Segundos máximos de espera por una conexión libre
+
+    Ejemplo:
+        pool = PoolConexiones(obtener_configuracion().obtener_config_bd(), maximo=5)
+        conexion = pool.obtener()
+        ...
+        pool.liberar(conexion)
+    """
+
+    def __init__(
+        self,
+        config_bd: dict[str, str | int],
+        minimo: int = 1,
+        maximo: int = 10,
+        tiempo_inactivo: float = 300.0,
+        verificar_despues: float = 30.0,
+        tiempo_espera: float = 10.0,
+    ) -> None:
+        """Crea el pool vacío; las conexiones se abren en el primer uso."""
+        if maximo < 1:
+            raise ValueError("El pool necesita al menos una conexión")
+
+        self.__logs = Logs()
+        self.__config_bd = config_bd
+        self.minimo: int = max(0, min(minimo, maximo))
+        self.maximo: int = maximo
+        self.tiempo_inactivo: float = tiempo_inactivo
+        self.verificar_despues: float = verificar_despues
+        self.tiempo_espera: float = tiempo_espera
+
+        self.__condicion = threading.Condition()
+        self.__libres: deque[tuple[MySQLConnectionAbstract, float]] = deque()
+        self.__abiertas = 0
+        self.__en_uso = 0
+        self.__esperando = 0
+        self.__creadas = 0
+        self.__recicladas = 0
+        self.__cerrado = False
+        self.__precalentado = False
+
+    def __crear_conexion(self) -> MySQLConnectionAbstract:
+        """Abre una conexión física nueva y prepara su sesión una sola vez."""
+        self.__logs.info("Pool abriendo una nueva conexion a la base de datos")
+        conexion = mysql.connector.connect(
+            **self.__config_bd, client_flags=BANDERAS_CLIENTE
+        )
+
+        if not isinstance(conexion, MySQLConnectionAbstract):
+            raise errors.InterfaceError("Tipo de conexión no soportado por el pool")
+
+        _preparar_sesion(conexion)
+        return conexion
+
+    def __cerrar_conexion(self, conexion: MySQLConnectionAbstract) -> None:
+        """Cierra una conexión física ignorando errores de red."""
+        try:
+            conexion.close()
+        except errors.Error:
+            pass
+
+    def __precalentar(self) -> None:
+        """Abre las conexiones mínimas configuradas."""
+        with self.__condicion:
+            if self.__precalentado:
+                return
+            self.__precalentado = True
+            faltantes = max(0, self.minimo - self.__abiertas)
+            self.__abiertas += faltantes
+
+        for pendientes in range(faltantes, 0, -1):
+            try:
+                conexion = self.__crear_conexion()
+            except Exception:
+                with self.__condicion:
+                    self.__abiertas -= pendientes
+                raise
+
+            with self.__condicion:
+                self.__creadas += 1
+                self.__libres.append((conexion, time.monotonic()))
+                self.__condicion.notify()
+
+    def __esta_sana(self, conexion: MySQLConnectionAbstract, inactiva: float) -> bool:
+        """Verifica la conexión antes de entregarla si estuvo inactiva un tiempo."""
+        if inactiva < self.verificar_despues:
+            return True
+
+        try:
+            return conexion.is_connected()
+        except errors.Error:
+            return False
+
+    def __reservar(self, limite: float) -> tuple[MySQLConnectionAbstract, float] | None:
+        """Reserva, bajo el candado, una conexión libre o un lugar para abrir una.
+
+        Args:
+            limite (float): Instante (time.monotonic()) en que se deja de esperar
+
+        Retorna:
+            tuple|None: La conexión libre más reciente y sus segundos de
+                inactividad (aún sin verificar), o None si se reservó un lugar
+                para abrir una conexión nueva
+
+        Raises:
+            mysql.connector.errors.PoolError: Si se agota el tiempo de espera o el pool está cerrado
+        """
+        with self.__condicion:
+            while True:
+                if self.__cerrado:
+                    raise errors.PoolError("El pool de conexiones esta cerrado")
+
+                ahora = time.monotonic()
+
+                if self.__libres:
+                    conexion, ultimo_uso = self.__libres.pop()
+                    self.__en_uso += 1
+                    return conexion, ahora - ultimo_uso
+
+                if self.__abiertas < self.maximo:
+                    self.__abiertas += 1
+                    self.__en_uso += 1
+                    return None
+
+                restante = limite - ahora
+                if restante <= 0:
+                    raise errors.PoolError(
+                        "Se agoto el tiempo de espera por una conexion del pool"
+                    )
+
+                self.__esperando += 1
+                try:
+                    self.__condicion.wait(restante)
+                finally:
+                    self.__esperando -= 1
+
+    def obtener(self) -> MySQLConnectionAbstract:
+        """Entrega una conexión lista para usarse.
+
+        Flujo:
+            1. Reutiliza la conexión libre más reciente
+            2. Recicla conexiones inactivas demasiado tiempo o que fallan el ping
+            3. Abre una conexión nueva si no se alcanzó el máximo
+            4. Espera a que se libere una conexión hasta "tiempo_espera"
+
+        Retorna:
+            MySQLConnectionAbstract: Conexión con la sesión ya configurada
+
+        Raises:
+            mysql.connector.errors.PoolError: Si se agota el tiempo de espera o el pool está cerrado
+            mysql.connector.Error: Si falla la creación de una conexión nueva
+        """
+        if not self.__precalentado:
+            self.__precalentar()
+
+        limite = time.monotonic() + self.tiempo_espera
+
+        while True:
+            candidata = self.__reservar(limite)
+            if candidata is None:
+                break
+
+            # El ping y el cierre son de red: se hacen fuera del candado
+            conexion, inactiva = candidata
+            if inactiva < self.tiempo_inactivo and self.__esta_sana(conexion, inactiva):
+                return conexion
+
+            self.__cerrar_conexion(conexion)
+            with self.__condicion:
+                self.__abiertas -= 1
+                self.__en_uso -= 1
+                self.__recicladas += 1
+                self.__condicion.notify()
+
+        # La conexión nueva se abre fuera del candado para no bloquear al resto
+        try:
+            conexion = self.__crear_conexion()
+        except Exception:
+            with self.__condicion:
+                self.__abiertas -= 1
+                self.__en_uso -= 1
+                self.__condicion.notify()
+            raise
+
+        with self.__condicion:
+            self.__creadas += 1
+
+        return conexion
+
+    def liberar(
+        self, conexion: MySQLConnectionAbstract, descartar: bool = False
+    ) -> None:
+        """Devuelve una conexión al pool.
+
+        Args:
+            conexion (MySQLConnectionAbstract): Conexión obtenida con obtener()
+            descartar (bool): Cierra la conexión en lugar de reutilizarla
+        """
+        if not descartar:
+            try:
+                # No se deja ninguna transacción abierta en una conexión compartida
+                if conexion.in_transaction:
+                    conexion.rollback()
+            except errors.Error:
+                descartar = True
+
+        with self.__condicion:
+            self.__en_uso -= 1
+            descartar = descartar or self.__cerrado
+
+            if descartar:
+                self.__abiertas -= 1
+                self.__recicladas += 1
+            else:
+                self.__libres.append((conexion, time.monotonic()))
+
+            self.__condicion.notify()
+
+        if descartar:
+            self.__cerrar_conexion(conexion)
+
+    def cerrar(self) -> None:
+        """Cierra todas las conexiones libres y rechaza nuevas solicitudes."""
+        with self.__condicion:
+            self.__cerrado = True
+            libres = [conexion for conexion, _ in self.__libres]
+            self.__libres.clear()
+            self.__abiertas -= len(libres)
+            self.__condicion.notify_all()
+
+        for conexion in libres:
+            self.__cerrar_conexion(conexion)
+
+    def estadisticas(self) -> dict[str, int]:
+        """Métricas del pool para dimensionarlo bajo carga.
+
+        Retorna:
+            dict: Contadores con estructura:
+                {
+                    "abiertas": int,
+                    "libres": int,
+                    "en_uso": int,
+                    "esperando": int,
+                    "creadas": int,
+                    "recicladas": int
+                }
+        """
+        with self.__condicion:
+            return {
+                "abiertas": self.__abiertas,
+                "libres": len(self.__libres),
+                "en_uso": self.__en_uso,
+                "esperando": self.__esperando,
+                "creadas": self.__creadas,
+                "recicladas": self.__recicladas,
+            }
+
+
+_pool: PoolConexiones | None = None
+_pool_candado = threading.Lock()
+
+
+def obtener_pool() -> PoolConexiones | None:
+    """Retorna el pool compartido del proceso, creándolo en el primer uso.
+
+    Retorna:
+        PoolConexiones | None: Pool configurado, None si DB_POOL_MAX es 0
+    """
+    global _pool
+
+    if _pool is None:
+        with _pool_candado:
+            if _pool is None:
+                config = obtener_configuracion()
+                config_pool = config.obtener_config_pool()
+
+                if int(config_pool["Max"]) <= 0:
+                    return None
+
+                _pool = PoolConexiones(
+                    config.obtener_config_bd(),
+                    minimo=int(config_pool["Min"]),
+                    maximo=int(config_pool["Max"]),
+                    tiempo_inactivo=float(config_pool["IdleTimeout"]),
+                    verificar_despues=float(config_pool["CheckAfter"]),
+                    tiempo_espera=float(config_pool["Timeout"]),
+                )
+
+    return _pool
+
 
 class BasedeDatos:
     """Gestor de operaciones CRUD para MySQL con manejo de transacciones.
@@ -14,10 +539,12 @@ class BasedeDatos:
     Atributos:
         __cursor (MySQLCursorAbstract): Cursor para ejecutar consultas
         __conexion (MySQLConnectionAbstract): Conexión activa a la DB
+        __pool (PoolConexiones|None): Pool del que se toman las conexiones
 
     Features:
         - Reconexión automática
-        - Transacciones ACID
+        - Conexiones reutilizadas desde un pool
+        - Transacciones ACID, de una operación o de varias con transaccion()
         - Logging integrado
 
     Ejemplo:
@@ -26,56 +553,210 @@ class BasedeDatos:
         usuarios = bd.leer("usuarios")
     """
 
-    def __init__(self) -> None:
-        """Crea un nuevo objeto de la conexión y la inica."""
+    def __init__(
+        self,
+        pool: PoolConexiones | None = None,
+        preparadas: bool | None = None,
+        salir_si_falla: bool = True,
+    ) -> None:
+        """Crea un nuevo objeto de la conexión y la inica.
+
+        Args:
+            pool (PoolConexiones|None): Pool a utilizar. Por defecto el pool compartido
+                del proceso, o conexiones directas si el pool está desactivado.
+            preparadas (bool|None): Usa sentencias preparadas en el servidor
+                (default: DB_PREPARED). Solo aplica con pool, donde las
+                conexiones, y sus sentencias, se reutilizan.
+            salir_si_falla (bool): Termina el proceso si no se puede conectar;
+                False propaga el mysql.connector.Error (hilos de fondo)
+        """
         self.__logs = Logs()
         self.__cursor: MySQLCursorAbstract | None = None
+        self.__resultado: MySQLCursorAbstract | None = None
         self.__conexion: MySQLConnectionAbstract | None = None
-        self.__config: dict[str, str | int] = Configuracion().obtener_config_bd()
+        self.__config: dict[str, str | int] = (
+            obtener_configuracion().obtener_config_bd()
+        )
+        self.__pool: PoolConexiones | None = pool if pool else obtener_pool()
+        self.__en_transaccion: bool = False
+        self.__salir_si_falla: bool = salir_si_falla
+        self.__preparadas: bool = self.__pool is not None and (
+            bool(obtener_configuracion().obtener_config_pool()["Prepared"])
+            if preparadas is None
+            else preparadas
+        )
 
     def conectar(self) -> None:
         """Establece conexión con la base de datos.
 
         Acciones:
-            - Crea nueva conexión usando parámetros de Configuracion
+            - Toma una conexión del pool, o crea una nueva si no hay pool
             - Configura isolation level a READ COMMITTED
             - Habilita cursor con retorno de diccionarios
 
         Raises:
-            mysql.connector.Error: Error de conexión
+            mysql.connector.Error: Error de conexión (solo con salir_si_falla=False;
+                si no, termina el proceso)
+            mysql.connector.errors.PoolError: Pool agotado
             RuntimeError: Configuración faltante
         """
         try:
+            if self.__pool:
+                self.__conexion = self.__pool.obtener()
+                self.__cursor = self.__conexion.cursor(dictionary=True)
+                self.__logs.debug("Se obtuvo una conexion del pool")
+                return
+
             self.__logs.info("Intentando conectarse a la base de datos")
-            conexion = mysql.connector.connect(**self.__config)
+            conexion = mysql.connector.connect(
+                **self.__config, client_flags=BANDERAS_CLIENTE
+            )
             if isinstance(conexion, MySQLConnectionAbstract):
                 self.__conexion = conexion
                 self.__cursor = self.__conexion.cursor(dictionary=True)
-                self.__conexion.autocommit = False
-                _ = self.__conexion.cmd_query(
-                    "SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED"
-                )
+                _preparar_sesion(self.__conexion)
                 self.__logs.info("Conexion Exitosa a la base de datos")
+        except errors.PoolError as err:
+            self.__logs.error(f"No hay conexiones disponibles en el pool: {err}")
+            raise
         except mysql.connector.Error as err:
             self.__logs.critical(f"Error al conectarse a la base de datos: {err}")
+            if not self.__salir_si_falla:
+                raise
             sys.exit(1)
 
-    def desconectar(self) -> None:
-        """Desconecta la conexión activa a la base de datos."""
+    def desconectar(self, descartar: bool = False) -> None:
+        """Desconecta la conexión activa, devolviéndola al pool si existe.
+
+        Args:
+            descartar (bool): Cierra la conexión aunque haya pool, por ejemplo
+                si quedó un resultado sin leer
+        """
         if self.__cursor:
-            self.__cursor.close()
+            try:
+                self.__cursor.close()
+            except errors.Error:
+                descartar = True
             self.__cursor = None
+        self.__resultado = None
 
         if self.__conexion:
+            if self.__pool:
+                self.__pool.liberar(self.__conexion, descartar)
+                self.__conexion = None
+                self.__logs.debug("Se devolvio la conexion al pool")
+                return
+
             self.__conexion.close()
             self.__conexion = None
 
         self.__logs.info("Desconexion exitosa.")
 
+    @contextmanager
+    def transaccion(self) -> Iterator["BasedeDatos"]:
+        """Ejecuta varias operaciones en una sola conexión y una sola transacción.
+
+        Dentro del bloque, crear/leer/actualizar/eliminar (y sus versiones
+        masivas) no confirman ni devuelven la conexión: el COMMIT se hace al
+        salir del bloque y cualquier excepción revierte todo. Un bloque
+        anidado se une a la transacción externa.
+
+        Retorna:
+            BasedeDatos: Este mismo manejador
+
+        Raises:
+            mysql.connector.Error: Error de conexión o del COMMIT
+
+        Ejemplo:
+            with bd.transaccion() as tx:
+                if tx.contar("usuario", {"id": 5}):
+                    tx.eliminar("usuario", {"id": 5})
+        """
+        if self.__en_transaccion:
+            yield self
+            return
+
+        if not self.__conexion:
+            self.conectar()
+
+        self.__en_transaccion = True
+        try:
+            yield self
+            self.__en_transaccion = False
+            self.confirmar()
+        except BaseException:
+            self.__en_transaccion = False
+            self.revertir()
+            raise
+        finally:
+            self.__en_transaccion = False
+            self.desconectar()
+
+    def __confirmar(self) -> None:
+        """Confirma una operación, salvo dentro de transaccion()."""
+        if not self.__en_transaccion:
+            self.confirmar()
+
+    def __revertir(self) -> None:
+        """Revierte una operación fallida, salvo dentro de transaccion().
+
+        Dentro de una transacción el error se propaga y el bloque revierte
+        todo; un error de llave duplicada solo deshace su propia sentencia.
+        """
+        if not self.__en_transaccion:
+            self.revertir()
+
+    def __liberar(self, descartar: bool = False) -> None:
+        """Desconecta al terminar una operación, salvo dentro de transaccion().
+
+        Args:
+            descartar (bool): Quedaron filas sin leer en el cursor
+        """
+        if not self.__en_transaccion:
+            self.desconectar(descartar)
+        elif descartar and self.__resultado:
+            # La conexión sigue en uso: se leen las filas pendientes
+            self.__resultado.fetchall()
+
+    def __cursor_preparado(
+        self, conexion: MySQLConnectionAbstract, consulta: str
+    ) -> MySQLCursorAbstract:
+        """Cursor preparado de la conexión para la consulta, creado en el primer uso.
+
+        Cada cursor preparado guarda una sola sentencia en el servidor, así
+        que se mantiene uno por forma de SQL y por conexión física (LRU de
+        PREPARADAS_POR_CONEXION); sobreviven a las devoluciones al pool.
+        """
+        with _preparadas_candado:
+            cursores = _preparadas.setdefault(conexion, OrderedDict())
+            cursor = cursores.get(consulta)
+
+            if cursor is not None:
+                cursores.move_to_end(consulta)
+                _preparadas_contadores["reutilizadas"] += 1
+                return cursor
+
+            cursor = conexion.cursor(prepared=True, dictionary=True)
+            cursores[consulta] = cursor
+            _preparadas_contadores["preparadas"] += 1
+
+            viejo = None
+            if len(cursores) > PREPARADAS_POR_CONEXION:
+                _, viejo = cursores.popitem(last=False)
+
+        if viejo is not None:
+            try:
+                viejo.close()
+            except errors.Error:
+                pass
+
+        return cursor
+
     def __ejecutar_consulta(
         self,
         consulta: str,
-        parametros: list[str] | None = None,
+        parametros: list[str | int] | None = None,
+        preparar: bool = False,
     ) -> None:
         """Ejecuta una consulta SQL genérica
 
@@ -83,7 +764,9 @@ class BasedeDatos:
 
         Args:
             consulta (str): Consulta SQL a ejecutar
-            parametros (list[str]|None): Parámetros para la consulta (opcional)
+            parametros (list[str|int]|None): Parámetros para la consulta (opcional)
+            preparar (bool): Permite usar una sentencia preparada (forma de SQL
+                fija, de los constructores en cache)
 
         Raises:
             mysql.connector.Error: Si ocurre un error en la ejecución
@@ -94,21 +777,71 @@ class BasedeDatos:
 
         try:
             if self.__cursor and self.__conexion:
+                cursor = (
+                    self.__cursor_preparado(self.__conexion, consulta)
+                    if preparar and self.__preparadas and parametros
+                    else self.__cursor
+                )
+                self.__resultado = cursor
+
                 if parametros:
-                    self.__cursor.execute(consulta, parametros)
+                    cursor.execute(consulta, parametros)
                 else:
-                    self.__cursor.execute(consulta)
+                    cursor.execute(consulta)
         except mysql.connector.Error as err:
             self.__logs.error(f"Error ejecutando consulta: {err}")
             raise
 
-    def crear(self, tabla: str, datos: dict[str, str]) -> None:
+    def __escribir(
+        self, consulta: str, valores: list[str | int], tabla: str, operacion: str
+    ) -> ResultadoEscritura:
+        """Ejecuta y confirma una escritura en un solo viaje a la base de datos.
+
+        Una llave única repetida (error 1062) se reporta como DUPLICADO en vez
+        de excepción, y 0 filas encontradas como NO_ENCONTRADO.
+
+        Raises:
+            mysql.connector.Error: Cualquier otro error de la consulta
+        """
+        try:
+            self.__ejecutar_consulta(consulta, valores, preparar=True)
+            self.__confirmar()
+
+            filas = self.__resultado.rowcount if self.__resultado else 0
+            id_generado = self.__resultado.lastrowid if self.__resultado else None
+            self.__logs.info(f"Operación de {operacion} exitosa", tabla=tabla)
+
+            return ResultadoEscritura(
+                EstadoEscritura.EXITO if filas > 0 else EstadoEscritura.NO_ENCONTRADO,
+                filas,
+                id_generado or None,
+            )
+        except errors.IntegrityError as err:
+            self.__revertir()
+            if err.errno != errorcode.ER_DUP_ENTRY:
+                self.__logs.info(f"Operación de {operacion} fallo", error=str(err))
+                raise
+
+            self.__logs.warning("Llave única duplicada", tabla=tabla)
+            return ResultadoEscritura(EstadoEscritura.DUPLICADO)
+        except Exception as err:
+            self.__revertir()
+            self.__logs.info(f"Operación de {operacion} fallo", error=str(err))
+            raise err
+        finally:
+            self.__liberar()
+
+    def crear(self, tabla: str, datos: dict[str, str]) -> ResultadoEscritura:
         """Inserta un nuevo registro en la tabla especificada.
 
         Args:
             tabla (str): Nombre de la tabla
             datos (dict): Pares campo-valor para la inserción
 
+        Returns:
+            ResultadoEscritura: EXITO con el id generado, o DUPLICADO si viola
+                una llave única
+
         Ejemplo:
             crear("usuarios", {"nombre": "Ana", "password": "***"})
 
@@ -116,70 +849,272 @@ class BasedeDatos:
             mysql.connector.Error: Error de sintaxis SQL
             KeyError: Campos inválidos
         """
-        valores = list(datos.values())
-        campos = ", ".join(datos.keys())
-        marcadores = ", ".join(["%s"] * len(datos))
+        consulta = _sql_insertar(tabla, tuple(datos))
+
+        return self.__escribir(consulta, list(datos.values()), tabla, "creación")
+
+    def crear_muchos(
+        self,
+        tabla: str,
+        registros: list[dict[str, str]],
+        llave: str,
+        columna_id: str = "id",
+        tamano_lote: int = 500,
+    ) -> list[ResultadoEscritura]:
+        """Inserta varios registros con un INSERT de varias filas por lote.
+
+        Cada lote cuesta dos viajes a la base de datos: el INSERT, que ignora
+        las filas cuya llave única ya existe, y un SELECT que recupera los ids
+        de las filas insertadas. InnoDB reserva para un INSERT de n filas un
+        bloque de n ids a partir del primero generado, así que solo las filas
+        con id dentro de ese bloque son de esta sentencia; una llave que otra
+        transacción insertó a la vez queda fuera y se reporta DUPLICADO. Las
+        filas afectadas no sirven para distinguirlas: con FOUND_ROWS un
+        duplicado también cuenta como afectado. Todo el llamado es una sola
+        transacción.
+
+        Args:
+            tabla (str): Nombre de la tabla
+            registros (list[dict]): Registros con las mismas columnas
+            llave (str): Columna con llave única que identifica cada registro
+            columna_id (str): Columna AUTO_INCREMENT de la tabla
+            tamano_lote (int): Filas por sentencia INSERT
+
+        Returns:
+            list[ResultadoEscritura]: Un resultado por registro, en el mismo
+                orden: EXITO con el id generado o DUPLICADO
+
+        Raises:
+            ValueError: Si los registros no tienen las mismas columnas
+            mysql.connector.Error: Cualquier error que no sea una llave
+                duplicada; la transacción completa se revierte
+
+        Ejemplo:
+            bd.crear_muchos("usuario", [{"nombre": "ana", "password": "***"}], "nombre")
+        """
+        if not registros:
+            return []
 
-        consulta = f"INSERT INTO `{tabla}` ({campos}) VALUES ({marcadores})"
+        columnas = list(registros[0].keys())
+        if any(list(registro.keys()) != columnas for registro in registros):
+            raise ValueError("Todos los registros deben tener las mismas columnas")
+
+        resultados = [ResultadoEscritura(EstadoEscritura.DUPLICADO)] * len(registros)
+        vistos: set[str] = set()
+        pendientes: list[int] = []
+
+        # Una llave repetida dentro del mismo llamado no se envía
+        for posicion, registro in enumerate(registros):
+            if registro[llave] not in vistos:
+                vistos.add(registro[llave])
+                pendientes.append(posicion)
+
+        campos = ", ".join(f"`{campo}`" for campo in columnas)
+        fila = "(" + ", ".join(["%s"] * len(columnas)) + ")"
 
         try:
-            self.__ejecutar_consulta(consulta, valores)
-            self.confirmar()
+            with self.transaccion():
+                for lote in _lotes(pendientes, tamano_lote):
+                    valores = [registros[i][campo] for i in lote for campo in columnas]
+                    self.__ejecutar_consulta(
+                        f"INSERT INTO `{tabla}` ({campos}) VALUES "
+                        + ", ".join([fila] * len(lote))
+                        + f" ON DUPLICATE KEY UPDATE `{llave}` = `{llave}`",
+                        valores,
+                    )
+
+                    primero = self.__resultado.lastrowid if self.__resultado else None
+                    if not primero:
+                        continue
+
+                    llaves = [registros[i][llave] for i in lote]
+                    self.__ejecutar_consulta(
+                        f"SELECT `{columna_id}`, `{llave}` FROM `{tabla}` "
+                        f"WHERE `{llave}` IN ({', '.join(['%s'] * len(lote))}) "
+                        f"AND `{columna_id}` >= %s AND `{columna_id}` < %s",
+                        llaves + [primero, primero + len(lote)],
+                    )
+                    ids = {
+                        fila_bd[llave]: int(str(fila_bd[columna_id]))
+                        for fila_bd in (
+                            self.__resultado.fetchall() if self.__resultado else []
+                        )
+                        if isinstance(fila_bd, dict)
+                    }
+
+                    for posicion in lote:
+                        id_generado = ids.get(registros[posicion][llave])
+                        if id_generado is not None:
+                            resultados[posicion] = ResultadoEscritura(
+                                EstadoEscritura.EXITO, 1, id_generado
+                            )
 
-            self.__logs.info("Registro fue creado", tabla=tabla)
         except Exception as err:
-            self.revertir()
-            self.__logs.info("Operación de creación fallo", error=str(err))
-            raise err
-        finally:
-            self.desconectar()
+            self.__logs.info("Operación de creación masiva fallo", error=str(err))
+            raise
+
+        self.__logs.info(
+            "Operación de creación masiva exitosa",
+            tabla=tabla,
+            total=len(registros),
+        )
+        return resultados
 
     def leer(
         self,
         tabla: str,
-        condiciones: dict[str, str] | None = None,
+        condiciones: dict[str, str | int] | None = None,
         campos: list[str] | str = "*",
+        prefijos: dict[str, str] | None = None,
+        orden: str | None = None,
+        despues_de: str | int | None = None,
+        limite: int | None = None,
     ) -> list[RowType | dict[str, RowItemType]]:
         """Obtiene registros de una tabla con filtros opcionales.
 
+        Con "orden", "despues_de" y "limite" se obtiene una página por cursor
+        keyset ("WHERE orden > despues_de ORDER BY orden LIMIT limite"), cuyo
+        costo no depende de cuántas páginas se hayan recorrido antes.
+
         Args:
             tabla (str): Nombre de la tabla
             condiciones (dict): Filtros WHERE como pares clave-valor
             campos (list|str): Campos a seleccionar (default: todos)
+            prefijos (dict|None): Filtros por prefijo como pares campo-prefijo
+            orden (str|None): Campo por el cual ordenar ascendentemente
+            despues_de (str|int|None): Último valor de "orden" ya entregado
+            limite (int|None): Máximo de registros a retornar
 
         Retorna:
             list: Lista de registros como diccionarios
 
         Ejemplo:
             bd.leer("usuarios", {"id": 5}, ["nombre", "email"])
+            bd.leer("usuarios", campos=["id"], orden="id", despues_de=50, limite=25)
         """
         try:
-            if isinstance(campos, list):
-                campos = ", ".join(campos)
+            con_cursor = bool(orden) and despues_de is not None
+            consulta = _sql_leer(
+                tabla,
+                tuple(campos) if isinstance(campos, list) else campos,
+                tuple(condiciones or ()),
+                tuple(prefijos or ()),
+                orden,
+                con_cursor,
+                limite is not None,
+            )
 
-            if condiciones:
-                clausula_where = " AND ".join(
-                    [f"`{campo}` = %s" for campo in condiciones.keys()]
-                )
-                consulta = f"SELECT {campos} FROM `{tabla}` WHERE {clausula_where}"
-                valores = list(condiciones.values())
+            valores = _valores_where(
+                condiciones, prefijos, despues_de if con_cursor else None
+            )
+            if limite is not None:
+                valores.append(int(limite))
 
-                self.__ejecutar_consulta(consulta, valores)
-            else:
-                consulta = f"SELECT {campos} FROM `{tabla}`"
-                self.__ejecutar_consulta(consulta)
+            self.__ejecutar_consulta(consulta, valores, preparar=True)
 
             self.__logs.info("De leyeron los registros", tabla=tabla)
-            return self.__cursor.fetchall() if self.__cursor else []
+            return self.__resultado.fetchall() if self.__resultado else []
         finally:
-            self.desconectar()
+            self.__liberar()
+
+    def leer_flujo(
+        self,
+        tabla: str,
+        condiciones: dict[str, str | int] | None = None,
+        campos: list[str] | str = "*",
+        orden: str | None = None,
+        tamano_lote: int = 500,
+    ) -> Iterator[dict[str, RowItemType]]:
+        """Recorre los registros de una tabla sin cargarlos todos en memoria.
+
+        Usa un cursor sin buffer: las filas se leen del servidor por lotes de
+        "tamano_lote" mientras se consumen, así que la memoria usada no crece
+        con el tamaño de la tabla. La conexión queda ocupada hasta que el
+        generador termina o se cierra.
+
+        Args:
+            tabla (str): Nombre de la tabla
+            condiciones (dict|None): Filtros WHERE como pares clave-valor
+            campos (list|str): Campos a seleccionar (default: todos)
+            orden (str|None): Campo por el cual ordenar ascendentemente
+            tamano_lote (int): Filas pedidas al servidor en cada lectura
+
+        Retorna:
+            Iterator: Registros como diccionarios
+
+        Ejemplo:
+            for fila in bd.leer_flujo("usuarios", campos=["id"], orden="id"):
+                ...
+        """
+        consulta = _sql_leer(
+            tabla,
+            tuple(campos) if isinstance(campos, list) else campos,
+            tuple(condiciones or ()),
+            (),
+            orden,
+            False,
+            False,
+        )
+        valores = _valores_where(condiciones)
+        completado = False
+
+        try:
+            self.__ejecutar_consulta(consulta, valores)
+
+            while self.__resultado:
+                filas = self.__resultado.fetchmany(tamano_lote)
+                if not filas:
+                    break
+
+                for fila in filas:
+                    if isinstance(fila, dict):
+                        yield fila
+
+            completado = True
+            self.__logs.info("Se leyeron los registros en flujo", tabla=tabla)
+        finally:
+            # Si el consumidor se detuvo antes, la conexión tiene filas sin leer
+            self.__liberar(descartar=not completado)
+
+    def contar(
+        self,
+        tabla: str,
+        condiciones: dict[str, str | int] | None = None,
+        prefijos: dict[str, str] | None = None,
+    ) -> int:
+        """Cuenta los registros de una tabla con filtros opcionales.
+
+        Args:
+            tabla (str): Nombre de la tabla
+            condiciones (dict|None): Filtros WHERE como pares clave-valor
+            prefijos (dict|None): Filtros por prefijo como pares campo-prefijo
+
+        Retorna:
+            int: Número de registros que cumplen los filtros
+
+        Ejemplo:
+            total = bd.contar("usuarios", prefijos={"nombre": "an"})
+        """
+        try:
+            consulta = _sql_contar(
+                tabla, tuple(condiciones or ()), tuple(prefijos or ())
+            )
+            valores = _valores_where(condiciones, prefijos)
+
+            self.__ejecutar_consulta(consulta, valores, preparar=True)
+
+            filas = self.__resultado.fetchall() if self.__resultado else []
+            fila = filas[0] if filas else None
+            return int(str(fila["total"])) if isinstance(fila, dict) else 0
+        finally:
+            self.__liberar()
 
     def actualizar(
         self,
         tabla: str,
         datos: dict[str, str],
-        condiciones: dict[str, str],
-    ) -> int:
+        condiciones: dict[str, str | int],
+    ) -> ResultadoEscritura:
         """Actualiza registros en la base de datos
 
         Modifica campos específicos de registros que cumplan con las condiciones.
@@ -187,44 +1122,32 @@ class BasedeDatos:
         Args:
             tabla (str): Nombre de la tabla objetivo
             datos (dict[str, str]): Campos y valores a actualizar
-            condiciones (dict[str, str]): Condiciones para filtrar registros
+            condiciones (dict[str, str|int]): Condiciones para filtrar registros
 
         Returns:
-            int: Número de filas afectadas. 0 si no hay cambios.
+            ResultadoEscritura: EXITO con las filas encontradas (aunque sus
+                valores no cambien), NO_ENCONTRADO si ninguna cumple las
+                condiciones, o DUPLICADO si viola una llave única
 
         Raises:
             mysql.connector.Error: Si la consulta es inválida
 
         Ejemplo:
-            filas_afectadas = bd.actualizar("usuarios", {"rol": "admin"}, {"id": 5})
+            resultado = bd.actualizar("usuarios", {"rol": "admin"}, {"id": 5})
         """
-        clausula_set = ", ".join([f"`{campo}`=%s" for campo in datos.keys()])
-        clausula_where = " AND ".join([f"`{campo}`=%s" for campo in condiciones.keys()])
-
+        consulta = _sql_actualizar(tabla, tuple(datos), tuple(condiciones))
         valores = list(datos.values()) + list(condiciones.values())
-        consulta = f"UPDATE `{tabla}` SET {clausula_set} WHERE {clausula_where}"
-
-        try:
-            self.__ejecutar_consulta(consulta, valores)
-            self.confirmar()
 
-            self.__logs.info("Se actualizaron registros", tabla=tabla)
-            return self.__cursor.rowcount if self.__cursor else 0
-        except Exception as err:
-            self.revertir()
-            self.__logs.info("Operación de actualización fallo", error=str(err))
-            raise err
-        finally:
-            self.desconectar()
+        return self.__escribir(consulta, valores, tabla, "actualización")
 
-    def eliminar(self, tabla: str, condiciones: dict[str, str]) -> int:
+    def eliminar(self, tabla: str, condiciones: dict[str, str | int]) -> int:
         """Elimina registros de la base de datos
 
         Borra permanentemente registros que cumplan con las condiciones especificadas.
 
         Args:
             tabla (str): Nombre de la tabla objetivo
-            condiciones (dict[str, str]): Condiciones para filtrar registros
+            condiciones (dict[str, str|int]): Condiciones para filtrar registros
 
         Returns:
             int: Número de filas eliminadas. 0 si no hay coincidencias.
@@ -235,23 +1158,163 @@ class BasedeDatos:
         Ejemplo:
             filas_eliminadas = bd.eliminar("logs", {"fecha": "2022-01-01"})
         """
-        clausula_where = " AND ".join([f"`{campo}`=%s" for campo in condiciones.keys()])
-
-        consulta = f"DELETE FROM `{tabla}` WHERE {clausula_where}"
+        consulta = _sql_eliminar(tabla, tuple(condiciones))
         valores = list(condiciones.values())
 
         try:
-            self.__ejecutar_consulta(consulta, valores)
-            self.confirmar()
+            self.__ejecutar_consulta(consulta, valores, preparar=True)
+            self.__confirmar()
 
             self.__logs.info("Se eliminaron registros", tabla=tabla)
-            return self.__cursor.rowcount if self.__cursor else 0
+            return self.__resultado.rowcount if self.__resultado else 0
         except Exception as err:
-            self.revertir()
+            self.__revertir()
             self.__logs.info("Operación de eliminación fallo", error=str(err))
             raise err
         finally:
-            self.desconectar()
+            self.__liberar()
+
+    def actualizar_muchos(
+        self,
+        tabla: str,
+        cambios: list[tuple[dict[str, str], dict[str, str | int]]],
+    ) -> list[ResultadoEscritura]:
+        """Aplica varios UPDATE en una sola conexión y una sola transacción.
+
+        Cada cambio es una sentencia, porque su resultado se reporta por
+        separado, pero no paga una conexión ni un COMMIT propios. Una llave
+        única repetida solo revierte su propia sentencia (InnoDB), así que se
+        reporta como DUPLICADO y los demás cambios continúan.
+
+        Args:
+            tabla (str): Nombre de la tabla
+            cambios (list[tuple]): Pares (datos, condiciones) como en actualizar()
+
+        Returns:
+            list[ResultadoEscritura]: Un resultado por cambio, en el mismo orden
+
+        Raises:
+            mysql.connector.Error: Cualquier otro error; la transacción
+                completa se revierte
+
+        Ejemplo:
+            bd.actualizar_muchos("usuario", [({"password": "***"}, {"nombre": "ana"})])
+        """
+        resultados: list[ResultadoEscritura] = []
+
+        try:
+            with self.transaccion():
+                for datos, condiciones in cambios:
+                    consulta = _sql_actualizar(tabla, tuple(datos), tuple(condiciones))
+
+                    try:
+                        self.__ejecutar_consulta(
+                            consulta,
+                            list(datos.values()) + list(condiciones.values()),
+                            preparar=True,
+                        )
+                    except errors.IntegrityError as err:
+                        if err.errno != errorcode.ER_DUP_ENTRY:
+                            raise
+                        resultados.append(ResultadoEscritura(EstadoEscritura.DUPLICADO))
+                        continue
+
+                    filas = self.__resultado.rowcount if self.__resultado else 0
+                    resultados.append(
+                        ResultadoEscritura(
+                            (
+                                EstadoEscritura.EXITO
+                                if filas > 0
+                                else EstadoEscritura.NO_ENCONTRADO
+                            ),
+                            filas,
+                        )
+                    )
+
+        except Exception as err:
+            self.__logs.info("Operación de actualización masiva fallo", error=str(err))
+            raise
+
+        self.__logs.info(
+            "Operación de actualización masiva exitosa",
+            tabla=tabla,
+            total=len(cambios),
+        )
+        return resultados
+
+    def eliminar_muchos(
+        self,
+        tabla: str,
+        columna: str,
+        valores: list[int],
+        tamano_lote: int = 500,
+    ) -> list[ResultadoEscritura]:
+        """Elimina varios registros con "DELETE ... WHERE columna IN (...)" por lote.
+
+        Cada lote bloquea primero las filas existentes (SELECT ... FOR
+        UPDATE) para reportar cuáles se eliminaron, y luego las elimina con
+        una sola sentencia. Todo el llamado es una sola transacción.
+
+        Args:
+            tabla (str): Nombre de la tabla
+            columna (str): Columna comparada por valor exacto, ej. "id"
+            valores (list[int]): Valores a eliminar
+            tamano_lote (int): Valores por sentencia DELETE
+
+        Returns:
+            list[ResultadoEscritura]: Un resultado por valor, en el mismo
+                orden: EXITO o NO_ENCONTRADO
+
+        Raises:
+            mysql.connector.Error: Si la consulta es inválida; la transacción
+                completa se revierte
+
+        Ejemplo:
+            bd.eliminar_muchos("usuario", "id", [3, 5, 8])
+        """
+        encontrados: set[int] = set()
+
+        try:
+            with self.transaccion():
+                for lote in _lotes(list(dict.fromkeys(valores)), tamano_lote):
+                    marcadores = ", ".join(["%s"] * len(lote))
+                    self.__ejecutar_consulta(
+                        f"SELECT `{columna}` FROM `{tabla}` "
+                        f"WHERE `{columna}` IN ({marcadores}) FOR UPDATE",
+                        list(lote),
+                    )
+                    existentes = [
+                        fila[columna]
+                        for fila in (
+                            self.__resultado.fetchall() if self.__resultado else []
+                        )
+                        if isinstance(fila, dict)
+                    ]
+                    if not existentes:
+                        continue
+
+                    self.__ejecutar_consulta(
+                        f"DELETE FROM `{tabla}` WHERE `{columna}` IN "
+                        f"({', '.join(['%s'] * len(existentes))})",
+                        existentes,
+                    )
+                    encontrados.update(existentes)
+
+        except Exception as err:
+            self.__logs.info("Operación de eliminación masiva fallo", error=str(err))
+            raise
+
+        self.__logs.info(
+            "Se eliminaron registros en lote", tabla=tabla, total=len(encontrados)
+        )
+        return [
+            (
+                ResultadoEscritura(EstadoEscritura.EXITO, 1)
+                if valor in encontrados
+                else ResultadoEscritura(EstadoEscritura.NO_ENCONTRADO)
+            )
+            for valor in valores
+        ]
 
     def confirmar(self) -> None:
         """Confirma la transacción actual.
@@ -280,3 +1343,53 @@ class BasedeDatos:
         if self.__conexion:
             self.__conexion.rollback()
             self.__logs.info("Se revirtio la transacción")
+
+
+def _reiniciar_en_hijo() -> None:
+    """Olvida el pool y las sentencias preparadas heredadas tras un fork.
+
+    Los sockets del padre no se pueden compartir entre procesos; cada proceso
+    hijo (worker) crea su propio pool en el primer uso.
+    """
+    global _pool, _pool_candado, _preparadas, _preparadas_candado
+    _pool = None
+    _pool_candado = threading.Lock()
+    _preparadas = weakref.WeakKeyDictionary()
+    _preparadas_candado = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
+
+
+def obtener_bd() -> BasedeDatos:
+    """Retorna el manejador de base de datos de la petición actual.
+
+    Cada petición recibe su propio BasedeDatos (guardado en flask.g) con su
+    propio cursor y conexión tomada del pool compartido, así que varios hilos
+    pueden atender peticiones al mismo tiempo sin pisarse.
+
+    Retorna:
+        BasedeDatos: Manejador ligado al contexto de la aplicación actual
+    """
+    if "bd" not in g:
+        g.bd = BasedeDatos()
+    return g.bd
+
+
+def liberar_bd(_error: BaseException | None = None) -> None:
+    """Devuelve al pool la conexión de la petición al cerrar su contexto.
+
+    Se registra con Flask.teardown_appcontext.
+    """
+    bd: BasedeDatos | None = g.pop("bd", None)
+    if bd is not None:
+        bd.desconectar()
+
+
+bd_actual: BasedeDatos = LocalProxy(obtener_bd)  # type: ignore[assignment]
+"""Proxy al BasedeDatos de la petición en curso
+
+Ejemplo de uso:
+from omni.modules.database import bd_actual
+servicio = ServicioUsuario(bd_actual)
+"""
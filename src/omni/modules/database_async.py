@@ -0,0 +1,367 @@
+import os
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Coroutine
+from typing import Any, TypeVar
+
+try:
+    import aiomysql
+    from pymysql.constants import CLIENT, ER
+    from pymysql.err import IntegrityError
+except ImportError:
+    aiomysql = None
+
+from omni.modules.config import obtener_configuracion
+from omni.modules.database import (
+    EstadoEscritura,
+    ResultadoEscritura,
+    _sql_actualizar,
+    _sql_contar,
+    _sql_eliminar,
+    _sql_insertar,
+    _sql_leer,
+    _valores_where,
+)
+from omni.modules.logging import Logs
+
+T = TypeVar("T")
+
+_bucle: asyncio.AbstractEventLoop | None = None
+_bucle_candado = threading.Lock()
+
+# Solo se usan dentro de _bucle
+_pool_async: Any = None
+_pool_candado_async: asyncio.Lock | None = None
+
+
+def _requerir_aiomysql() -> None:
+    """Raises RuntimeError si no está instalado el extra "async"."""
+    if aiomysql is None:
+        raise RuntimeError(
+            "La base de datos asincrona requiere aiomysql: pip install omni[async]"
+        )
+
+
+def obtener_bucle() -> asyncio.AbstractEventLoop:
+    """Retorna el bucle de eventos del proceso, iniciándolo en el primer uso.
+
+    Corre en un hilo daemon propio y ejecuta todas las consultas asíncronas,
+    así que las conexiones del pool viven siempre en el mismo bucle aunque
+    Flask ejecute cada vista async en un bucle temporal de su hilo.
+
+    Retorna:
+        asyncio.AbstractEventLoop: Bucle compartido por los hilos del proceso
+    """
+    global _bucle
+
+    if _bucle is None:
+        with _bucle_candado:
+            if _bucle is None:
+                bucle = asyncio.new_event_loop()
+                threading.Thread(
+                    target=bucle.run_forever, name="omni-bd-async", daemon=True
+                ).start()
+                _bucle = bucle
+
+    return _bucle
+
+
+async def en_bucle(corrutina: Coroutine[Any, Any, T]) -> T:
+    """Espera una corrutina ejecutándola en el bucle del proceso.
+
+    Desde otro bucle (el de la vista) solo se espera el resultado, así que
+    muchas peticiones comparten el pool sin ocupar una conexión por hilo.
+    """
+    bucle = obtener_bucle()
+
+    if asyncio.get_running_loop() is bucle:
+        return await corrutina
+
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(corrutina, bucle))
+
+
+async def _obtener_pool_async() -> Any:
+    """Pool aiomysql del proceso, creado en el primer uso dentro de _bucle.
+
+    Las conexiones se configuran igual que las del pool síncrono: sin
+    autocommit, con FOUND_ROWS y con aislamiento READ COMMITTED.
+    """
+    global _pool_async, _pool_candado_async
+
+    if _pool_async is None:
+        if _pool_candado_async is None:
+            _pool_candado_async = asyncio.Lock()
+
+        async with _pool_candado_async:
+            if _pool_async is None:
+                config = obtener_configuracion()
+                config_bd = config.obtener_config_bd()
+                config_pool = config.obtener_config_pool()
+                maximo = max(1, int(config_pool["AsyncMax"]))
+
+                _pool_async = await aiomysql.create_pool(
+                    host=str(config_bd["host"]),
+                    port=int(config_bd["port"]),
+                    user=str(config_bd["user"]),
+                    password=str(config_bd["password"]),
+                    db=str(config_bd["database"]),
+                    minsize=min(max(0, int(config_pool["Min"])), maximo),
+                    maxsize=maximo,
+                    pool_recycle=int(config_pool["IdleTimeout"]),
+                    autocommit=False,
+                    client_flag=CLIENT.FOUND_ROWS,
+                    init_command=(
+                        "SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED"
+                    ),
+                )
+
+    return _pool_async
+
+
+async def _tomar_conexion() -> Any:
+    """Toma una conexión del pool asíncrono (dentro de _bucle)."""
+    return await (await _obtener_pool_async()).acquire()
+
+
+async def _terminar(conexion: Any, confirmar: bool) -> None:
+    """Confirma o revierte la transacción de la conexión y la devuelve al pool.
+
+    Si el ROLLBACK falla la conexión se cierra para que el pool la descarte;
+    un error del COMMIT se propaga.
+    """
+    pool = await _obtener_pool_async()
+
+    try:
+        if confirmar:
+            await conexion.commit()
+        else:
+            await conexion.rollback()
+    except Exception:
+        conexion.close()
+        if confirmar:
+            raise
+    finally:
+        pool.release(conexion)
+
+
+class BasedeDatosAsync:
+    """Versión asíncrona de BasedeDatos sobre aiomysql.
+
+    Ofrece crear/leer/contar/actualizar/eliminar con los mismos argumentos,
+    el mismo SQL (constructores en cache de database.py) y los mismos
+    resultados que BasedeDatos. Cada operación toma una conexión del pool
+    asíncrono del proceso y la confirma y devuelve al terminar, así que una
+    sola instancia se comparte entre peticiones; transaccion() retorna un
+    manejador ligado a una conexión.
+
+    Las consultas se ejecutan en el bucle de obtener_bucle(): un worker
+    mantiene hasta DB_ASYNC_POOL_MAX consultas en curso sin un hilo por
+    consulta, y una vista puede esperar varias a la vez (asyncio.gather).
+
+    Ejemplo:
+        bd = BasedeDatosAsync()
+        usuarios, total = await asyncio.gather(
+            bd.leer("usuario", orden="id", limite=50), bd.contar("usuario")
+        )
+
+    Raises:
+        RuntimeError: Si aiomysql no está instalado (pip install omni[async])
+    """
+
+    def __init__(self, conexion: Any = None) -> None:
+        """Crea el manejador.
+
+        Args:
+            conexion (aiomysql.Connection|None): Conexión de una transacción
+                abierta; por defecto cada operación usa la suya
+        """
+        _requerir_aiomysql()
+        self.__logs = Logs()
+        self.__conexion = conexion
+
+    async def __ejecutar_en_bucle(
+        self, consulta: str, valores: list[str | int], leer: bool
+    ) -> tuple[list[dict], int, int | None]:
+        """Ejecuta la consulta dentro de _bucle; ver __ejecutar()."""
+        conexion = self.__conexion or await _tomar_conexion()
+        propia = self.__conexion is None
+
+        try:
+            async with conexion.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(consulta, valores or None)
+                filas = list(await cursor.fetchall()) if leer else []
+                resultado = (filas, cursor.rowcount, cursor.lastrowid)
+        except BaseException:
+            if propia:
+                await _terminar(conexion, confirmar=False)
+            raise
+
+        if propia:
+            await _terminar(conexion, confirmar=True)
+
+        return resultado
+
+    async def __ejecutar(
+        self, consulta: str, valores: list[str | int], leer: bool = False
+    ) -> tuple[list[dict], int, int | None]:
+        """Ejecuta una consulta y la confirma, salvo dentro de transaccion().
+
+        Retorna:
+            tuple: Filas leídas (si "leer"), filas afectadas e id generado
+
+        Raises:
+            pymysql.err.Error: Si ocurre un error en la ejecución
+        """
+        try:
+            return await en_bucle(self.__ejecutar_en_bucle(consulta, valores, leer))
+        except aiomysql.Error as err:
+            self.__logs.error(f"Error ejecutando consulta: {err}")
+            raise
+
+    async def __escribir(
+        self, consulta: str, valores: list[str | int], tabla: str, operacion: str
+    ) -> ResultadoEscritura:
+        """Como BasedeDatos.__escribir(): DUPLICADO y NO_ENCONTRADO sin excepción."""
+        try:
+            _, filas, id_generado = await self.__ejecutar(consulta, valores)
+        except IntegrityError as err:
+            if err.args[0] != ER.DUP_ENTRY:
+                self.__logs.info(f"Operación de {operacion} fallo", error=str(err))
+                raise
+
+            self.__logs.warning("Llave única duplicada", tabla=tabla)
+            return ResultadoEscritura(EstadoEscritura.DUPLICADO)
+
+        self.__logs.info(f"Operación de {operacion} exitosa", tabla=tabla)
+        return ResultadoEscritura(
+            EstadoEscritura.EXITO if filas > 0 else EstadoEscritura.NO_ENCONTRADO,
+            filas,
+            id_generado or None,
+        )
+
+    @asynccontextmanager
+    async def transaccion(self) -> AsyncIterator["BasedeDatosAsync"]:
+        """Ejecuta varias operaciones en una sola conexión y una sola transacción.
+
+        El COMMIT se hace al salir del bloque y cualquier excepción revierte
+        todo. Un bloque anidado se une a la transacción externa.
+
+        Retorna:
+            BasedeDatosAsync: Manejador ligado a la conexión de la transacción
+
+        Ejemplo:
+            async with bd.transaccion() as tx:
+                if await tx.contar("usuario", {"id": 5}):
+                    await tx.eliminar("usuario", {"id": 5})
+        """
+        if self.__conexion is not None:
+            yield self
+            return
+
+        conexion = await en_bucle(_tomar_conexion())
+        try:
+            yield BasedeDatosAsync(conexion)
+        except BaseException:
+            await en_bucle(_terminar(conexion, confirmar=False))
+            raise
+
+        await en_bucle(_terminar(conexion, confirmar=True))
+
+    async def crear(self, tabla: str, datos: dict[str, str]) -> ResultadoEscritura:
+        """Inserta un registro; ver BasedeDatos.crear()."""
+        consulta = _sql_insertar(tabla, tuple(datos))
+
+        return await self.__escribir(consulta, list(datos.values()), tabla, "creación")
+
+    async def leer(
+        self,
+        tabla: str,
+        condiciones: dict[str, str | int] | None = None,
+        campos: list[str] | str = "*",
+        prefijos: dict[str, str] | None = None,
+        orden: str | None = None,
+        despues_de: str | int | None = None,
+        limite: int | None = None,
+    ) -> list[dict]:
+        """Obtiene registros con filtros opcionales; ver BasedeDatos.leer()."""
+        con_cursor = bool(orden) and despues_de is not None
+        consulta = _sql_leer(
+            tabla,
+            tuple(campos) if isinstance(campos, list) else campos,
+            tuple(condiciones or ()),
+            tuple(prefijos or ()),
+            orden,
+            con_cursor,
+            limite is not None,
+        )
+
+        valores = _valores_where(
+            condiciones, prefijos, despues_de if con_cursor else None
+        )
+        if limite is not None:
+            valores.append(int(limite))
+
+        filas, _, _ = await self.__ejecutar(consulta, valores, leer=True)
+
+        self.__logs.info("De leyeron los registros", tabla=tabla)
+        return filas
+
+    async def contar(
+        self,
+        tabla: str,
+        condiciones: dict[str, str | int] | None = None,
+        prefijos: dict[str, str] | None = None,
+    ) -> int:
+        """Cuenta registros con filtros opcionales; ver BasedeDatos.contar()."""
+        consulta = _sql_contar(tabla, tuple(condiciones or ()), tuple(prefijos or ()))
+        filas, _, _ = await self.__ejecutar(
+            consulta, _valores_where(condiciones, prefijos), leer=True
+        )
+
+        return int(str(filas[0]["total"])) if filas else 0
+
+    async def actualizar(
+        self,
+        tabla: str,
+        datos: dict[str, str],
+        condiciones: dict[str, str | int],
+    ) -> ResultadoEscritura:
+        """Actualiza registros; ver BasedeDatos.actualizar()."""
+        consulta = _sql_actualizar(tabla, tuple(datos), tuple(condiciones))
+        valores = list(datos.values()) + list(condiciones.values())
+
+        return await self.__escribir(consulta, valores, tabla, "actualización")
+
+    async def eliminar(self, tabla: str, condiciones: dict[str, str | int]) -> int:
+        """Elimina registros; ver BasedeDatos.eliminar().
+
+        Retorna:
+            int: Número de filas eliminadas. 0 si no hay coincidencias.
+        """
+        consulta = _sql_eliminar(tabla, tuple(condiciones))
+
+        try:
+            _, filas, _ = await self.__ejecutar(consulta, list(condiciones.values()))
+        except Exception as err:
+            self.__logs.info("Operación de eliminación fallo", error=str(err))
+            raise
+
+        self.__logs.info("Se eliminaron registros", tabla=tabla)
+        return filas
+
+
+def _reiniciar_en_hijo() -> None:
+    """Olvida el bucle y el pool heredados tras un fork.
+
+    El hilo del bucle no existe en el hijo; cada worker inicia su propio
+    bucle y su propio pool en el primer uso.
+    """
+    global _bucle, _bucle_candado, _pool_async, _pool_candado_async
+    _bucle = None
+    _bucle_candado = threading.Lock()
+    _pool_async = None
+    _pool_candado_async = None
+
+
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
@@ -0,0 +1,241 @@
+import os
+import sys
+import gzip
+import json
+import shutil
+import hashlib
+import tempfile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from flask import Response, current_app, request, send_from_directory, url_for
+
+DESTINO = "dist"
+"""Subcarpeta de static con los archivos con huella y el manifiesto"""
+
+MANIFIESTO = "manifest.json"
+
+COMPRIMIBLES = {".css", ".js", ".json", ".webmanifest", ".svg", ".ico", ".txt"}
+"""Extensiones que vale la pena comprimir; las imágenes ya están comprimidas"""
+
+CACHE_INMUTABLE = "public, max-age=31536000, immutable"
+
+# Codificación HTTP -> extensión de la variante, en orden de preferencia
+CODIFICACIONES = {"br": ".br", "gzip": ".gz"}
+
+# Carpeta static -> (mtime del manifiesto, manifiesto, índice por archivo con huella)
+_manifiestos: dict[str, tuple[float, dict[str, dict], dict[str, dict]]] = {}
+
+
+def _comprimir(datos: bytes, codificacion: str) -> bytes | None:
+    """Variante comprimida de los datos, o None si no se puede generar."""
+    if codificacion == "gzip":
+        return gzip.compress(datos, compresslevel=9, mtime=0)
+    if codificacion == "br" and brotli is not None:
+        return brotli.compress(datos, quality=11)
+    return None
+
+
+def construir_estaticos(origen: str) -> dict[str, dict]:
+    """Genera los archivos con huella de "origen" en origen/dist.
+
+    Cada archivo se copia como "nombre.<hash>.ext" y, si es de texto, con
+    variantes .gz y .br (con el extra "prod", que instala brotli) cuando
+    son más pequeñas. El manifiesto relaciona cada ruta original con su
+    archivo con huella y se escribe al final, de forma atómica; la
+    carpeta dist anterior se reemplaza completa.
+
+    Args:
+        origen (str): Carpeta static de la aplicación
+
+    Retorna:
+        dict: Manifiesto {ruta: {"archivo", "etag", "codificaciones"}}
+
+    Ejemplo:
+        construir_estaticos("src/omni/static")["css/style_login.css"]
+        # {'archivo': 'dist/css/style_login.3f2a9c1b7d04.css', ...}
+    """
+    destino = os.path.join(origen, DESTINO)
+    temporal = tempfile.mkdtemp(prefix=".dist-", dir=origen)
+    manifiesto: dict[str, dict] = {}
+
+    try:
+        for carpeta, subcarpetas, archivos in os.walk(origen):
+            subcarpetas[:] = sorted(
+                nombre
+                for nombre in subcarpetas
+                if os.path.join(carpeta, nombre) not in (destino, temporal)
+            )
+
+            for nombre in sorted(archivos):
+                ruta = os.path.relpath(os.path.join(carpeta, nombre), origen)
+                ruta = ruta.replace(os.sep, "/")
+                with open(os.path.join(carpeta, nombre), "rb") as archivo:
+                    datos = archivo.read()
+
+                digest = hashlib.sha256(datos).hexdigest()
+                base, extension = os.path.splitext(ruta)
+                con_huella = f"{base}.{digest[:12]}{extension}"
+
+                os.makedirs(
+                    os.path.dirname(os.path.join(temporal, con_huella)),
+                    exist_ok=True,
+                )
+                with open(os.path.join(temporal, con_huella), "wb") as archivo:
+                    archivo.write(datos)
+
+                codificaciones = []
+                if extension.lower() in COMPRIMIBLES:
+                    for codificacion, sufijo in CODIFICACIONES.items():
+                        comprimido = _comprimir(datos, codificacion)
+                        if comprimido is None or len(comprimido) >= len(datos):
+                            continue
+                        ruta_variante = os.path.join(temporal, con_huella + sufijo)
+                        with open(ruta_variante, "wb") as archivo:
+                            archivo.write(comprimido)
+                        codificaciones.append(codificacion)
+
+                manifiesto[ruta] = {
+                    "archivo": f"{DESTINO}/{con_huella}",
+                    "etag": digest[:32],
+                    "codificaciones": codificaciones,
+                }
+
+        with open(os.path.join(temporal, MANIFIESTO), "w", encoding="utf-8") as archivo:
+            json.dump(manifiesto, archivo, indent=2, sort_keys=True)
+
+        shutil.rmtree(destino, ignore_errors=True)
+        os.replace(temporal, destino)
+    except BaseException:
+        shutil.rmtree(temporal, ignore_errors=True)
+        raise
+
+    return manifiesto
+
+
+def _cargar_manifiesto(carpeta: str) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Manifiesto de la carpeta static y su índice por archivo con huella.
+
+    Se vuelve a leer solo si el archivo cambió (una nueva construcción
+    mientras el servidor corre). Sin manifiesto ambos están vacíos.
+    """
+    ruta = os.path.join(carpeta, DESTINO, MANIFIESTO)
+
+    try:
+        mtime = os.stat(ruta).st_mtime
+    except OSError:
+        return {}, {}
+
+    guardado = _manifiestos.get(carpeta)
+    if guardado is None or guardado[0] != mtime:
+        with open(ruta, encoding="utf-8") as archivo:
+            manifiesto: dict[str, dict] = json.load(archivo)
+        indice = {entrada["archivo"]: entrada for entrada in manifiesto.values()}
+        guardado = (mtime, manifiesto, indice)
+        _manifiestos[carpeta] = guardado
+
+    return guardado[1], guardado[2]
+
+
+def version_estaticos() -> float:
+    """Cambia con cada construcción de los estáticos (0.0 si no hay manifiesto).
+
+    Sirve para descartar HTML en cache que apunta a archivos con huella viejos.
+    """
+    ruta = os.path.join(str(current_app.static_folder), DESTINO, MANIFIESTO)
+
+    try:
+        return os.stat(ruta).st_mtime
+    except OSError:
+        return 0.0
+
+
+def url_estatico(ruta: str) -> str:
+    """URL de un archivo estático, con huella si ya se construyó.
+
+    Disponible en las plantillas; sin manifiesto (desarrollo) retorna la
+    URL del archivo original.
+
+    Ejemplo:
+        {{ url_estatico('css/style_login.css') }}
+        # /static/dist/css/style_login.3f2a9c1b7d04.css
+    """
+    manifiesto, _ = _cargar_manifiesto(str(current_app.static_folder))
+    entrada = manifiesto.get(ruta)
+
+    return url_for(
+        "omni.serve_static", filename=entrada["archivo"] if entrada else ruta
+    )
+
+
+def servir_estatico(ruta: str) -> Response:
+    """Respuesta para un archivo de la carpeta static.
+
+    Los archivos con huella se sirven con cache inmutable de un año, ETag
+    fuerte y, según Accept-Encoding, su variante br o gzip. Los demás se
+    revalidan en cada uso (Cache-Control: no-cache).
+
+    Args:
+        ruta (str): Ruta relativa a la carpeta static
+
+    Raises:
+        werkzeug.exceptions.NotFound: Si el archivo no existe
+    """
+    carpeta = str(current_app.static_folder)
+    _, indice = _cargar_manifiesto(carpeta)
+    entrada = indice.get(ruta)
+    mimetype = "application/javascript" if ruta.endswith(".js") else None
+
+    if entrada is None:
+        return send_from_directory(carpeta, ruta, mimetype=mimetype)
+
+    codificacion = next(
+        (
+            codificacion
+            for codificacion in CODIFICACIONES
+            if codificacion in entrada["codificaciones"]
+            and request.accept_encodings[codificacion]
+        ),
+        None,
+    )
+    etag = f"{entrada['etag']}-{codificacion}" if codificacion else entrada["etag"]
+    archivo = ruta + CODIFICACIONES[codificacion] if codificacion else ruta
+
+    respuesta = send_from_directory(
+        carpeta,
+        archivo,
+        mimetype=mimetype,
+        etag=etag,
+        download_name=os.path.basename(ruta),
+    )
+    respuesta.headers["Cache-Control"] = CACHE_INMUTABLE
+    respuesta.vary.add("Accept-Encoding")
+    if codificacion:
+        respuesta.content_encoding = codificacion
+
+    return respuesta
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Punto de entrada de omni-estaticos: construye la carpeta static/dist.
+
+    Retorna:
+        int: Código de salida
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    carpeta = (
+        argv[0]
+        if argv
+        else os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
+    )
+
+    manifiesto = construir_estaticos(carpeta)
+    print(f"{len(manifiesto)} archivos en {os.path.join(carpeta, DESTINO)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+import math
+import time
+import hashlib
+import threading
+import unicodedata
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from omni.modules.invalidacion import CanalInvalidacion
+
+
+def normalizar_nombre(nombre: str) -> str:
+    """Forma comparable de un nombre, igual o más amplia que la colación.
+
+    Quita acentos, mayúsculas y espacios finales para que dos nombres que
+    la base de datos considera iguales tengan siempre la misma forma. Si
+    junta nombres distintos solo provoca un falso positivo (una consulta de
+    más), nunca un falso negativo.
+    """
+    descompuesto = unicodedata.normalize(
+        "NFKD", str(nombre).rstrip(" ").replace("ß", "s")
+    )
+    return "".join(
+        caracter for caracter in descompuesto if not unicodedata.combining(caracter)
+    ).casefold()
+
+
+class FiltroBloom:
+    """Conjunto aproximado de cadenas en un arreglo de bits.
+
+    Responde "no está" con certeza y "puede estar" con una tasa de falsos
+    positivos cercana a "tasa_error" mientras no se superen "capacidad"
+    elementos. No admite eliminar elementos.
+
+    Atributos:
+        bits (int): Tamaño del arreglo de bits
+        funciones (int): Posiciones marcadas por elemento
+        elementos (int): Elementos agregados
+    """
+
+    def __init__(self, capacidad: int, tasa_error: float = 0.01) -> None:
+        """Crea un filtro vacío dimensionado para "capacidad" elementos."""
+        capacidad = max(1, capacidad)
+        self.bits: int = max(
+            8, math.ceil(-capacidad * math.log(tasa_error) / math.log(2) ** 2)
+        )
+        self.funciones: int = max(1, round(self.bits / capacidad * math.log(2)))
+        self.elementos: int = 0
+        self.__arreglo = bytearray((self.bits + 7) // 8)
+
+    def __posiciones(self, valor: str) -> Iterable[int]:
+        """Posiciones del valor por doble hashing sobre un solo digest."""
+        digest = hashlib.blake2b(valor.encode(), digest_size=16).digest()
+        base = int.from_bytes(digest[:8], "little")
+        paso = int.from_bytes(digest[8:], "little") | 1
+        return ((base + i * paso) % self.bits for i in range(self.funciones))
+
+    def agregar(self, valor: str) -> None:
+        """Marca el valor en el filtro."""
+        for posicion in self.__posiciones(valor):
+            self.__arreglo[posicion >> 3] |= 1 << (posicion & 7)
+        self.elementos += 1
+
+    def __contains__(self, valor: str) -> bool:
+        return all(
+            self.__arreglo[posicion >> 3] & (1 << (posicion & 7))
+            for posicion in self.__posiciones(valor)
+        )
+
+
+class FiltroNombres:
+    """Filtro de nombres de usuario existentes para evitar consultas inútiles.
+
+    Un nombre que el filtro descarta no existe en la tabla usuario y se puede
+    responder sin ir a la base de datos. Los nombres creados se agregan al
+    momento; los eliminados siguen dando "puede existir" hasta la siguiente
+    reconstrucción, que se hace cada "intervalo" segundos a partir de la
+    tabla completa. Mientras no se haya construido, todo nombre puede existir.
+
+    Con un CanalInvalidacion, cuando otro proceso crea un usuario el filtro
+    deja de descartar nombres (se consulta la base de datos) hasta que se
+    reconstruye, lo que se adelanta a una décima parte del intervalo.
+
+    Atributos:
+        intervalo (float): Segundos entre reconstrucciones
+        tasa_error (float): Tasa de falsos positivos objetivo
+        evitadas (int): Consultas respondidas sin la base de datos
+        canal (CanalInvalidacion|None): Contador de altas de otros procesos
+    """
+
+    def __init__(
+        self,
+        intervalo: float = 300,
+        tasa_error: float = 0.01,
+        canal: "CanalInvalidacion | None" = None,
+    ) -> None:
+        """Crea el filtro sin construir."""
+        self.intervalo: float = intervalo
+        self.tasa_error: float = tasa_error
+        self.canal: "CanalInvalidacion | None" = canal
+        self.evitadas: int = 0
+        self.__filtro: FiltroBloom | None = None
+        self.__altas: int = 0
+        self.__ultimo_intento: float | None = None
+        self.__pendientes: list[str] | None = None
+        self.__candado = threading.Lock()
+        self.__candado_reconstruccion = threading.Lock()
+
+    @property
+    def listo(self) -> bool:
+        """True si el filtro ya fue construido."""
+        return self.__filtro is not None
+
+    def __altas_ajenas(self) -> bool:
+        """True si otro proceso creó usuarios desde la última construcción."""
+        return self.canal is not None and self.canal.version_altas() != self.__altas
+
+    def vencido(self) -> bool:
+        """True si toca reconstruir el filtro."""
+        if self.__ultimo_intento is None:
+            return True
+
+        transcurrido = time.monotonic() - self.__ultimo_intento
+        return transcurrido >= self.intervalo or (
+            self.__altas_ajenas() and transcurrido >= self.intervalo / 10
+        )
+
+    def puede_existir(self, nombre: str) -> bool:
+        """False solo si el nombre seguro no existe."""
+        filtro = self.__filtro
+        if (
+            filtro is None
+            or self.__altas_ajenas()
+            or normalizar_nombre(nombre) in filtro
+        ):
+            return True
+
+        self.evitadas += 1
+        return False
+
+    def agregar(self, nombre: str, altas: tuple[int, int] | None = None) -> None:
+        """Agrega un nombre recién creado.
+
+        Args:
+            nombre (str): Nombre creado
+            altas (tuple[int, int]|None): Resultado de CanalInvalidacion.publicar()
+                para esta alta; si no hubo otras altas entre medio, el filtro
+                sigue descartando nombres sin reconstruirse
+        """
+        normalizado = normalizar_nombre(nombre)
+
+        with self.__candado:
+            if self.__filtro is not None:
+                self.__filtro.agregar(normalizado)
+            if self.__pendientes is not None:
+                self.__pendientes.append(normalizado)
+            if altas is not None and altas[0] == self.__altas:
+                self.__altas = altas[1]
+
+    def reconstruir_si_vencido(
+        self, cargar: Callable[[], tuple[int, Iterable[str]]]
+    ) -> bool:
+        """Reconstruye el filtro si venció y ningún otro hilo lo está haciendo.
+
+        Mientras se reconstruye, las consultas usan el filtro anterior y los
+        nombres agregados se guardan para incluirlos en el nuevo.
+
+        Args:
+            cargar (Callable): Retorna el total aproximado de nombres y un
+                iterable con todos ellos
+
+        Retorna:
+            bool: True si este llamado reconstruyó el filtro
+
+        Raises:
+            Exception: Cualquier error de "cargar"; el filtro anterior se
+                conserva y no se reintenta hasta el siguiente intervalo
+        """
+        if not self.vencido() or not self.__candado_reconstruccion.acquire(
+            blocking=False
+        ):
+            return False
+
+        try:
+            self.__ultimo_intento = time.monotonic()
+            with self.__candado:
+                self.__pendientes = []
+                altas = self.canal.version_altas() if self.canal is not None else 0
+
+            total, nombres = cargar()
+            # Deja espacio para los nombres creados antes de la siguiente reconstrucción
+            nuevo = FiltroBloom(max(1024, 2 * total), self.tasa_error)
+            for nombre in nombres:
+                nuevo.agregar(normalizar_nombre(nombre))
+
+            with self.__candado:
+                for normalizado in self.__pendientes:
+                    nuevo.agregar(normalizado)
+                self.__filtro = nuevo
+                self.__altas = altas
+
+            return True
+        finally:
+            with self.__candado:
+                self.__pendientes = None
+            self.__candado_reconstruccion.release()
+
+    def estadisticas(self) -> dict[str, int | bool]:
+        """Estado del filtro para monitoreo."""
+        filtro = self.__filtro
+        return {
+            "listo": filtro is not None,
+            "elementos": filtro.elementos if filtro else 0,
+            "bits": filtro.bits if filtro else 0,
+            "evitadas": self.evitadas,
+        }
@@ -0,0 +1,261 @@
+import os
+import time
+import threading
+from array import array
+from collections import OrderedDict
+
+from omni.modules.config import obtener_configuracion
+
+
+class VentanaDeslizante:
+    """Contadores por clave en una ventana de tiempo deslizante.
+
+    La ventana se divide en "cubetas" de igual duración y cada clave guarda
+    solo un arreglo de enteros (uno por cubeta) y el índice de la última
+    cubeta usada, así que el costo por clave es fijo. Las claves vencidas
+    se descartan al consultarlas o al registrar nuevas, y al superar
+    "max_claves" se descarta la registrada hace más tiempo (LRU).
+
+    Atributos:
+        ventana (float): Segundos que abarca la ventana
+        cubetas (int): Número de divisiones de la ventana
+        max_claves (int): Máximo de claves guardadas
+        desalojados (int): Claves descartadas por LRU antes de vencer
+    """
+
+    def __init__(
+        self, ventana: float, cubetas: int = 10, max_claves: int = 100_000
+    ) -> None:
+        """Crea la estructura vacía.
+
+        Args:
+            ventana (float): Segundos que abarca la ventana
+            cubetas (int): Número de divisiones (precisión de la ventana)
+            max_claves (int): Máximo de claves guardadas
+        """
+        self.ventana: float = float(ventana)
+        self.cubetas: int = cubetas
+        self.max_claves: int = max_claves
+        self.desalojados: int = 0
+        self.__ancho: float = self.ventana / cubetas
+        self.__claves: OrderedDict[str, tuple[int, array]] = OrderedDict()
+        self.__candado = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__claves)
+
+    def __indice(self, ahora: float | None) -> int:
+        """Índice absoluto de la cubeta que contiene "ahora"."""
+        return int((time.monotonic() if ahora is None else ahora) // self.__ancho)
+
+    def __vigente(self, clave: str, actual: int) -> array | None:
+        """Conteos de la clave con las cubetas viejas en cero, o None si venció."""
+        entrada = self.__claves.get(clave)
+        if entrada is None:
+            return None
+
+        ultimo, conteos = entrada
+        if actual - ultimo >= self.cubetas:
+            del self.__claves[clave]
+            return None
+
+        for indice in range(ultimo + 1, actual + 1):
+            conteos[indice % self.cubetas] = 0
+
+        if not any(conteos):
+            del self.__claves[clave]
+            return None
+
+        self.__claves[clave] = (actual, conteos)
+        return conteos
+
+    def registrar(self, clave: str, ahora: float | None = None) -> int:
+        """Suma un evento a la clave.
+
+        Args:
+            clave (str): Identificador del contador
+            ahora (float | None): Instante (time.monotonic()); por defecto el actual
+
+        Retorna:
+            int: Eventos de la clave dentro de la ventana, incluido este
+        """
+        actual = self.__indice(ahora)
+
+        with self.__candado:
+            conteos = self.__vigente(clave, actual)
+            if conteos is None:
+                conteos = array("I", bytes(4 * self.cubetas))
+                self.__claves[clave] = (actual, conteos)
+
+            conteos[actual % self.cubetas] += 1
+            self.__claves.move_to_end(clave)
+
+            # Las claves del frente son las registradas hace más tiempo
+            while self.__claves:
+                primera, (ultimo, _) = next(iter(self.__claves.items()))
+                if actual - ultimo >= self.cubetas:
+                    del self.__claves[primera]
+                elif len(self.__claves) > self.max_claves:
+                    del self.__claves[primera]
+                    self.desalojados += 1
+                else:
+                    break
+
+            return sum(conteos)
+
+    def contar(self, clave: str, ahora: float | None = None) -> int:
+        """Eventos de la clave dentro de la ventana."""
+        with self.__candado:
+            conteos = self.__vigente(clave, self.__indice(ahora))
+            return sum(conteos) if conteos is not None else 0
+
+    def espera(self, clave: str, limite: int, ahora: float | None = None) -> float:
+        """Segundos hasta que la clave baje de "limite" eventos.
+
+        Args:
+            clave (str): Identificador del contador
+            limite (int): Máximo de eventos permitidos en la ventana
+            ahora (float | None): Instante (time.monotonic()); por defecto el actual
+
+        Retorna:
+            float: 0 si la clave está por debajo del límite
+        """
+        momento = time.monotonic() if ahora is None else ahora
+        actual = self.__indice(momento)
+
+        with self.__candado:
+            conteos = self.__vigente(clave, actual)
+            if conteos is None:
+                return 0.0
+
+            total = sum(conteos)
+            if total < limite:
+                return 0.0
+
+            # La cubeta "indice" sale de la ventana en (indice + cubetas) * ancho
+            for indice in range(actual - self.cubetas + 1, actual + 1):
+                total -= conteos[indice % self.cubetas]
+                if total < limite:
+                    break
+
+            return max(0.0, (indice + self.cubetas) * self.__ancho - momento)
+
+    def limpiar(self, clave: str) -> None:
+        """Olvida los eventos de la clave."""
+        with self.__candado:
+            self.__claves.pop(clave, None)
+
+
+class ControlIntentos:
+    """Freno de intentos fallidos de login por usuario y por IP+usuario.
+
+    Se consulta antes de ir a la base de datos o descifrar contraseñas, así
+    que un ataque contra una cuenta se rechaza solo con memoria del proceso.
+    El límite por usuario frena ataques distribuidos entre muchas IPs; el de
+    IP+usuario, más estricto, frena a un solo cliente sin bloquear la cuenta
+    para los demás.
+
+    Atributos:
+        fallos_usuario (int): Fallos permitidos por usuario en la ventana
+        fallos_ip (int): Fallos permitidos por IP+usuario en la ventana
+    """
+
+    def __init__(
+        self,
+        fallos_usuario: int,
+        fallos_ip: int,
+        ventana: float,
+        max_claves: int = 100_000,
+    ) -> None:
+        """Crea las dos ventanas de conteo.
+
+        Args:
+            fallos_usuario (int): Fallos permitidos por usuario
+            fallos_ip (int): Fallos permitidos por IP+usuario
+            ventana (float): Segundos de la ventana deslizante
+            max_claves (int): Máximo de claves en cada ventana
+        """
+        self.fallos_usuario: int = fallos_usuario
+        self.fallos_ip: int = fallos_ip
+        self.__por_usuario = VentanaDeslizante(ventana, max_claves=max_claves)
+        self.__por_ip = VentanaDeslizante(ventana, max_claves=max_claves)
+
+    @staticmethod
+    def __claves(nombre: str, ip: str | None) -> tuple[str, str]:
+        """Claves de usuario y de IP+usuario (sin distinguir mayúsculas)."""
+        usuario = str(nombre).casefold()
+        return usuario, f"{ip or '-'}|{usuario}"
+
+    def espera(self, nombre: str, ip: str | None) -> float:
+        """Segundos que el cliente debe esperar antes de intentar de nuevo.
+
+        Args:
+            nombre (str): Nombre de usuario del intento
+            ip (str | None): Dirección del cliente
+
+        Retorna:
+            float: 0 si el intento puede continuar
+        """
+        usuario, ip_usuario = self.__claves(nombre, ip)
+        return max(
+            self.__por_ip.espera(ip_usuario, self.fallos_ip),
+            self.__por_usuario.espera(usuario, self.fallos_usuario),
+        )
+
+    def registrar_fallo(self, nombre: str, ip: str | None) -> None:
+        """Cuenta un intento fallido para el usuario y para IP+usuario."""
+        usuario, ip_usuario = self.__claves(nombre, ip)
+        self.__por_usuario.registrar(usuario)
+        self.__por_ip.registrar(ip_usuario)
+
+    def registrar_exito(self, nombre: str, ip: str | None) -> None:
+        """Reinicia el contador de IP+usuario tras un login correcto.
+
+        El contador por usuario se conserva para que un acceso legítimo no
+        reinicie un ataque distribuido en curso.
+        """
+        self.__por_ip.limpiar(self.__claves(nombre, ip)[1])
+
+    def estadisticas(self) -> dict[str, int]:
+        """Claves guardadas y desalojadas en cada ventana."""
+        return {
+            "usuarios": len(self.__por_usuario),
+            "ip_usuarios": len(self.__por_ip),
+            "desalojados": self.__por_usuario.desalojados + self.__por_ip.desalojados,
+        }
+
+
+_control_intentos: ControlIntentos | None = None
+_candado = threading.Lock()
+
+
+def obtener_control_intentos() -> ControlIntentos:
+    """Retorna el freno de intentos del proceso, creándolo en el primer uso.
+
+    Retorna:
+        ControlIntentos: Instancia compartida por los hilos del proceso
+    """
+    global _control_intentos
+
+    if _control_intentos is None:
+        with _candado:
+            if _control_intentos is None:
+                config = obtener_configuracion().obtener_config_intentos()
+                _control_intentos = ControlIntentos(
+                    fallos_usuario=config["UserFailures"],
+                    fallos_ip=config["IpFailures"],
+                    ventana=config["Window"],
+                    max_claves=config["MaxKeys"],
+                )
+
+    return _control_intentos
+
+
+def _reiniciar_en_hijo() -> None:
+    """Olvida el freno heredado tras un fork para crearlo dentro del hijo."""
+    global _control_intentos, _candado
+    _control_intentos = None
+    _candado = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
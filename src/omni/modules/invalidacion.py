@@ -0,0 +1,172 @@
+import os
+import mmap
+import fcntl
+import struct
+import hashlib
+import threading
+
+from omni.modules.archivos import abrir_privado, carpeta_privada
+from omni.modules.config import obtener_configuracion
+from omni.modules.filtro_nombres import normalizar_nombre
+
+_CONTADOR = struct.Struct("<Q")
+
+
+def claves_invalidacion(
+    id_usuario: int | None = None, nombre: str | None = None
+) -> list[str]:
+    """Claves del canal que identifican a un usuario por id y por nombre."""
+    claves = []
+    if id_usuario is not None:
+        claves.append(f"id:{id_usuario}")
+    if nombre is not None:
+        claves.append(f"nombre:{normalizar_nombre(nombre)}")
+    return claves
+
+
+class CanalInvalidacion:
+    """Contadores de versión compartidos entre los procesos de un servidor.
+
+    Un archivo mapeado en memoria guarda un contador global, uno de altas
+    (usuarios creados) y "ranuras" contadores a los que se asigna cada clave
+    por hash. Quien escribe, bajo un flock, deja el contador global impar,
+    incrementa las ranuras de las claves que cambió y lo vuelve a dejar par;
+    quien lee compara las versiones que guardó con las actuales, sin
+    llamadas al sistema, y trata un global impar como "cambiando". Dos
+    claves en la misma ranura solo provocan invalidaciones de más.
+
+    Atributos:
+        ruta (str): Archivo compartido por los procesos
+        ranuras (int): Número de contadores por clave
+    """
+
+    ENCABEZADO = 2
+    """Contadores reservados: 0 es el global y 1 el de altas"""
+
+    def __init__(self, ruta: str, ranuras: int = 4096) -> None:
+        """Abre (o crea) el archivo de contadores y lo mapea en memoria.
+
+        Args:
+            ruta (str): Archivo compartido; todos los procesos deben usar el mismo
+            ranuras (int): Número de contadores por clave
+
+        Raises:
+            OSError: Si el archivo no se puede crear o mapear, o es un enlace
+                simbólico
+            PermissionError: Si el archivo es de otro usuario o lo pueden
+                leer o escribir otros
+        """
+        self.ruta: str = ruta
+        self.ranuras: int = ranuras
+        tamano = (ranuras + self.ENCABEZADO) * _CONTADOR.size
+
+        self.__fd = abrir_privado(ruta)
+        fcntl.flock(self.__fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.__fd).st_size < tamano:
+                os.ftruncate(self.__fd, tamano)
+        finally:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+
+        self.__mapa = mmap.mmap(self.__fd, tamano)
+
+    def ranura(self, clave: str) -> int:
+        """Posición del contador asignado a la clave."""
+        digest = hashlib.blake2b(clave.encode(), digest_size=8).digest()
+        return self.ENCABEZADO + int.from_bytes(digest, "little") % self.ranuras
+
+    def version(self, ranura: int) -> int:
+        """Valor actual del contador en la posición dada."""
+        return _CONTADOR.unpack_from(self.__mapa, ranura * _CONTADOR.size)[0]
+
+    def version_global(self) -> int:
+        """Contador que cambia con cualquier publicación (impar mientras dura)."""
+        return self.version(0)
+
+    def version_altas(self) -> int:
+        """Contador que cambia cuando algún proceso crea un usuario."""
+        return self.version(1)
+
+    def __escribir(self, ranura: int, valor: int) -> None:
+        _CONTADOR.pack_into(self.__mapa, ranura * _CONTADOR.size, valor)
+
+    def __incrementar(self, ranura: int) -> None:
+        self.__escribir(ranura, self.version(ranura) + 1)
+
+    def publicar(self, claves: list[str], alta: bool = False) -> tuple[int, int]:
+        """Invalida las claves en todos los procesos.
+
+        Debe llamarse después de confirmar la escritura en la base de datos.
+
+        Args:
+            claves (list[str]): Claves modificadas (ver claves_invalidacion())
+            alta (bool): True si se creó un usuario
+
+        Retorna:
+            tuple[int, int]: Contador de altas antes y después de publicar
+        """
+        fcntl.flock(self.__fd, fcntl.LOCK_EX)
+        try:
+            # Siguiente impar, aunque un proceso haya muerto a media publicación
+            self.__escribir(0, (self.version_global() + 1) | 1)
+
+            for ranura in {self.ranura(clave) for clave in claves}:
+                self.__incrementar(ranura)
+
+            altas = self.version_altas()
+            if alta:
+                self.__incrementar(1)
+
+            self.__incrementar(0)
+            return altas, self.version_altas()
+        finally:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+
+    def cerrar(self) -> None:
+        """Libera el mapa y el descriptor del archivo."""
+        self.__mapa.close()
+        os.close(self.__fd)
+
+
+_canal: CanalInvalidacion | None = None
+_candado = threading.Lock()
+
+
+def obtener_canal_invalidacion() -> CanalInvalidacion:
+    """Retorna el canal de invalidación del proceso, abriéndolo en el primer uso.
+
+    Cada proceso abre su propio descriptor: los flock se comparten entre un
+    proceso y sus hijos si heredan el mismo. Sin USER_CHANNEL_FILE el
+    archivo va en la carpeta temporal privada del usuario (ver
+    archivos.carpeta_privada()).
+
+    Retorna:
+        CanalInvalidacion: Canal compartido por los hilos del proceso
+    """
+    global _canal
+
+    if _canal is None:
+        with _candado:
+            if _canal is None:
+                config = obtener_configuracion()
+                ruta = str(config.obtener_config_cache()["ChannelFile"])
+                if not ruta:
+                    nombre_bd = config.obtener_config_bd()["database"]
+                    ruta = os.path.join(
+                        carpeta_privada(), f"invalidacion-{nombre_bd}.bin"
+                    )
+                _canal = CanalInvalidacion(
+                    ruta, int(config.obtener_config_cache()["ChannelSlots"])
+                )
+
+    return _canal
+
+
+def _reiniciar_en_hijo() -> None:
+    """Olvida el canal heredado tras un fork para abrirlo dentro del hijo."""
+    global _canal, _candado
+    _canal = None
+    _candado = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
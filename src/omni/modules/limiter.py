@@ -1,7 +1,16 @@
-from flask import Flask
+import os
+from collections.abc import Callable
+
+from flask import Blueprint, Flask
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
+from omni.modules.archivos import carpeta_privada
+from omni.modules.config import obtener_configuracion
+
+# Registra los esquemas omni-memory:// y omni-sqlite:// en flask-limiter
+from omni.modules import almacen_limites  # noqa: F401
+
 
 class Limitador:
     """Gestor de límites de tasa para endpoints de la aplicación
@@ -14,6 +23,8 @@ class Limitador:
     Métodos Clave:
         init_app(): Vincula el limitador con la app Flask
         limit(): Aplica restricciones a rutas específicas
+        limitar(): Aplica una política de Configuracion a una ruta o blueprint
+        exentar(): Excluye una ruta o blueprint de todos los límites
 
     Attributes:
         _limiter (Limiter): Instancia del limitador de Flask
@@ -24,14 +35,36 @@ class Limitador:
 
         Configuración predeterminada:
             - Clave de identificación: Dirección IP del cliente
-            - Límites globales: 200 solicitudes/día y 50/hora
-            - Almacenamiento en memoria
+            - Límites predeterminados y almacenamiento elegidos en init_app()
+              según Configuracion
+        """
+        self._limiter: Limiter = Limiter(key_func=get_remote_address)
+
+    @staticmethod
+    def uri_almacenamiento() -> str:
+        """URI del almacenamiento de contadores según la configuración
+
+        Retorna:
+            str: RATELIMIT_STORAGE_URI si está definida (ej. "redis://host:6379");
+                si no, "omni-sqlite" en un archivo por base de datos dentro de
+                una carpeta temporal privada (0700), compartido por los
+                workers con APP_SERVER=prod, u "omni-memory" en desarrollo
+
+        Raises:
+            PermissionError: Si la carpeta temporal privada no es segura
         """
-        self._limiter: Limiter = Limiter(
-            key_func=get_remote_address,
-            default_limits=["200 per day", "50 per hour"],
-            storage_uri="memory://",
-        )
+        config = obtener_configuracion()
+        uri = str(config.obtener_config_limites()["StorageUri"])
+
+        if uri:
+            return uri
+
+        if config.obtener_config_app()["Server"] == "prod":
+            nombre_bd = config.obtener_config_bd()["database"]
+            ruta = os.path.join(carpeta_privada(), f"limites-{nombre_bd}.db")
+            return f"omni-sqlite://{ruta}"
+
+        return "omni-memory://"
 
     def init_app(self, app: Flask) -> None:
         """Vincula el limitador con la aplicación Flask
@@ -39,10 +72,26 @@ class Limitador:
         Args:
             app (Flask): Instancia de la aplicación Flask a proteger
 
+        Acciones:
+            - Configura el almacenamiento de contadores (uri_almacenamiento())
+            - Acota el número de contadores en los almacenes omni-*
+            - Usa la política "Default" para las rutas sin política propia
+
         Ejemplo:
             limitador = Limitador()
             limitador.init_app(app)
         """
+        config_limites = obtener_configuracion().obtener_config_limites()
+        app.config.setdefault("RATELIMIT_DEFAULT", config_limites["Default"])
+
+        uri = self.uri_almacenamiento()
+        app.config.setdefault("RATELIMIT_STORAGE_URI", uri)
+
+        if uri.startswith("omni-"):
+            app.config.setdefault(
+                "RATELIMIT_STORAGE_OPTIONS", {"max_claves": config_limites["MaxKeys"]}
+            )
+
         self._limiter.init_app(app)
 
     def limit(self, *args, **kwargs):
@@ -63,6 +112,57 @@ class Limitador:
         """
         return self._limiter.limit(*args, **kwargs)
 
+    @staticmethod
+    def politica(nombre: str) -> Callable[[], str]:
+        """Límites de una política de Configuracion, leídos en cada petición
+
+        Args:
+            nombre (str): Clave de obtener_config_limites() (ej. "Login")
+
+        Returns:
+            Callable[[], str]: Función que devuelve la cadena de límites
+        """
+        return lambda: str(obtener_configuracion().obtener_config_limites()[nombre])
+
+    def limitar(self, nombre: str):
+        """Aplica una política de Configuracion a una ruta o a un blueprint
+
+        Los límites de la política reemplazan a los predeterminados. En un
+        blueprint se aplican a todas sus rutas, salvo a las que tengan una
+        política propia.
+
+        Args:
+            nombre (str): Clave de obtener_config_limites() (ej. "Users")
+
+        Returns:
+            function: Decorador para rutas o blueprints
+
+        Ejemplo:
+            limiter.limitar("Users")(usuarios_bp)
+
+            @auth_bp.route("/api/login", methods=["POST"])
+            @limiter.limitar("Login")
+            def login():
+                ...
+        """
+        return self._limiter.limit(self.politica(nombre))
+
+    def exentar(self, objeto: Blueprint | Callable) -> Blueprint | Callable:
+        """Excluye una ruta o todas las rutas de un blueprint de los límites
+
+        Las rutas exentas no consultan el almacenamiento de contadores.
+
+        Args:
+            objeto (Blueprint | Callable): Blueprint o función de vista
+
+        Returns:
+            Blueprint | Callable: El mismo objeto, para usarlo como decorador
+
+        Ejemplo:
+            limiter.exentar(omni_bp)
+        """
+        return self._limiter.exempt(objeto)
+
 
 limiter = Limitador()
 """Instancia preconfigurada para uso global en la aplicación
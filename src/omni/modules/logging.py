@@ -1,13 +1,367 @@
+import os
+import copy
+import json
+import queue
+import atexit
 import logging
+import threading
 from typing import Any
-from omni.modules.config import Configuracion
+from datetime import datetime, timezone
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from omni.modules.config import obtener_configuracion
+
+NOMBRE_LOGGER = "OmniGuard"
+
+POLITICAS_DESBORDE = ("block", "drop-debug", "drop-oldest")
+"""Qué hacer cuando la cola de registros está llena"""
+
+FORMATO_TEXTO = (
+    "%(asctime)s | %(levelname)s | %(module)s:%(funcName)s:%(lineno)d = %(message)s"
+)
+
+ATRIBUTOS_REGISTRO = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "taskName"}
+"""Atributos propios de LogRecord; el resto son campos extra pasados a Logs"""
+
+_FORMATEADOR_TRAZAS = logging.Formatter()
+"""Convierte excepciones a texto antes de encolarlas (ver ManejadorCola.prepare)"""
+
+_logger: logging.Logger | None = None
+_manejador_cola: "ManejadorCola | None" = None
+_escuchador: "EscuchadorCola | None" = None
+_manejador_archivo: logging.Handler | None = None
+_candado = threading.Lock()
+
+
+def _campos_extra(record: logging.LogRecord) -> dict[str, Any]:
+    """Extrae los campos extra (kwargs de Logs) de un registro."""
+    return {
+        clave: valor
+        for clave, valor in record.__dict__.items()
+        if clave not in ATRIBUTOS_REGISTRO
+    }
+
+
+class FormateadorTexto(logging.Formatter):
+    """Formato de texto legible que agrega los campos extra como "clave=valor"."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Formatea el registro y anexa sus campos extra."""
+        texto = super().format(record)
+        extra = _campos_extra(record)
+
+        if not extra:
+            return texto
+
+        return texto + " | " + " ".join(f"{k}={v}" for k, v in extra.items())
+
+
+class FormateadorJSON(logging.Formatter):
+    """Formato JSON lines: un objeto por registro con todos sus campos extra.
+
+    Cada línea contiene "timestamp", "level", "module", "function", "line",
+    "message" y los campos pasados a Logs. Los valores no serializables se
+    convierten con str(). El codificador se crea una sola vez.
+    """
+
+    def __init__(self) -> None:
+        """Crea el formateador con un codificador JSON reutilizable."""
+        super().__init__()
+        self.__codificador = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=str
+        )
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serializa el registro como un objeto JSON en una línea."""
+        datos: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        datos.update(_campos_extra(record))
+
+        if record.exc_info:
+            datos["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Registro que pasó por ManejadorCola: la traza ya viene como texto
+            datos["exception"] = record.exc_text
+        if record.stack_info:
+            datos["stack"] = self.formatStack(record.stack_info)
+
+        return self.__codificador.encode(datos)
+
+
+def _crear_manejador_archivo(config: dict[str, str | int | bool]) -> logging.Handler:
+    """Crea el manejador de archivo con la rotación y el formato configurados.
+
+    Args:
+        config (dict): Configuración de Configuracion.obtener_config_log()
+
+    Retorna:
+        logging.Handler: FileHandler, RotatingFileHandler (rotación "size")
+            o TimedRotatingFileHandler (rotación "time")
+    """
+    archivo = str(config["File"])
+    rotacion = str(config["Rotation"])
+
+    if rotacion == "size":
+        manejador: logging.Handler = RotatingFileHandler(
+            filename=archivo,
+            maxBytes=int(config["MaxBytes"]),
+            backupCount=int(config["BackupCount"]),
+            encoding="utf-8",
+        )
+    elif rotacion == "time":
+        manejador = TimedRotatingFileHandler(
+            filename=archivo,
+            when=str(config["When"]),
+            backupCount=int(config["BackupCount"]),
+            encoding="utf-8",
+        )
+    elif rotacion == "none":
+        manejador = logging.FileHandler(filename=archivo, encoding="utf-8")
+    else:
+        raise ValueError(f"Rotacion de logs desconocida: {rotacion}")
+
+    if config["Format"] == "json":
+        manejador.setFormatter(FormateadorJSON())
+    else:
+        manejador.setFormatter(
+            FormateadorTexto(fmt=FORMATO_TEXTO, datefmt="%d/%m/%Y %H:%M:%S")
+        )
+
+    manejador.setLevel(logging.DEBUG)
+    return manejador
+
+
+class ManejadorCola(QueueHandler):
+    """Manejador que encola registros con una cola acotada.
+
+    El hilo de la petición solo encola el registro; la escritura a disco la hace
+    el hilo de EscuchadorCola. Cuando la cola está llena se aplica la política:
+        - "block": espera a que haya espacio
+        - "drop-debug": descarta registros DEBUG y espera con el resto
+        - "drop-oldest": descarta el registro más antiguo de la cola
+
+    Atributos:
+        politica (str): Política de desborde
+        descartados (int): Registros descartados por desborde
+    """
+
+    def __init__(self, cola: "queue.Queue[logging.LogRecord]", politica: str) -> None:
+        """Crea el manejador sobre una cola acotada."""
+        if politica not in POLITICAS_DESBORDE:
+            raise ValueError(f"Politica de desborde desconocida: {politica}")
+
+        super().__init__(cola)
+        self.politica: str = politica
+        self.descartados: int = 0
+        self.__candado = threading.Lock()
+
+    def __contar_descarte(self) -> None:
+        with self.__candado:
+            self.descartados += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copia el registro para la cola sin formatearlo.
+
+        El QueueHandler estándar formatea el registro y mezcla la traza en
+        "msg", así que FormateadorJSON perdería "exception" y "stack". Aquí
+        solo la excepción se convierte a texto (exc_text), porque la traza
+        retiene los frames y variables del hilo de la petición; stack_info ya
+        es texto y se conserva.
+        """
+        copia = copy.copy(record)
+
+        if copia.exc_info:
+            if not copia.exc_text:
+                copia.exc_text = _FORMATEADOR_TRAZAS.formatException(copia.exc_info)
+            copia.exc_info = None
+
+        return copia
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Encola el registro aplicando la política de desborde."""
+        cola: queue.Queue[logging.LogRecord] = self.queue  # type: ignore[assignment]
+
+        try:
+            cola.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.politica == "drop-oldest":
+            while True:
+                try:
+                    cola.get_nowait()
+                    cola.task_done()
+                    self.__contar_descarte()
+                except queue.Empty:
+                    pass
+
+                try:
+                    cola.put_nowait(record)
+                    return
+                except queue.Full:
+                    continue
+
+        if self.politica == "drop-debug" and record.levelno <= logging.DEBUG:
+            self.__contar_descarte()
+            return
+
+        cola.put(record)
+
+
+class EscuchadorCola(QueueListener):
+    """QueueListener que espera espacio para la señal de parada.
+
+    El QueueListener estándar usa put_nowait para la señal de parada, lo cual
+    falla si la cola acotada está llena justo al cerrar.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        """Encola la señal de parada esperando espacio si hace falta."""
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+def obtener_logger() -> logging.Logger:
+    """Retorna el logger del proceso, configurándolo solo la primera vez.
+
+    La configuración (nivel, formato, rotación y manejador de archivo) se aplica una
+    única vez por proceso, sin importar cuántos Logs se construyan, así que
+    cada registro se escribe una sola vez y solo hay un archivo abierto.
+
+    Con LOG_ASYNC el logger solo encola los registros (ManejadorCola) y un
+    hilo EscuchadorCola los escribe al archivo, fuera del hilo de la petición.
+
+    Retorna:
+        logging.Logger: Logger "OmniGuard" configurado
+    """
+    global _logger, _manejador_cola, _escuchador, _manejador_archivo
+
+    if _logger is None:
+        with _candado:
+            if _logger is None:
+                config = obtener_configuracion().obtener_config_log()
+                logger = logging.getLogger(NOMBRE_LOGGER)
+                logger.setLevel(str(config["Level"]))
+
+                # Manejador de Archivo
+                manejador_archivo = _crear_manejador_archivo(config)
+                _manejador_archivo = manejador_archivo
+
+                if config["Async"]:
+                    cola: queue.Queue[logging.LogRecord] = queue.Queue(
+                        maxsize=int(config["QueueSize"])
+                    )
+                    _manejador_cola = ManejadorCola(cola, str(config["Overflow"]))
+                    _escuchador = EscuchadorCola(
+                        cola, manejador_archivo, respect_handler_level=True
+                    )
+                    _escuchador.start()
+                    logger.addHandler(_manejador_cola)
+                else:
+                    logger.addHandler(manejador_archivo)
+
+                _logger = logger
+
+    return _logger
+
+
+def vaciar_logs() -> None:
+    """Espera a que se escriban todos los registros encolados."""
+    if _escuchador:
+        _escuchador.queue.join()  # type: ignore[attr-defined]
+
+    if _manejador_archivo:
+        _manejador_archivo.flush()
+
+
+def detener_logs() -> None:
+    """Escribe los registros pendientes y detiene el hilo escritor.
+
+    Los registros posteriores se escriben directamente al archivo. Se ejecuta
+    automáticamente al terminar el proceso.
+    """
+    global _escuchador, _manejador_cola
+
+    with _candado:
+        if _escuchador is None or _logger is None:
+            return
+
+        _escuchador.stop()
+        _escuchador = None
+
+        if _manejador_cola:
+            _logger.removeHandler(_manejador_cola)
+        if _manejador_archivo:
+            _logger.addHandler(_manejador_archivo)
+            _manejador_archivo.flush()
+
+
+def estadisticas_logs() -> dict[str, int]:
+    """Métricas de la cola de registros.
+
+    Retorna:
+        dict: Contadores con estructura:
+            {
+                "en_cola": int,
+                "descartados": int
+            }
+    """
+    if not _manejador_cola:
+        return {"en_cola": 0, "descartados": 0}
+
+    return {
+        "en_cola": _manejador_cola.queue.qsize(),  # type: ignore[attr-defined]
+        "descartados": _manejador_cola.descartados,
+    }
+
+
+def _reiniciar_en_hijo() -> None:
+    """Descarta el estado de logging heredado tras un fork.
+
+    El hilo escritor no sobrevive al fork y la cola pudo quedar con candados
+    tomados, así que el proceso hijo vuelve a configurar el logger en su
+    primer uso.
+    """
+    global _logger, _manejador_cola, _escuchador, _manejador_archivo, _candado
+
+    _candado = threading.Lock()
+
+    if _logger is not None:
+        for manejador in (_manejador_cola, _manejador_archivo):
+            if manejador:
+                _logger.removeHandler(manejador)
+
+    _logger = None
+    _manejador_cola = None
+    _escuchador = None
+    _manejador_archivo = None
+
+
+atexit.register(detener_logs)
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
 
 
 class Logs:
     """Sistema centralizado de logging para la aplicación.
 
-    Configura y gestiona los registros de la aplicación usando el módulo logging.
-    Crea un logger principal con manejo de archivos y formato estructurado.
+    Envoltorio ligero sobre el logger del proceso (ver obtener_logger()).
+    Construir varias instancias no agrega manejadores ni relee la configuración,
+    y el logger se resuelve al usarse, así que crear un Logs al importar un
+    módulo no abre archivos ni hilos antes de un fork.
 
     Atributos:
         logger (logging.Logger): Instancia del logger configurado.
@@ -17,26 +371,27 @@ class Logs:
         logs.info("Mensaje informativo", user_id=123)
     """
 
-    def __init__(self) -> None:
-        """Inicializa el logger con configuración desde el archivo .env."""
-        self.__config = Configuracion().obtener_config_log()
-        self.logger: logging.Logger = logging.getLogger("OmniGuard")
-        self.logger.setLevel(self.__config["Level"])
-
-        formato = logging.Formatter(
-            fmt="%(asctime)s | %(levelname)s | %(module)s:%(funcName)s:%(lineno)d = %(message)s",
-            datefmt="%d/%m/%Y %H:%M:%S",
-        )
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger compartido del proceso actual."""
+        return obtener_logger()
 
-        # Manejador de Archivo
-        manejador_archivo = logging.FileHandler(
-            filename=self.__config["File"],
-            encoding="utf-8",
-        )
-        manejador_archivo.setLevel(logging.DEBUG)
-        manejador_archivo.setFormatter(formato)
+    @staticmethod
+    def __opciones(kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Separa las opciones de logging de los campos extra.
+
+        "exc_info" y "stack_info" se pasan al logger como opciones y no como
+        campos extra. stacklevel=2 atribuye el registro (módulo, función y línea)
+        a quien llamó a Logs y no a este envoltorio.
+        """
+        opciones: dict[str, Any] = {"stacklevel": 2}
+
+        for clave in ("exc_info", "stack_info"):
+            if clave in kwargs:
+                opciones[clave] = kwargs.pop(clave)
 
-        self.logger.addHandler(manejador_archivo)
+        opciones["extra"] = kwargs
+        return opciones
 
     def debug(self, mensaje: str, **kwargs: Any) -> None:
         """Registra un mensaje de nivel DEBUG.
@@ -45,7 +400,7 @@ class Logs:
             mensaje (str): Texto descriptivo del evento
             **kwargs: Campos adicionales para el registro (ej: user_id=45)
         """
-        self.logger.debug(mensaje, extra=kwargs)
+        self.logger.debug(mensaje, **self.__opciones(kwargs))
 
     def info(self, mensaje: str, **kwargs: Any) -> None:
         """Registra un mensaje de nivel INFO.
@@ -54,7 +409,7 @@ class Logs:
             mensaje (str): Texto descriptivo del evento
             **kwargs: Campos adicionales para el registro (ej: user_id=45)
         """
-        self.logger.info(mensaje, extra=kwargs)
+        self.logger.info(mensaje, **self.__opciones(kwargs))
 
     def warning(self, mensaje: str, **kwargs: Any) -> None:
         """Registra un mensaje de nivel WARNING.
@@ -63,7 +418,7 @@ class Logs:
             mensaje (str): Texto descriptivo del evento
             **kwargs: Campos adicionales para el registro (ej: user_id=45)
         """
-        self.logger.warning(mensaje, extra=kwargs)
+        self.logger.warning(mensaje, **self.__opciones(kwargs))
 
     def error(self, mensaje: str, **kwargs: Any) -> None:
         """Registra un mensaje de nivel ERROR.
@@ -72,7 +427,7 @@ class Logs:
             mensaje (str): Texto descriptivo del evento
             **kwargs: Campos adicionales para el registro (ej: user_id=45)
         """
-        self.logger.error(mensaje, extra=kwargs)
+        self.logger.error(mensaje, **self.__opciones(kwargs))
 
     def critical(self, mensaje: str, **kwargs: Any) -> None:
         """Registra un mensaje de nivel CRITICAL.
@@ -81,7 +436,7 @@ class Logs:
             mensaje (str): Texto descriptivo del evento
             **kwargs: Campos adicionales para el registro (ej: user_id=45)
         """
-        self.logger.critical(mensaje, extra=kwargs)
+        self.logger.critical(mensaje, **self.__opciones(kwargs))
 
     def exception(self, mensaje: str, **kwargs: Any) -> None:
         """Registra un mensaje de nivel Exception.
@@ -90,4 +445,4 @@ class Logs:
             mensaje (str): Texto descriptivo del evento
             **kwargs: Campos adicionales para el registro (ej: user_id=45)
         """
-        self.logger.exception(mensaje, extra=kwargs)
+        self.logger.exception(mensaje, **self.__opciones(kwargs))
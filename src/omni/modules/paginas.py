@@ -0,0 +1,109 @@
+import re
+import hashlib
+from dataclasses import dataclass
+
+from flask import Response, current_app, render_template, request
+from markupsafe import escape
+
+from omni.modules.estaticos import version_estaticos
+
+_MARCADOR = "\x00{}\x00"
+_SEPARAR = re.compile("\x00(\\w+)\x00")
+
+CACHE_PUBLICA = "no-cache"
+CACHE_PRIVADA = "private, no-cache"
+
+
+def _etag(cuerpo: bytes) -> str:
+    """ETag fuerte del cuerpo de una página."""
+    return hashlib.blake2b(cuerpo, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class PaginaCacheada:
+    """HTML de una plantilla renderizada una vez, listo para responder.
+
+    Las variables de cada petición quedan como huecos entre los segmentos
+    ya codificados, así que armar el cuerpo es una unión de bytes con el
+    valor escapado igual que lo haría Jinja.
+
+    Atributos:
+        segmentos (tuple[bytes, ...]): HTML fijo entre las variables
+        variables (tuple[str, ...]): Nombre de cada hueco, en orden
+        etag (str): ETag del cuerpo; solo sirve si no hay variables
+    """
+
+    segmentos: tuple[bytes, ...]
+    variables: tuple[str, ...]
+    etag: str
+
+    @classmethod
+    def renderizar(
+        cls, plantilla: str, variables: tuple[str, ...], **contexto: str
+    ) -> "PaginaCacheada":
+        """Renderiza la plantilla con un marcador en lugar de cada variable."""
+        marcadores = {nombre: _MARCADOR.format(nombre) for nombre in variables}
+        partes = _SEPARAR.split(render_template(plantilla, **contexto, **marcadores))
+
+        segmentos = tuple(parte.encode() for parte in partes[::2])
+        return cls(segmentos, tuple(partes[1::2]), _etag(b"".join(segmentos)))
+
+    def cuerpo(self, valores: dict[str, str]) -> bytes:
+        """HTML final con los valores escapados en sus huecos."""
+        if not self.variables:
+            return self.segmentos[0]
+
+        partes = [self.segmentos[0]]
+        for nombre, segmento in zip(self.variables, self.segmentos[1:]):
+            partes.append(str(escape(valores[nombre])).encode())
+            partes.append(segmento)
+        return b"".join(partes)
+
+
+def pagina(
+    plantilla: str, titulo: str, privada: bool = False, **variables: str
+) -> Response:
+    """Responde una página HTML sin renderizar Jinja en cada petición.
+
+    La plantilla se renderiza en la primera petición y se guarda por
+    aplicación; se vuelve a renderizar si se reconstruyen los estáticos
+    (otras URLs con huella) y nunca se guarda en modo debug, para ver los
+    cambios de las plantillas. Las "variables" cambian en cada petición y
+    solo se sustituyen en el HTML guardado. La respuesta lleva un ETag
+    fuerte y es 304 si coincide con If-None-Match.
+
+    Args:
+        plantilla (str): Nombre de la plantilla
+        titulo (str): Título constante de la página
+        privada (bool): Página con sesión; los caches compartidos no la guardan
+        **variables (str): Valores de esta petición (ej. nombre del usuario)
+
+    Retorna:
+        Response: HTML, o 304 Not Modified
+
+    Ejemplo:
+        return pagina("dashboard.html", "Dashboard", privada=True, nombre="ana")
+    """
+    nombres = tuple(sorted(variables))
+    clave = (plantilla, titulo, nombres)
+    version = version_estaticos()
+
+    # (versión de los estáticos, páginas renderizadas con esas URLs)
+    guardadas = current_app.extensions.get("omni.paginas")
+    if guardadas is None or guardadas[0] != version:
+        guardadas = (version, {})
+        current_app.extensions["omni.paginas"] = guardadas
+    paginas: dict[tuple, PaginaCacheada] = guardadas[1]
+
+    cacheada = paginas.get(clave)
+    if cacheada is None:
+        cacheada = PaginaCacheada.renderizar(plantilla, nombres, titulo=titulo)
+        if not current_app.debug:
+            paginas[clave] = cacheada
+
+    cuerpo = cacheada.cuerpo(variables)
+    respuesta = Response(cuerpo, mimetype="text/html")
+    respuesta.set_etag(_etag(cuerpo) if cacheada.variables else cacheada.etag)
+    respuesta.headers["Cache-Control"] = CACHE_PRIVADA if privada else CACHE_PUBLICA
+
+    return respuesta.make_conditional(request)
@@ -0,0 +1,304 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import multiprocessing
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+
+from omni.modules.archivos import carpeta_estado
+from omni.modules.logging import Logs
+from omni.modules.config import obtener_configuracion
+from omni.modules.cifrado import rotar, unir_claves
+from omni.modules.database import BasedeDatos
+from omni.modules.invalidacion import claves_invalidacion, obtener_canal_invalidacion
+
+
+class RotacionClaves:
+    """Re-cifra las contraseñas de "usuario" con la clave principal del llavero.
+
+    Recorre la tabla por id en lotes (cursor keyset, sin OFFSET), re-cifra
+    cada lote en un pool de procesos y lo escribe con actualizar_muchos()
+    en una sola transacción. Cada UPDATE incluye la contraseña leída en su
+    condición, así que una fila que la aplicación cambió mientras tanto
+    (ya cifrada con la clave nueva) no se pisa. Tras cada lote se guarda el
+    último id en el archivo de progreso y se publica la invalidación de las
+    filas rotadas para que los workers no sirvan copias viejas.
+
+    El trabajo se frena a "filas_por_segundo" para no competir con el
+    tráfico de producción, y se puede interrumpir y repetir: continúa desde
+    el último lote guardado y las filas que ya usan la clave principal no
+    se vuelven a escribir.
+
+    Atributos:
+        claves (str): Llavero de claves Fernet, la principal primero
+        progreso (str): Archivo JSON con el avance de la rotación
+        lote (int): Filas leídas y escritas por transacción
+        procesos (int): Procesos que re-cifran; 0 lo hace en este proceso
+        filas_por_segundo (float): Ritmo máximo; 0 no frena
+
+    Ejemplo:
+        rotacion = RotacionClaves(BasedeDatos(), unir_claves(nueva, vieja), ruta)
+        rotacion.ejecutar()  # {'ultimo_id': 1200, 'rotadas': 1180, ...}
+    """
+
+    def __init__(
+        self,
+        bd: BasedeDatos,
+        claves: str,
+        progreso: str,
+        lote: int = 500,
+        procesos: int = 2,
+        filas_por_segundo: float = 500.0,
+        publicar: Callable[[list[str]], object] | None = None,
+    ) -> None:
+        """Prepara la rotación; no toca la base de datos hasta ejecutar().
+
+        Args:
+            bd (BasedeDatos): Manejador propio del trabajo (no el de una petición)
+            claves (str): Llavero de claves (ver cifrado.unir_claves())
+            progreso (str): Archivo donde se guarda el avance
+            lote (int): Filas por transacción
+            procesos (int): Procesos que re-cifran
+            filas_por_segundo (float): Ritmo máximo de filas procesadas
+            publicar (Callable|None): Publica claves de invalidación; por
+                defecto el canal del servidor
+        """
+        self.__logs = Logs()
+        self.__bd = bd
+        self.claves: str = claves
+        self.progreso: str = progreso
+        self.lote: int = max(1, lote)
+        self.procesos: int = max(0, procesos)
+        self.filas_por_segundo: float = max(0.0, filas_por_segundo)
+        self.__publicar = publicar or (
+            lambda claves: obtener_canal_invalidacion().publicar(claves)
+        )
+
+    def __huella(self) -> str:
+        """Identifica la clave principal sin guardarla en el archivo de progreso."""
+        principal = self.claves.split(",")[0].encode()
+        return hashlib.sha256(principal).hexdigest()[:16]
+
+    def cargar_progreso(self) -> dict[str, int]:
+        """Avance guardado para la clave principal actual.
+
+        Un archivo de otra rotación (otra clave principal), ilegible o
+        inexistente empieza desde el principio.
+
+        Retorna:
+            dict: {"ultimo_id", "leidas", "rotadas", "omitidas", "ilegibles"}
+        """
+        avance = dict.fromkeys(
+            ("ultimo_id", "leidas", "rotadas", "omitidas", "ilegibles"), 0
+        )
+
+        try:
+            with open(self.progreso, encoding="utf-8") as archivo:
+                guardado = json.load(archivo)
+        except (OSError, ValueError):
+            return avance
+
+        if guardado.get("clave") != self.__huella():
+            return avance
+
+        return {campo: int(guardado.get(campo, 0)) for campo in avance}
+
+    def guardar_progreso(self, avance: dict[str, int]) -> None:
+        """Escribe el avance de forma atómica (archivo temporal + os.replace)."""
+        directorio = os.path.dirname(os.path.abspath(self.progreso))
+        fd, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as archivo:
+                json.dump({"clave": self.__huella(), **avance}, archivo)
+            os.replace(temporal, self.progreso)
+        except BaseException:
+            os.unlink(temporal)
+            raise
+
+    @contextmanager
+    def __rotador(self) -> Iterator[Callable[[list[str]], list[str | None]]]:
+        """Función que rota un lote, repartido entre los procesos del pool."""
+        if not self.procesos:
+            yield lambda tokens: rotar(self.claves, tokens)
+            return
+
+        # spawn: no hereda el pool de conexiones ni los hilos de este proceso
+        with ProcessPoolExecutor(
+            self.procesos, mp_context=multiprocessing.get_context("spawn")
+        ) as ejecutor:
+
+            def rotar_lote(tokens: list[str]) -> list[str | None]:
+                tamano = -(-len(tokens) // self.procesos)
+                trozos = [tokens[i : i + tamano] for i in range(0, len(tokens), tamano)]
+                rotados: list[str | None] = []
+                for parte in ejecutor.map(rotar, repeat(self.claves), trozos):
+                    rotados.extend(parte)
+                return rotados
+
+            yield rotar_lote
+
+    def ejecutar(self, reiniciar: bool = False) -> dict[str, int]:
+        """Rota todas las filas desde el último lote guardado.
+
+        Args:
+            reiniciar (bool): Ignora el avance guardado y empieza desde el id 0
+
+        Retorna:
+            dict: Avance final {"ultimo_id", "leidas", "rotadas", "omitidas",
+                "ilegibles"}; "omitidas" son filas cambiadas durante el lote
+
+        Raises:
+            mysql.connector.Error: Si falla una lectura o escritura; el lote en
+                curso se revierte y la próxima ejecución lo repite
+        """
+        avance = self.cargar_progreso()
+        if reiniciar:
+            avance = {campo: 0 for campo in avance}
+
+        self.__logs.info("Rotación de claves iniciada", ultimo_id=avance["ultimo_id"])
+
+        with self.__rotador() as rotar_lote:
+            while True:
+                inicio = time.monotonic()
+                filas = self.__bd.leer(
+                    "usuario",
+                    campos=["id", "password"],
+                    orden="id",
+                    despues_de=avance["ultimo_id"],
+                    limite=self.lote,
+                )
+                if not filas:
+                    break
+
+                rotados = rotar_lote([str(fila["password"]) for fila in filas])
+                self.__procesar(filas, rotados, avance)
+                self.guardar_progreso(avance)
+
+                if self.filas_por_segundo:
+                    pausa = len(filas) / self.filas_por_segundo
+                    time.sleep(max(0.0, pausa - (time.monotonic() - inicio)))
+
+        self.__logs.info("Rotación de claves terminada", **avance)
+        return avance
+
+    def __procesar(
+        self,
+        filas: list[dict],
+        rotados: list[str | None],
+        avance: dict[str, int],
+    ) -> None:
+        """Escribe un lote rotado y actualiza el avance."""
+        cambios = []
+        ids = []
+
+        for fila, nuevo in zip(filas, rotados):
+            if nuevo is None:
+                self.__logs.warning(
+                    "Contraseña ilegible con el llavero actual", user_id=fila["id"]
+                )
+                avance["ilegibles"] += 1
+            elif nuevo != fila["password"]:
+                cambios.append(
+                    (
+                        {"password": nuevo},
+                        {"id": fila["id"], "password": fila["password"]},
+                    )
+                )
+                ids.append(int(fila["id"]))
+
+        if cambios:
+            resultados = self.__bd.actualizar_muchos("usuario", cambios)
+            rotadas = [
+                id_usuario
+                for id_usuario, resultado in zip(ids, resultados)
+                if resultado.exito
+            ]
+            avance["rotadas"] += len(rotadas)
+            avance["omitidas"] += len(cambios) - len(rotadas)
+
+            if rotadas:
+                self.__publicar(
+                    [
+                        clave
+                        for id_usuario in rotadas
+                        for clave in claves_invalidacion(id_usuario)
+                    ]
+                )
+
+        avance["leidas"] += len(filas)
+        avance["ultimo_id"] = int(filas[-1]["id"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Punto de entrada de omni-rotar-claves.
+
+    Rota las contraseñas a APP_KEY usando APP_PREVIOUS_KEYS para descifrar
+    las viejas. Se puede interrumpir (Ctrl+C) y volver a ejecutar.
+
+    Retorna:
+        int: Código de salida; 1 si quedaron contraseñas ilegibles
+    """
+    config = obtener_configuracion()
+    config_app = config.obtener_config_app()
+    nombre_bd = config.obtener_config_bd()["database"]
+
+    parser = argparse.ArgumentParser(
+        prog="omni-rotar-claves",
+        description="Re-cifra las contraseñas guardadas con APP_KEY.",
+    )
+    parser.add_argument("--lote", type=int, default=500, help="Filas por lote")
+    parser.add_argument(
+        "--procesos",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Procesos que re-cifran (0: sin pool)",
+    )
+    parser.add_argument(
+        "--filas-por-segundo",
+        type=float,
+        default=500.0,
+        help="Ritmo máximo (0: sin límite)",
+    )
+    parser.add_argument(
+        "--progreso",
+        help="Archivo con el avance guardado (por defecto "
+        f"<carpeta de estado>/rotacion-{nombre_bd}.json)",
+    )
+    parser.add_argument(
+        "--reiniciar", action="store_true", help="Ignora el avance guardado"
+    )
+    args = parser.parse_args(argv)
+    progreso = args.progreso or os.path.join(
+        carpeta_estado(), f"rotacion-{nombre_bd}.json"
+    )
+
+    claves = unir_claves(str(config_app["Key"]), str(config_app["PreviousKeys"]))
+    if "," not in claves:
+        parser.error("APP_PREVIOUS_KEYS está vacío: no hay claves que rotar")
+
+    bd = BasedeDatos()
+    try:
+        avance = RotacionClaves(
+            bd,
+            claves,
+            progreso,
+            lote=args.lote,
+            procesos=args.procesos,
+            filas_por_segundo=args.filas_por_segundo,
+        ).ejecutar(reiniciar=args.reiniciar)
+    finally:
+        bd.desconectar()
+
+    print(json.dumps(avance))
+    return 1 if avance["ilegibles"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
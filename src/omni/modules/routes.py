@@ -1,23 +1,36 @@
 from omni.modules.logging import Logs
+from omni.modules.limiter import limiter
+from omni.modules.estaticos import servir_estatico
+from omni.modules.paginas import pagina
 from functools import wraps
+from inspect import iscoroutinefunction
 from flask import (
     Blueprint,
-    current_app,
     jsonify,
     redirect,
-    render_template,
-    send_from_directory,
     session,
     url_for,
 )
 
 omni_bp = Blueprint("omni", __name__, template_folder="../templates/")
+# Páginas y archivos estáticos no cuentan para los límites de tasa
+limiter.exentar(omni_bp)
 
 logs = Logs()
 
 
 def require_login(func):
-    """Decorador para requerir autenticación."""
+    """Decorador para requerir autenticación (vistas síncronas o async)."""
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def wrapper_async(*args, **kwargs):
+            if "usuario_id" not in session:
+                return jsonify({"success": False, "message": "No autorizado"}), 401
+            return await func(*args, **kwargs)
+
+        return wrapper_async
 
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -40,11 +53,11 @@ def login():
     """Muestra la página de login.
 
     Retorna:
-        render_template: Plantilla HTML del login con contexto:
+        Response: HTML prerenderizado (ver paginas.pagina()) con contexto:
             - titulo (str): Título de la página
     """
     logs.info("Pagina Login fue accedida")
-    return render_template("login.html", titulo="Login")
+    return pagina("login.html", titulo="Login")
 
 
 @omni_bp.route("/dashboard")
@@ -56,7 +69,7 @@ def dashboard():
         - Sesión activa (cookie de usuario válida)
 
     Retorna:
-        render_template: Plantilla HTML del dashboard con contexto:
+        Response: HTML prerenderizado; solo se sustituye el nombre. Contexto:
             - titulo (str): Título de la página
             - nombre (str): Nombre del usuario desde la sesión
 
@@ -68,7 +81,9 @@ def dashboard():
         user_id=session.get("usuario_id"),
     )
     nombre_usuario = session.get("usuario_nombre", "Usuario")
-    return render_template("dashboard.html", titulo="Dashboard", nombre=nombre_usuario)
+    return pagina(
+        "dashboard.html", titulo="Dashboard", privada=True, nombre=nombre_usuario
+    )
 
 
 @omni_bp.route("/create-user")
@@ -80,14 +95,14 @@ def create_user():
         - Sesión activa con privilegios de administrador
 
     Retorna:
-        render_template: Template HTML con el formulario
+        Response: HTML prerenderizado con el formulario
 
     Errores:
         401: Si no hay sesión activa
         403: Si el usuario no tiene permisos suficientes
     """
     logs.info("Pagina crear usuario fue accedida")
-    return render_template("create-user.html", titulo="Usuario Nuevo")
+    return pagina("create-user.html", titulo="Usuario Nuevo", privada=True)
 
 
 @omni_bp.route("/edit-user")
@@ -99,14 +114,14 @@ def edit_user():
         - Sesión activa con privilegios de administrador
 
     Retorna:
-        render_template: Template HTML con el formulario
+        Response: HTML prerenderizado con el formulario
 
     Errores:
         401: Si no hay sesión activa
         403: Si el usuario no tiene permisos suficientes
     """
     logs.info("Pagina editar usuario fue accedida")
-    return render_template("edit-user.html", titulo="Editar Usuario")
+    return pagina("edit-user.html", titulo="Editar Usuario", privada=True)
 
 
 @omni_bp.route("/static/<path:filename>")
@@ -121,16 +136,11 @@ def serve_static(filename: str):
 
     Ejemplos:
         /static/js/app.js → Sirve archivo JavaScript
-        /static/css/style.css → Sirve archivo CSS
+        /static/dist/css/style.3f2a9c1b7d04.css → Archivo con huella (omni-estaticos)
 
     Notas:
         - Configura automáticamente el MIME type
-        - Cache control desactivado para desarrollo
+        - Los archivos con huella usan cache inmutable, ETag fuerte y br/gzip
+        - Los demás se revalidan en cada uso (Cache-Control: no-cache)
     """
-    logs.info("Se sirvio un script estatico")
-    mimetype = "application/javascript" if filename.endswith(".js") else None
-    return send_from_directory(
-        directory=str(current_app.static_folder),
-        path=filename,
-        mimetype=mimetype,
-    )
+    return servir_estatico(filename)
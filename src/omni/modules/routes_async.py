@@ -0,0 +1,208 @@
+import asyncio
+from collections.abc import Callable
+
+from flask import Flask, jsonify
+
+from omni.modules.cifrado import CifradoSaturado
+from omni.modules.database_async import _requerir_aiomysql
+from omni.modules.logging import Logs
+from omni.modules.limiter import limiter
+from omni.modules.routes import require_login
+from omni.modules.routes_auth import (
+    _datos_incompletos,
+    _frenar_intentos,
+    _leer_credenciales,
+    _respuesta_login,
+    _respuesta_registro,
+)
+from omni.modules.routes_user import (
+    _leer_actualizacion,
+    _leer_pagina,
+    _respuesta_actualizacion,
+    _respuesta_eliminacion,
+    _respuesta_error,
+    _respuesta_pagina,
+    _respuesta_usuario,
+    _usuario_no_encontrado,
+)
+from omni.modules.services_auth import servicio_auth_async as serv_auth
+
+VISTAS_ASYNC: dict[str, Callable] = {}
+"""Endpoint de auth_bp/usuarios_bp -> versión async de su vista"""
+
+logs = Logs()
+
+
+def _vista_async(endpoint: str) -> Callable[[Callable], Callable]:
+    """Registra la función como versión async de la vista "endpoint"."""
+
+    def decorador(vista: Callable) -> Callable:
+        VISTAS_ASYNC[endpoint] = vista
+        return vista
+
+    return decorador
+
+
+def registrar_vistas_async(app: Flask) -> None:
+    """Reemplaza las vistas de la API que consultan la base de datos.
+
+    Las reglas de URL, los endpoints y los límites de los blueprints no
+    cambian; solo la función de cada endpoint de VISTAS_ASYNC. Las demás
+    rutas (exportación, operaciones masivas, sesión) siguen síncronas.
+
+    Args:
+        app (Flask): Aplicación con auth_bp y usuarios_bp ya registrados
+
+    Raises:
+        RuntimeError: Si falta aiomysql o flask[async] (pip install omni[async])
+    """
+    _requerir_aiomysql()
+    try:
+        import asgiref  # noqa: F401
+    except ImportError as err:
+        raise RuntimeError(
+            "Las vistas asincronas requieren flask[async]: pip install omni[async]"
+        ) from err
+
+    for endpoint, vista in VISTAS_ASYNC.items():
+        app.view_functions[endpoint] = vista
+
+
+@_vista_async("usuarios.obtener_usuarios")
+@require_login
+async def obtener_usuarios():
+    """Versión async de routes_user.obtener_usuarios().
+
+    En la primera página la página y el total se consultan al mismo tiempo.
+    """
+    logs.debug("Peticion para conseguir usuarios")
+
+    try:
+        limite, despues_de, campos, prefijo = _leer_pagina()
+
+        servicio_usuario = serv_auth.servicio_usuario
+        pagina = servicio_usuario.obtener_pagina_usuarios(
+            limite, despues_de, campos, prefijo
+        )
+
+        if despues_de is None:
+            datos_usuarios, total = await asyncio.gather(
+                pagina, servicio_usuario.contar_usuarios(prefijo)
+            )
+        else:
+            datos_usuarios, total = await pagina, None
+
+        logs.info("Usuarios fueron conseguidos")
+        return _respuesta_pagina(datos_usuarios, limite, total)
+
+    except ValueError as err:
+        logs.warning("Parametros invalidos al conseguir usuarios", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 400
+    except Exception as err:
+        return _respuesta_error("Fallo conseguir los usuarios", err)
+
+
+@_vista_async("usuarios.actualizar_usuario")
+@require_login
+async def actualizar_usuario():
+    """Versión async de routes_user.actualizar_usuario()."""
+    logs.debug("Peticion para actualizar usuario")
+    actualizacion = _leer_actualizacion()
+
+    if actualizacion is None:
+        return jsonify({"success": False, "message": "Datos incompletos"}), 400
+
+    nombre_actual, datos_actualizados, nueva_password = actualizacion
+
+    if nueva_password:
+        datos_actualizados["password"] = await serv_auth.cifrar_password(nueva_password)
+
+    try:
+        resultado = await serv_auth.servicio_usuario.actualizar_usuario(
+            nombre_actual, datos_actualizados
+        )
+        return _respuesta_actualizacion(resultado)
+    except Exception as err:
+        return _respuesta_error("Error al actualizar usuario", err)
+
+
+@_vista_async("usuarios.eliminar_usuario")
+@require_login
+async def eliminar_usuario(id_usuario: int):
+    """Versión async de routes_user.eliminar_usuario()."""
+    logs.debug("Peticion para eliminar usuario", user_id=id_usuario)
+
+    try:
+        filas_afectadas = await serv_auth.servicio_usuario.borrar_usuario_por_id(
+            id_usuario
+        )
+        return _respuesta_eliminacion(id_usuario, filas_afectadas)
+    except Exception as err:
+        return _respuesta_error("Error eliminando usuario", err)
+
+
+@_vista_async("usuarios.obtener_usuario")
+@require_login
+async def obtener_usuario(id_usuario: int):
+    """Versión async de routes_user.obtener_usuario()."""
+    logs.debug("Peticion para conseguir un usuario", user_id=id_usuario)
+
+    try:
+        usuario = await serv_auth.servicio_usuario.obtener_usuario_por_id(id_usuario)
+        return _respuesta_usuario(usuario)
+    except Exception as err:
+        return _respuesta_error("Fallo conseguir el usuario", err)
+
+
+@_vista_async("usuarios.desencriptar_password")
+@require_login
+async def desencriptar_password(id_usuario: int):
+    """Versión async de routes_user.desencriptar_password()."""
+    logs.debug("Peticion para desencriptar la contraseña")
+
+    try:
+        usuario = await serv_auth.servicio_usuario.obtener_usuario_por_id(id_usuario)
+
+        if not usuario:
+            return _usuario_no_encontrado()
+
+        decriptado = await serv_auth.descifrar_password(usuario.password)
+
+        logs.info("Se logro conseguir la contraseña desencriptada")
+        return jsonify({"success": True, "password": decriptado})
+
+    except CifradoSaturado:
+        raise
+    except Exception as err:
+        return _respuesta_error("Fallo desencriptar la contraseña", err)
+
+
+@_vista_async("auth.registro")
+async def registro():
+    """Versión async de routes_auth.registro()."""
+    logs.debug("Se hizo una peticion de registro")
+    credenciales = _leer_credenciales()
+
+    if credenciales is None:
+        return _datos_incompletos()
+
+    return _respuesta_registro(await serv_auth.registrar_usuario(*credenciales))
+
+
+@_vista_async("auth.login")
+@limiter.limitar("Login")
+async def login():
+    """Versión async de routes_auth.login()."""
+    logs.debug("Se hizo una peticion de ingreso")
+    credenciales = _leer_credenciales()
+
+    if credenciales is None:
+        return _datos_incompletos()
+
+    nombre, password = credenciales
+    frenado = _frenar_intentos(nombre)
+
+    if frenado is not None:
+        return frenado
+
+    return _respuesta_login(nombre, await serv_auth.iniciar_sesion(nombre, password))
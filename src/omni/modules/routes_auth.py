@@ -1,19 +1,72 @@
-from flask import Blueprint, jsonify, request
+import math
 
+from flask import Blueprint, Response, jsonify, request
+
+from omni.modules.intentos import obtener_control_intentos
 from omni.modules.logging import Logs
 from omni.modules.limiter import limiter
-from omni.modules.database import BasedeDatos
 from omni.modules.routes import require_login
-from omni.modules.services_auth import ServicioAutenticacion
+from omni.modules.services_auth import servicio_auth as serv_auth
 
 
 auth_bp = Blueprint("auth", __name__)
+limiter.limitar("Auth")(auth_bp)
 
-bd = BasedeDatos()
-serv_auth = ServicioAutenticacion(bd)
 logs = Logs()
 
 
+def _leer_credenciales() -> tuple[str, str] | None:
+    """Nombre y contraseña del cuerpo JSON, o None si faltan."""
+    datos = request.json
+
+    if not datos or "nombre" not in datos or "password" not in datos:
+        logs.error("Los datos estaban incompletos para la peticion")
+        return None
+
+    return datos["nombre"], datos["password"]
+
+
+def _datos_incompletos() -> tuple[Response, int]:
+    """Respuesta 400 para un cuerpo sin nombre o contraseña."""
+    return jsonify({"success": False, "message": "Datos incompletos"}), 400
+
+
+def _respuesta_registro(resultado: dict[str, str | bool | int]) -> tuple[Response, int]:
+    """Respuesta de /api/registro con el código que indicó el servicio."""
+    codigo_status = int(resultado.pop("codigo"))
+
+    logs.info("Se logro hacer la peticion")
+    return jsonify(resultado), codigo_status
+
+
+def _frenar_intentos(nombre: str) -> tuple[Response, int] | None:
+    """Respuesta 429 si el usuario o la IP+usuario deben esperar, o None."""
+    espera = obtener_control_intentos().espera(nombre, request.remote_addr)
+
+    if not espera:
+        return None
+
+    logs.warning("Intentos de ingreso frenados", nombre=nombre)
+    respuesta = jsonify({"success": False, "message": "Demasiados intentos fallidos"})
+    respuesta.headers["Retry-After"] = str(math.ceil(espera))
+    return respuesta, 429
+
+
+def _respuesta_login(
+    nombre: str, resultado: dict[str, str | bool]
+) -> tuple[Response, int]:
+    """Registra el intento en ControlIntentos y arma la respuesta de /api/login."""
+    control = obtener_control_intentos()
+
+    if resultado["success"]:
+        control.registrar_exito(nombre, request.remote_addr)
+    else:
+        control.registrar_fallo(nombre, request.remote_addr)
+
+    logs.info("Se logro hacer la peticion")
+    return jsonify(resultado), 200 if resultado["success"] else 401
+
+
 @auth_bp.route("/api/registro", methods=["POST"])
 def registro():
     """Endpoint para registro de nuevos usuarios.
@@ -32,6 +85,8 @@ def registro():
             {"success": False, "message": "Datos incompletos"}
         409 (error):
             {"success": False, "message": "El usuario ya existe"}
+        500 (error):
+            {"success": False, "message": "<error de la base de datos>"}
 
     Acciones:
         - Valida datos de entrada
@@ -44,24 +99,16 @@ def registro():
         - Nombre de usuario duplicado
     """
     logs.debug("Se hizo una peticion de registro")
-    datos = request.json
-
-    if not datos or "nombre" not in datos or "password" not in datos:
-        logs.error("Los datos estaban incompletos para la peticion")
-        return jsonify({"success": False, "message": "Datos incompletos"}), 400
+    credenciales = _leer_credenciales()
 
-    nombre: str = datos["nombre"]
-    password: str = datos["password"]
+    if credenciales is None:
+        return _datos_incompletos()
 
-    resultado = serv_auth.registrar_usuario(nombre, password)
-    codigo_status = 201 if resultado["success"] else 400
-
-    logs.info("Se logro hacer la peticion")
-    return jsonify(resultado), codigo_status
+    return _respuesta_registro(serv_auth.registrar_usuario(*credenciales))
 
 
 @auth_bp.route("/api/login", methods=["POST"])
-@limiter.limit("5 per minute")
+@limiter.limitar("Login")
 def login():
     """Endpoint para autenticación de usuarios.
 
@@ -79,26 +126,29 @@ def login():
             {"success": False, "message": "Datos incompletos"}
         401 (error):
             {"success": False, "message": "Credenciales inválidas"}
+        429 (error):
+            {"success": False, "message": "Demasiados intentos fallidos"}
+            (con cabecera Retry-After)
 
     Acciones:
+        - Rechaza sin consultar la base de datos si el usuario o la IP+usuario
+          superaron los intentos fallidos permitidos
         - Establece cookies de sesión (usuario_id, usuario_nombre)
         - Registra intentos fallidos en el log
     """
     logs.debug("Se hizo una peticion de ingreso")
-    datos = request.json
+    credenciales = _leer_credenciales()
 
-    if not datos or "nombre" not in datos or "password" not in datos:
-        logs.error("Los datos estaban incompletos para la peticion")
-        return jsonify({"success": False, "message": "Datos incompletos"}), 400
+    if credenciales is None:
+        return _datos_incompletos()
 
-    nombre: str = datos["nombre"]
-    password: str = datos["password"]
+    nombre, password = credenciales
+    frenado = _frenar_intentos(nombre)
 
-    resultado = serv_auth.iniciar_sesion(nombre, password)
-    codigo_status = 200 if resultado["success"] else 401
+    if frenado is not None:
+        return frenado
 
-    logs.info("Se logro hacer la peticion")
-    return jsonify(resultado), codigo_status
+    return _respuesta_login(nombre, serv_auth.iniciar_sesion(nombre, password))
 
 
 @auth_bp.route("/api/logout", methods=["POST"])
@@ -1,31 +1,180 @@
-from flask import Blueprint, jsonify, request
-
-from omni.modules.database import BasedeDatos
+from collections.abc import Iterator
+
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+)
+
+from omni.modules.cifrado import CifradoSaturado
+from omni.modules.database import EstadoEscritura, ResultadoEscritura
 from omni.modules.logging import Logs
+from omni.modules.models import Usuario
+from omni.modules.limiter import limiter
 from omni.modules.routes import require_login
-from omni.modules.services_auth import ServicioAutenticacion
+from omni.modules.services_auth import servicio_auth as serv_auth
 
 
 usuarios_bp = Blueprint("usuarios", __name__)
+limiter.limitar("Users")(usuarios_bp)
 
-bd = BasedeDatos()
-serv_auth = ServicioAutenticacion(bd)
+LIMITE_PAGINA = 100
+LIMITE_PAGINA_MAXIMO = 500
+FILAS_POR_ESCRITURA = 500
+LIMITE_MASIVO = 10_000
 
 logs = Logs()
 
 
+def _leer_pagina() -> tuple[int, int | None, list[str] | None, str | None]:
+    """Parámetros de paginación de la query string de /api/users.
+
+    Retorna:
+        tuple: limit, after_id, fields y prefix (None si no se dieron)
+
+    Raises:
+        ValueError: Si limit no es entero o está fuera de rango, o after_id
+            no es entero
+    """
+    limite = request.args.get("limit", None, type=int)
+    despues_de = request.args.get("after_id", None, type=int)
+    prefijo = request.args.get("prefix", None, type=str)
+    campos_texto = request.args.get("fields", "", type=str)
+    campos = [campo.strip() for campo in campos_texto.split(",") if campo.strip()]
+
+    if "limit" in request.args and limite is None:
+        raise ValueError("limit debe ser un entero")
+
+    limite = LIMITE_PAGINA if limite is None else limite
+    if not 1 <= limite <= LIMITE_PAGINA_MAXIMO:
+        raise ValueError(f"limit debe estar entre 1 y {LIMITE_PAGINA_MAXIMO}")
+
+    if "after_id" in request.args and despues_de is None:
+        raise ValueError("after_id debe ser un entero")
+
+    return limite, despues_de, campos or None, prefijo or None
+
+
+def _respuesta_pagina(
+    datos_usuarios: list[dict[str, str | int]], limite: int, total: int | None
+) -> Response:
+    """Respuesta de /api/users con el cursor siguiente y sin cache."""
+    siguiente = datos_usuarios[-1]["id"] if len(datos_usuarios) == limite else None
+    respuesta = jsonify(
+        {"success": True, "usuarios": datos_usuarios, "siguiente": siguiente}
+    )
+
+    if total is not None:
+        respuesta.headers["X-Total-Count"] = str(total)
+
+    respuesta.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+    respuesta.headers["Pragma"] = "no-cache"
+    respuesta.headers["Expires"] = "0"
+    return respuesta
+
+
+def _respuesta_actualizacion(resultado: ResultadoEscritura) -> tuple[Response, int]:
+    """Respuesta de /api/users/update según el resultado del UPDATE."""
+    if resultado.estado is EstadoEscritura.EXITO:
+        logs.debug("Se actualizo el usuario")
+        return (
+            jsonify({"success": True, "message": "Usuario actualizado correctamente"}),
+            200,
+        )
+
+    if resultado.estado is EstadoEscritura.DUPLICADO:
+        logs.debug("El nombre nuevo ya esta en uso")
+        return jsonify({"success": False, "message": "El nombre ya está en uso"}), 409
+
+    logs.debug("No se pudo actualizar el usuario")
+    return jsonify({"success": False, "message": "Usuario no encontrado"}), 404
+
+
+def _leer_actualizacion() -> tuple[str, dict[str, str], str | None] | None:
+    """Nombre actual, datos nuevos y contraseña nueva de /api/users/update.
+
+    Retorna:
+        tuple|None: None si faltan nombre_actual o nuevo_nombre. La
+            contraseña (None si no se pidió cambiarla) aún debe cifrarse y
+            agregarse a los datos como "password"
+    """
+    datos = request.json
+
+    if not datos or "nombre_actual" not in datos or "nuevo_nombre" not in datos:
+        logs.error("Datos incompletos")
+        return None
+
+    return (
+        datos["nombre_actual"],
+        {"nombre": datos["nuevo_nombre"]},
+        str(datos["nueva_password"]) if datos.get("nueva_password") else None,
+    )
+
+
+def _respuesta_eliminacion(
+    id_usuario: int, filas_afectadas: int
+) -> tuple[Response, int]:
+    """Respuesta de /api/users/delete según las filas eliminadas."""
+    if filas_afectadas > 0:
+        logs.info("Usuario eliminado", user_id=id_usuario)
+        return (
+            jsonify({"success": True, "message": "Usuario eliminado exitosamente"}),
+            200,
+        )
+
+    logs.warning("No se encontro el usuario que se buscaba")
+    return jsonify({"success": False, "message": "Usuario no encotrado"}), 500
+
+
+def _usuario_no_encontrado() -> tuple[Response, int]:
+    """Respuesta 404 de las rutas que buscan un usuario por id."""
+    logs.warning("No se encontro el usuario que se buscaba")
+    return jsonify({"success": False, "message": "Usuario no encotrado"}), 404
+
+
+def _respuesta_usuario(usuario: Usuario | None) -> tuple[Response, int]:
+    """Respuesta de /api/users/<id> con el id y nombre, sin la contraseña."""
+    if not usuario:
+        return _usuario_no_encontrado()
+
+    logs.info("Usuario conseguido", user_id=usuario.id)
+    return (
+        jsonify(
+            {"success": True, "usuario": {"id": usuario.id, "nombre": usuario.nombre}}
+        ),
+        200,
+    )
+
+
+def _respuesta_error(mensaje: str, err: Exception) -> tuple[Response, int]:
+    """Registra un error inesperado y responde 500 con su descripción."""
+    logs.error(mensaje, error=str(err), stack_info=True)
+    return jsonify({"success": False, "message": str(err)}), 500
+
+
 @usuarios_bp.route("/api/users", methods=["GET"])
 @require_login
 def obtener_usuarios():
-    """Obtiene lista completa de usuarios registrados.
+    """Obtiene una página de usuarios registrados.
 
-    Método: POST
+    Método: GET
     Requiere:
         - Sesión activa con privilegios de administrador
 
+    Parámetros (query string):
+        limit (int): Usuarios por página (default 100, máximo 500)
+        after_id (int): Último id de la página anterior (cursor keyset)
+        fields (str): Campos separados por comas, ej. "id,nombre"
+        prefix (str): Filtra usuarios cuyo nombre empieza con el prefijo
+
     Respuestas:
         200 (éxito):
-            {"success": True, "usuarios": [lista_de_usuarios]}
+            {"success": True, "usuarios": [lista_de_usuarios], "siguiente": int | None}
+        400 (error):
+            {"success": False, "message": "Parametros invalidos"}
         401 (error):
             {"success": False, "message": "No autorizado"}
         500 (error):
@@ -33,24 +182,118 @@ def obtener_usuarios():
 
     Cabeceras:
         - Cache-Control: no-store (previene almacenamiento en caché)
+        - X-Total-Count: Total de usuarios que cumplen el filtro (solo en la
+          primera página, sin after_id, para no contar la tabla en cada página)
     """
     logs.debug("Peticion para conseguir usuarios")
 
     try:
+        limite, despues_de, campos, prefijo = _leer_pagina()
+
+        servicio_usuario = serv_auth.servicio_usuario
+        datos_usuarios = servicio_usuario.obtener_pagina_usuarios(
+            limite, despues_de, campos, prefijo
+        )
+        total = (
+            servicio_usuario.contar_usuarios(prefijo) if despues_de is None else None
+        )
+
         logs.info("Usuarios fueron conseguidos")
-        datos_usuarios = serv_auth.obtener_datos_del_usuario()
+        return _respuesta_pagina(datos_usuarios, limite, total)
 
-        respuesta = jsonify({"success": True, "usuarios": datos_usuarios})
+    except ValueError as err:
+        logs.warning("Parametros invalidos al conseguir usuarios", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 400
+    except Exception as err:
+        return _respuesta_error("Fallo conseguir los usuarios", err)
 
-        respuesta.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
-        respuesta.headers["Pragma"] = "no-cache"
-        respuesta.headers["Expires"] = "0"
 
-        return respuesta
+@usuarios_bp.route("/api/users/export", methods=["GET"])
+@require_login
+def exportar_usuarios():
+    """Exporta todos los usuarios como un flujo JSON o NDJSON.
 
-    except Exception as err:
-        logs.error("Fallo conseguir los usuarios", error=str(err), stack_info=True)
-        return jsonify({"success": False, "message": str(err)}), 500
+    Método: GET
+    Requiere:
+        - Sesión activa con privilegios de administrador
+
+    Parámetros (query string):
+        format (str): "json" (arreglo, default) o "ndjson" (un objeto por línea)
+        fields (str): Campos separados por comas, ej. "id,nombre"
+
+    Respuestas:
+        200 (éxito):
+            [{"id": 1, "nombre": "..."}, ...] transmitido por partes
+        400 (error):
+            {"success": False, "message": "Parametros invalidos"}
+        401 (error):
+            {"success": False, "message": "No autorizado"}
+
+    Notas:
+        - Las filas se leen, serializan y envían por lotes, así que la memoria
+          usada no depende del número de usuarios
+        - Un error a mitad del flujo solo puede registrarse: el estado 200 ya se envió
+    """
+    logs.debug("Peticion para exportar usuarios")
+
+    formato = request.args.get("format", "json", type=str)
+    campos_texto = request.args.get("fields", "", type=str)
+    campos = [campo.strip() for campo in campos_texto.split(",") if campo.strip()]
+
+    if formato not in ("json", "ndjson"):
+        logs.warning("Formato de exportacion invalido", formato=formato)
+        return jsonify({"success": False, "message": "Formato invalido"}), 400
+
+    try:
+        usuarios = serv_auth.servicio_usuario.iterar_usuarios(
+            campos or None, FILAS_POR_ESCRITURA
+        )
+    except ValueError as err:
+        logs.warning("Parametros invalidos al exportar usuarios", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 400
+
+    serializar = current_app.json.dumps
+
+    def generar() -> Iterator[str]:
+        lote: list[str] = []
+        exportados = 0
+
+        try:
+            if formato == "json":
+                yield "["
+
+            for usuario in usuarios:
+                texto = serializar(usuario)
+
+                if formato == "ndjson":
+                    lote.append(texto + "\n")
+                else:
+                    lote.append("," + texto if exportados else texto)
+
+                exportados += 1
+
+                if len(lote) == FILAS_POR_ESCRITURA:
+                    yield "".join(lote)
+                    lote.clear()
+
+            if lote:
+                yield "".join(lote)
+
+            if formato == "json":
+                yield "]"
+
+            logs.info("Usuarios exportados", total=exportados)
+        except Exception as err:
+            logs.error("Fallo la exportacion de usuarios", error=str(err))
+            raise
+
+    tipo = "application/x-ndjson" if formato == "ndjson" else "application/json"
+    respuesta = Response(stream_with_context(generar()), mimetype=tipo)
+    respuesta.headers["Content-Disposition"] = (
+        f"attachment; filename=usuarios.{formato}"
+    )
+    respuesta.headers["Cache-Control"] = "no-store"
+    return respuesta
 
 
 @usuarios_bp.route("/api/users/update", methods=["PUT"])
@@ -67,56 +310,34 @@ def actualizar_usuario():
             {"success": False, "message": "Datos incompletos"}
         404 (error):
             {"success": False, "message": "Usuario no encontrado"}
+        409 (error):
+            {"success": False, "message": "El nombre ya está en uso"}
         500 (error):
             {"success": False, "message": "Error de actualizado"}
 
     """
     logs.debug("Peticion para actualizar usuario")
-    datos = request.json
+    actualizacion = _leer_actualizacion()
 
-    if not datos or "nombre_actual" not in datos or "nuevo_nombre" not in datos:
-        logs.error("Datos incompletos")
+    if actualizacion is None:
         return jsonify({"success": False, "message": "Datos incompletos"}), 400
 
-    nombre_actual: str = datos["nombre_actual"]
-    nuevo_nombre: str = datos["nuevo_nombre"]
-    nueva_password: str | None = datos.get("nueva_password", "")
-
-    logs.debug(
-        f"Nombre actual: {nombre_actual}, Nuevo nombre: {nuevo_nombre}, Nuevo password: {nueva_password}"
-    )
-
-    # Prepare update data
-    datos_actualizados = {"nombre": nuevo_nombre}
+    nombre_actual, datos_actualizados, nueva_password = actualizacion
 
     if nueva_password:
-        password_encriptado = serv_auth.cypher.encrypt(nueva_password.encode()).decode()
-        datos_actualizados["password"] = password_encriptado
+        datos_actualizados["password"] = serv_auth.cifrar_password(nueva_password)
         logs.debug("Se encripto la contraseña")
 
-    logs.debug(
-        f"Nombre actual: {datos_actualizados['nombre']}, Nuevo password: {datos_actualizados['password']}"
-    )
-
     try:
-        # Update user
-        filas_afectadas = serv_auth.servicio_usuario.actualizar_usuario(
+        # Un solo UPDATE; el resultado indica si no existe o si el nombre está en uso
+        resultado = serv_auth.servicio_usuario.actualizar_usuario(
             nombre_actual, datos_actualizados
         )
-        logs.debug("se logro servicio")
-        logs.debug(f"{filas_afectadas}")
-
-        if filas_afectadas > 0:
-            logs.debug("Se actualizo el usuario")
-            return jsonify(
-                {"success": True, "message": "Usuario actualizado correctamente"}, 200
-            )
+        logs.debug("se logro servicio", estado=resultado.estado.value)
 
-        logs.debug("No se pudo actualizar el usuario")
-        return jsonify({"success": False, "message": "Usuario no encontrado"}), 404
+        return _respuesta_actualizacion(resultado)
     except Exception as err:
-        logs.error("Error al actualizar usuario", error=str(err))
-        return jsonify({"success": False, "message": str(err)}), 500
+        return _respuesta_error("Error al actualizar usuario", err)
 
 
 @usuarios_bp.route("/api/users/delete/<int:id_usuario>", methods=["DELETE"])
@@ -138,39 +359,229 @@ def eliminar_usuario(id_usuario: int):
     logs.debug("Peticion para eliminar usuario", user_id=id_usuario)
 
     try:
-        usuarios = serv_auth.obtener_datos_del_usuario()
-
-        usuario_clave = (
-            next(
-                (usuario for usuario in usuarios if usuario["id"] == id_usuario),
-                None,
-            )
-            if usuarios
-            else None
+        filas_afectadas = serv_auth.servicio_usuario.borrar_usuario_por_id(id_usuario)
+        return _respuesta_eliminacion(id_usuario, filas_afectadas)
+    except Exception as err:
+        return _respuesta_error("Error eliminando usuario", err)
+
+
+def _leer_lote(campo: str) -> list:
+    """Lista "campo" del cuerpo JSON de una operación masiva.
+
+    Raises:
+        ValueError: Si no es una lista con entre 1 y LIMITE_MASIVO elementos
+    """
+    datos = request.get_json(silent=True)
+    lote = datos.get(campo) if isinstance(datos, dict) else None
+
+    if not isinstance(lote, list) or not 1 <= len(lote) <= LIMITE_MASIVO:
+        raise ValueError(f"{campo} debe ser una lista de 1 a {LIMITE_MASIVO} elementos")
+
+    return lote
+
+
+def _respuesta_lote(
+    resultados: list[ResultadoEscritura], claves: list[dict[str, str | int]]
+) -> Response:
+    """Respuesta de una operación masiva con un resultado por elemento."""
+    detalle = [
+        {**clave, "estado": resultado.estado.value}
+        | ({"id": resultado.id_generado} if resultado.id_generado else {})
+        for clave, resultado in zip(claves, resultados)
+    ]
+    exitos = sum(resultado.exito for resultado in resultados)
+
+    return jsonify(
+        {
+            "success": True,
+            "exitos": exitos,
+            "fallos": len(resultados) - exitos,
+            "resultados": detalle,
+        }
+    )
+
+
+@usuarios_bp.route("/api/users/bulk", methods=["POST"])
+@require_login
+def crear_usuarios():
+    """Crea varios usuarios con pocas sentencias INSERT de varias filas.
+
+    Método: POST
+    Cuerpo:
+        {"usuarios": [{"nombre": str, "password": str}, ...]} (máximo 10000)
+
+    Respuestas:
+        200 (éxito):
+            {"success": True, "exitos": int, "fallos": int,
+             "resultados": [{"nombre": str, "estado": "exito", "id": int}
+                            | {"nombre": str, "estado": "duplicado"}, ...]}
+        400 (error):
+            {"success": False, "message": "Datos incompletos"}
+        500 (error):
+            {"success": False, "message": "<error>"} (no se crea ningún usuario)
+    """
+    logs.debug("Peticion para crear usuarios en lote")
+
+    try:
+        lote = _leer_lote("usuarios")
+        if not all(
+            isinstance(item, dict) and item.get("nombre") and item.get("password")
+            for item in lote
+        ):
+            raise ValueError("Cada usuario necesita nombre y password")
+    except ValueError as err:
+        logs.warning("Datos invalidos al crear usuarios", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 400
+
+    # Todas las contraseñas se cifran en una sola tarea del pool de cifrado
+    passwords = serv_auth.cifrar_passwords([str(item["password"]) for item in lote])
+    usuarios = [
+        Usuario(nombre=str(item["nombre"]), password=password)
+        for item, password in zip(lote, passwords)
+    ]
+
+    try:
+        resultados = serv_auth.servicio_usuario.crear_usuarios(
+            usuarios, FILAS_POR_ESCRITURA
         )
+    except Exception as err:
+        logs.error("Error al crear usuarios en lote", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 500
+
+    logs.info("Usuarios creados en lote", total=len(usuarios))
+    return _respuesta_lote(
+        resultados, [{"nombre": usuario.nombre} for usuario in usuarios]
+    )
+
 
-        if not usuario_clave:
-            logs.warning("No se encontro el usuario que se buscaba")
-            return jsonify({"success": False, "message": "Usuario no encotrado"}), 500
+@usuarios_bp.route("/api/users/bulk", methods=["PUT"])
+@require_login
+def actualizar_usuarios():
+    """Actualiza varios usuarios en una sola transacción.
+
+    Método: PUT
+    Cuerpo:
+        {"usuarios": [{"nombre_actual": str, "nuevo_nombre": str,
+                       "nueva_password": str (opcional)}, ...]} (máximo 10000)
+
+    Respuestas:
+        200 (éxito):
+            {"success": True, "exitos": int, "fallos": int,
+             "resultados": [{"nombre_actual": str,
+                             "estado": "exito" | "no_encontrado" | "duplicado"}, ...]}
+        400 (error):
+            {"success": False, "message": "Datos incompletos"}
+        500 (error):
+            {"success": False, "message": "<error>"} (no se aplica ningún cambio)
+    """
+    logs.debug("Peticion para actualizar usuarios en lote")
 
-        filas_afectadas = serv_auth.servicio_usuario.borrar_usuario(
-            str(usuario_clave["nombre"])
+    try:
+        lote = _leer_lote("usuarios")
+        if not all(
+            isinstance(item, dict)
+            and item.get("nombre_actual")
+            and item.get("nuevo_nombre")
+            for item in lote
+        ):
+            raise ValueError("Cada usuario necesita nombre_actual y nuevo_nombre")
+    except ValueError as err:
+        logs.warning("Datos invalidos al actualizar usuarios", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 400
+
+    con_password = [item for item in lote if item.get("nueva_password")]
+    cifradas = iter(
+        serv_auth.cifrar_passwords(
+            [str(item["nueva_password"]) for item in con_password]
         )
+        if con_password
+        else []
+    )
+
+    cambios: list[tuple[str, dict[str, str]]] = []
+    for item in lote:
+        datos_actualizados = {"nombre": str(item["nuevo_nombre"])}
+        if item.get("nueva_password"):
+            datos_actualizados["password"] = next(cifradas)
+        cambios.append((str(item["nombre_actual"]), datos_actualizados))
 
-        if filas_afectadas > 0:
-            logs.info("Usuario eliminado", user_id=id_usuario)
-            return jsonify(
-                {"success": True, "message": "Usuario eliminado exitosamente"}
-            )
+    try:
+        resultados = serv_auth.servicio_usuario.actualizar_usuarios(cambios)
+    except Exception as err:
+        logs.error("Error al actualizar usuarios en lote", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 500
+
+    logs.info("Usuarios actualizados en lote", total=len(cambios))
+    return _respuesta_lote(
+        resultados, [{"nombre_actual": nombre} for nombre, _ in cambios]
+    )
+
+
+@usuarios_bp.route("/api/users/bulk", methods=["DELETE"])
+@require_login
+def eliminar_usuarios():
+    """Elimina varios usuarios con pocas sentencias DELETE ... IN.
 
-        return jsonify(
-            {"success": False, "message": "No se pudo eliminar el usuario"}
-        ), 500
+    Método: DELETE
+    Cuerpo:
+        {"ids": [int, ...]} (máximo 10000)
+
+    Respuestas:
+        200 (éxito):
+            {"success": True, "exitos": int, "fallos": int,
+             "resultados": [{"id": int, "estado": "exito" | "no_encontrado"}, ...]}
+        400 (error):
+            {"success": False, "message": "Datos incompletos"}
+        500 (error):
+            {"success": False, "message": "<error>"} (no se elimina ningún usuario)
+    """
+    logs.debug("Peticion para eliminar usuarios en lote")
+
+    try:
+        ids = _leer_lote("ids")
+        if not all(type(id_usuario) is int for id_usuario in ids):
+            raise ValueError("ids debe contener solo enteros")
+    except ValueError as err:
+        logs.warning("Datos invalidos al eliminar usuarios", error=str(err))
+        return jsonify({"success": False, "message": str(err)}), 400
 
+    try:
+        resultados = serv_auth.servicio_usuario.borrar_usuarios_por_id(
+            ids, FILAS_POR_ESCRITURA
+        )
     except Exception as err:
-        logs.error("Error eliminando usuario", error=str(err))
+        logs.error("Error al eliminar usuarios en lote", error=str(err))
         return jsonify({"success": False, "message": str(err)}), 500
 
+    logs.info("Usuarios eliminados en lote", total=len(ids))
+    return _respuesta_lote(resultados, [{"id": id_usuario} for id_usuario in ids])
+
+
+@usuarios_bp.route("/api/users/<int:id_usuario>", methods=["GET"])
+@require_login
+def obtener_usuario(id_usuario: int):
+    """Endpoint para obtener un usuario por su id
+
+    Método: GET
+    Parámetros:
+        id_usuario (int): ID del usuario objetivo
+
+    Respuestas:
+        200 (éxito):
+            {"success": True, "usuario": {"id": 1, "nombre": "admin"}}
+        404 (error):
+            {"success": False, "message": "Usuario no encontrado"}
+        500 (error):
+            {"success": False, "message": "<error de la base de datos>"}
+    """
+    logs.debug("Peticion para conseguir un usuario", user_id=id_usuario)
+
+    try:
+        usuario = serv_auth.servicio_usuario.obtener_usuario_por_id(id_usuario)
+        return _respuesta_usuario(usuario)
+    except Exception as err:
+        return _respuesta_error("Fallo conseguir el usuario", err)
+
 
 @usuarios_bp.route("/api/users/decrypt-password/<int:id_usuario>", methods=["GET"])
 @require_login
@@ -193,26 +604,17 @@ def desencriptar_password(id_usuario: int):
     logs.debug("Peticion para desencriptar la contraseña")
 
     try:
-        usuarios = serv_auth.obtener_datos_del_usuario()
-
-        usuario_clave = (
-            next(
-                (usuario for usuario in usuarios if usuario["id"] == id_usuario),
-                None,
-            )
-            if usuarios
-            else None
-        )
+        usuario = serv_auth.servicio_usuario.obtener_usuario_por_id(id_usuario)
 
-        if not usuario_clave:
-            logs.warning("No se encontro el usuario que se buscaba")
-            return jsonify({"success": False, "message": "Usuario no encotrado"}), 404
+        if not usuario:
+            return _usuario_no_encontrado()
 
-        decriptado = serv_auth.descifrar_password(str(usuario_clave["password"]))
+        decriptado = serv_auth.descifrar_password(usuario.password)
 
         logs.info("Se logro conseguir la contraseña desencriptada")
         return jsonify({"success": True, "password": decriptado})
 
+    except CifradoSaturado:
+        raise
     except Exception as err:
-        logs.error("Fallo desencriptar la contraseña", error=str(err), stack_info=True)
-        return jsonify({"success": False, "message": str(err)}), 500
+        return _respuesta_error("Fallo desencriptar la contraseña", err)
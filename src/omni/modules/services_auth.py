@@ -1,12 +1,29 @@
+import os
+import threading
+
 from flask import session
+from werkzeug.local import LocalProxy
 
 from omni.modules.logging import Logs
 from omni.modules.models import Usuario
-from omni.modules.config import Configuracion
-from omni.modules.database import BasedeDatos
-from omni.modules.services_user import ServicioUsuario
-
-from cryptography.fernet import Fernet
+from omni.modules.config import obtener_configuracion
+from omni.modules.cifrado import (
+    PoolCifrado,
+    cifrar,
+    descifrar,
+    obtener_pool_cifrado,
+    unir_claves,
+    verificar,
+)
+from omni.modules.database import BasedeDatos, EstadoEscritura, bd_actual
+from omni.modules.database_async import BasedeDatosAsync
+from omni.modules.services_user import (
+    ReconstructorFiltro,
+    ServicioUsuario,
+    ServicioUsuarioAsync,
+)
+
+from cryptography.fernet import Fernet, MultiFernet
 
 
 class ServicioAutenticacion:
@@ -21,27 +38,41 @@ class ServicioAutenticacion:
         iniciar_sesion(): Maneja el login
         verificar_sesion(): Comprueba sesión activa
 
+    Las operaciones con contraseñas (cifrar, verificar, descifrar) se
+    ejecutan en el PoolCifrado del proceso, no en el hilo de la petición.
+
+    Cifra con APP_KEY y descifra también con APP_PREVIOUS_KEYS, para rotar
+    la clave sin romper las contraseñas guardadas (ver omni.modules.rotacion).
+
     Attributes:
-        cypher (Fernet): Instancia para cifrado/descifrado
+        claves (str): Llavero de claves Fernet, la principal primero
+        cypher (MultiFernet): Instancia para cifrado/descifrado
+        pool_cifrado (PoolCifrado): Pool acotado para las operaciones con contraseñas
     """
 
     def __init__(self, bd: BasedeDatos) -> None:
         """Inicializa el servicio de autenticación con un logger, configuracion y servicio usuario"""
         self.__logs: Logs = Logs()
         self.__logs.debug("Servicio Auth inicializado")
-        self.__config = Configuracion().obtener_config_app()
+        self.__config = obtener_configuracion().obtener_config_app()
         self.servicio_usuario: ServicioUsuario = ServicioUsuario(bd)
 
         self.key: str = str(self.__config["Key"])
-        self.cypher: Fernet = Fernet(self.key.encode())
-
-    def registrar_usuario(self, nombre: str, password: str) -> dict[str, str | bool]:
+        self.claves: str = unir_claves(self.key, str(self.__config["PreviousKeys"]))
+        self.cypher: MultiFernet = MultiFernet(
+            [Fernet(clave.encode()) for clave in self.claves.split(",")]
+        )
+        self.pool_cifrado: PoolCifrado = obtener_pool_cifrado()
+
+    def registrar_usuario(
+        self, nombre: str, password: str
+    ) -> dict[str, str | bool | int]:
         """Registra un nuevo usuario en el sistema.
 
         Flujo:
-            1. Verifica si el usuario existe
-            2. Cifra la contraseña
-            3. Crea registro en la base de datos
+            1. Cifra la contraseña
+            2. Crea registro en la base de datos; la llave única de "nombre"
+               detecta si el usuario ya existe en la misma sentencia
 
         Args:
             nombre (str): Nombre único de usuario
@@ -49,28 +80,34 @@ class ServicioAutenticacion:
 
         Retorna:
             dict: Resultado con formato:
-                {"success": bool, "message": str}
+                {"success": bool, "message": str, "codigo": int}
 
-        Códigos de estado:
+        Códigos de estado ("codigo"):
             201: Registro exitoso
-            400: Datos inválidos
             409: Usuario ya existe
-        """
-        usuario_existente = self.servicio_usuario.obtener_usuarios_con_nombre(nombre)
+            500: Error de la base de datos
 
-        if usuario_existente:
-            return {"success": False, "message": "El usuario ya existe"}
-
-        password_encriptado = self.cypher.encrypt(password.encode()).decode()
+        Raises:
+            CifradoSaturado: Si el pool de cifrado está lleno
+        """
+        password_encriptado = self.cifrar_password(password)
         usuario_nuevo = Usuario(nombre=nombre, password=password_encriptado)
 
         try:
-            self.servicio_usuario.crear_usuario(usuario_nuevo)
-            self.__logs.info("Se registro un nuevo usuario")
-            return {"success": True, "message": "Usuario registrado correctamente"}
+            resultado = self.servicio_usuario.crear_usuario(usuario_nuevo)
         except Exception as err:
             self.__logs.error("Fallo registrar un nuevo usuario")
-            return {"success": False, "message": str(err)}
+            return {"success": False, "message": str(err), "codigo": 500}
+
+        if resultado.estado is EstadoEscritura.DUPLICADO:
+            return {"success": False, "message": "El usuario ya existe", "codigo": 409}
+
+        self.__logs.info("Se registro un nuevo usuario")
+        return {
+            "success": True,
+            "message": "Usuario registrado correctamente",
+            "codigo": 201,
+        }
 
     def iniciar_sesion(self, nombre: str, password: str) -> dict[str, str | bool]:
         """Valida credenciales y establece sesión de usuario.
@@ -86,6 +123,9 @@ class ServicioAutenticacion:
 
         Retorna:
             dict: Resultado de la operación con formato estandarizado
+
+        Raises:
+            CifradoSaturado: Si el pool de cifrado está lleno
         """
         self.__logs.info("Intento de ingreso", nombre=nombre)
         usuario = self.servicio_usuario.obtener_usuarios_con_nombre(nombre)
@@ -96,7 +136,7 @@ class ServicioAutenticacion:
             return {"success": False, "message": "Usuario no encontrado"}
 
         # Verifica que la Contraseña ingresada y del usuario sean igual
-        if self.descifrar_password(usuario.password) != password:
+        if not self.verificar_password(usuario.password, password):
             self.__logs.error("Se fallo el intento de ingreso")
             return {"success": False, "message": "Contraseña incorrecta"}
 
@@ -199,4 +239,204 @@ class ServicioAutenticacion:
             password_original = servicio.descifrar_password(token_cifrado)
         """
         self.__logs.info("Se esta descifrando la contraseña")
-        return self.cypher.decrypt(password_encriptado.encode()).decode()
+        return self.pool_cifrado.ejecutar(descifrar, self.claves, password_encriptado)
+
+    def cifrar_password(self, password: str) -> str:
+        """Cifra una contraseña en el pool de cifrado.
+
+        Raises:
+            CifradoSaturado: Si el pool de cifrado está lleno
+        """
+        return self.cifrar_passwords([password])[0]
+
+    def cifrar_passwords(self, passwords: list[str]) -> list[str]:
+        """Cifra varias contraseñas en una sola tarea del pool de cifrado.
+
+        Raises:
+            CifradoSaturado: Si el pool de cifrado está lleno
+        """
+        return self.pool_cifrado.ejecutar(cifrar, self.claves, passwords)
+
+    def verificar_password(self, password_encriptado: str, password: str) -> bool:
+        """Compara una contraseña con la guardada, en el pool de cifrado.
+
+        Raises:
+            CifradoSaturado: Si el pool de cifrado está lleno
+            cryptography.fernet.InvalidToken: Si el token es inválido o la clave incorrecta
+        """
+        return self.pool_cifrado.ejecutar(
+            verificar, self.claves, password_encriptado, password
+        )
+
+
+class ServicioAutenticacionAsync:
+    """Versión asíncrona del registro y el login de ServicioAutenticacion.
+
+    Comparte el Fernet y el servicio de usuarios (cache, filtro y canal) del
+    ServicioAutenticacion del proceso; solo las consultas a la base de datos
+    son asíncronas.
+
+    Attributes:
+        servicio (ServicioAutenticacion): Servicio síncrono del proceso
+        servicio_usuario (ServicioUsuarioAsync): Usuarios sobre BasedeDatosAsync
+    """
+
+    def __init__(self, servicio: ServicioAutenticacion, bd: BasedeDatosAsync) -> None:
+        """Inicializa el servicio sobre la base de datos asíncrona"""
+        self.__logs: Logs = Logs()
+        self.servicio: ServicioAutenticacion = servicio
+        self.servicio_usuario: ServicioUsuarioAsync = ServicioUsuarioAsync(
+            bd, servicio.servicio_usuario
+        )
+
+    async def registrar_usuario(
+        self, nombre: str, password: str
+    ) -> dict[str, str | bool | int]:
+        """Registra un nuevo usuario; ver ServicioAutenticacion.registrar_usuario()."""
+        password_encriptado = await self.cifrar_password(password)
+        usuario_nuevo = Usuario(nombre=nombre, password=password_encriptado)
+
+        try:
+            resultado = await self.servicio_usuario.crear_usuario(usuario_nuevo)
+        except Exception as err:
+            self.__logs.error("Fallo registrar un nuevo usuario")
+            return {"success": False, "message": str(err), "codigo": 500}
+
+        if resultado.estado is EstadoEscritura.DUPLICADO:
+            return {"success": False, "message": "El usuario ya existe", "codigo": 409}
+
+        self.__logs.info("Se registro un nuevo usuario")
+        return {
+            "success": True,
+            "message": "Usuario registrado correctamente",
+            "codigo": 201,
+        }
+
+    async def iniciar_sesion(self, nombre: str, password: str) -> dict[str, str | bool]:
+        """Valida credenciales y establece sesión, como la versión síncrona."""
+        self.__logs.info("Intento de ingreso", nombre=nombre)
+        usuario = await self.servicio_usuario.obtener_usuarios_con_nombre(nombre)
+
+        if not usuario:
+            self.__logs.warning("No se encontro el usuario")
+            return {"success": False, "message": "Usuario no encontrado"}
+
+        if not await self.servicio.pool_cifrado.ejecutar_async(
+            verificar, self.servicio.claves, usuario.password, password
+        ):
+            self.__logs.error("Se fallo el intento de ingreso")
+            return {"success": False, "message": "Contraseña incorrecta"}
+
+        session["usuario_id"] = usuario.id
+        session["usuario_nombre"] = usuario.nombre
+
+        return {"success": True, "message": "Inicio se sesión exitosa"}
+
+    async def descifrar_password(self, password_encriptado: str) -> str:
+        """Convierte una contraseña cifrada a texto legible, en el pool de cifrado."""
+        return await self.servicio.pool_cifrado.ejecutar_async(
+            descifrar, self.servicio.claves, password_encriptado
+        )
+
+    async def cifrar_password(self, password: str) -> str:
+        """Cifra una contraseña en el pool de cifrado sin bloquear el bucle."""
+        cifradas = await self.servicio.pool_cifrado.ejecutar_async(
+            cifrar, self.servicio.claves, [password]
+        )
+        return cifradas[0]
+
+
+_servicio_auth: ServicioAutenticacion | None = None
+_servicio_auth_async: ServicioAutenticacionAsync | None = None
+_reconstructor: ReconstructorFiltro | None = None
+_candado = threading.Lock()
+
+
+def obtener_servicio_auth() -> ServicioAutenticacion:
+    """Retorna el servicio de autenticación del proceso, creándolo en el primer uso.
+
+    El servicio (y su Fernet) se crea dentro de cada worker y no al importar
+    las rutas, y usa el BasedeDatos de la petición en curso (bd_actual).
+
+    Retorna:
+        ServicioAutenticacion: Servicio compartido por los hilos del proceso
+    """
+    global _servicio_auth
+
+    if _servicio_auth is None:
+        with _candado:
+            if _servicio_auth is None:
+                _servicio_auth = ServicioAutenticacion(bd_actual)
+
+    return _servicio_auth
+
+
+def obtener_servicio_auth_async() -> ServicioAutenticacionAsync:
+    """Retorna el servicio de autenticación asíncrono del proceso.
+
+    Se crea en el primer uso sobre obtener_servicio_auth() y un
+    BasedeDatosAsync compartido por todas las peticiones.
+
+    Retorna:
+        ServicioAutenticacionAsync: Servicio compartido por los hilos del proceso
+
+    Raises:
+        RuntimeError: Si aiomysql no está instalado (pip install omni[async])
+    """
+    global _servicio_auth_async
+
+    if _servicio_auth_async is None:
+        servicio = obtener_servicio_auth()
+        with _candado:
+            if _servicio_auth_async is None:
+                _servicio_auth_async = ServicioAutenticacionAsync(
+                    servicio, BasedeDatosAsync()
+                )
+
+    return _servicio_auth_async
+
+
+def iniciar_reconstruccion_filtro() -> None:
+    """Inicia, una vez por proceso, el hilo que mantiene el filtro de nombres.
+
+    Se llama al crear la aplicación en cada worker (crear_app()) o al
+    iniciar el servidor de desarrollo; sin filtro (USER_FILTER_REBUILD=0)
+    no hace nada.
+    """
+    global _reconstructor
+
+    servicio = obtener_servicio_auth().servicio_usuario
+    if servicio.filtro_nombres is None:
+        return
+
+    with _candado:
+        if _reconstructor is None:
+            _reconstructor = ReconstructorFiltro(servicio)
+            _reconstructor.start()
+
+
+def _reiniciar_en_hijo() -> None:
+    """Olvida los servicios heredados tras un fork para crearlos dentro del hijo.
+
+    El hilo de ReconstructorFiltro no existe en el hijo; cada worker inicia
+    el suyo con iniciar_reconstruccion_filtro().
+    """
+    global _servicio_auth, _servicio_auth_async, _reconstructor, _candado
+    _servicio_auth = None
+    _servicio_auth_async = None
+    _reconstructor = None
+    _candado = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reiniciar_en_hijo)
+
+servicio_auth: ServicioAutenticacion = LocalProxy(obtener_servicio_auth)  # type: ignore[assignment]
+"""Proxy al servicio de autenticación del proceso
+
+Ejemplo de uso:
+from omni.modules.services_auth import servicio_auth
+servicio_auth.iniciar_sesion(nombre, password)
+"""
+
+servicio_auth_async: ServicioAutenticacionAsync = LocalProxy(obtener_servicio_auth_async)  # type: ignore[assignment]
+"""Proxy al servicio de autenticación asíncrono del proceso (DB_ASYNC)"""
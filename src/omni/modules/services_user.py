@@ -1,6 +1,21 @@
+import threading
+from collections.abc import Callable, Iterator
+
 from omni.modules.logging import Logs
 from omni.modules.models import Usuario
-from omni.modules.database import BasedeDatos
+from omni.modules.config import obtener_configuracion
+from omni.modules.database import BasedeDatos, ResultadoEscritura
+from omni.modules.database_async import BasedeDatosAsync
+from omni.modules.cache_usuarios import CacheUsuarios
+from omni.modules.invalidacion import (
+    CanalInvalidacion,
+    claves_invalidacion,
+    obtener_canal_invalidacion,
+)
+from omni.modules.filtro_nombres import FiltroNombres
+
+CAMPOS_USUARIO: tuple[str, ...] = ("id", "nombre", "password")
+"""Columnas de la tabla usuario que se pueden proyectar"""
 
 
 class ServicioUsuario:
@@ -12,22 +27,162 @@ class ServicioUsuario:
 
     Métodos Principales:
         crear_usuario(): Inserta nuevo usuario
+        crear_usuarios(): Inserta varios usuarios con INSERT de varias filas
         obtener_usuarios(): Lista todos los usuarios
+        obtener_pagina_usuarios(): Lista una página de usuarios por cursor keyset
+        iterar_usuarios(): Recorre todos los usuarios sin cargarlos en memoria
+        obtener_usuario_por_id(): Busca un usuario por llave primaria
         actualizar_usuario(): Modifica datos de usuario
+        actualizar_usuarios(): Modifica varios usuarios en una transacción
+        borrar_usuario_por_id(): Elimina un usuario por llave primaria
+        borrar_usuarios_por_id(): Elimina varios usuarios con DELETE ... IN
 
     Attributes:
         bd (BasedeDatos): Instancia de conexión a DB
+        filtro_nombres (FiltroNombres|None): Nombres existentes, para responder
+            sin consultar cuando un nombre no existe (None si está desactivado)
+        cache (CacheUsuarios|None): Usuarios leídos por nombre o id (None si
+            está desactivada)
+        canal (CanalInvalidacion|None): Avisa de las escrituras a los demás
+            workers para que descarten sus copias (None sin cache ni filtro)
     """
 
     def __init__(self, bd: BasedeDatos) -> None:
         """Inicializa el servicio de usuario con una base de datos y un logger"""
         self.bd: BasedeDatos = bd
         self.__logs = Logs()
+
+        config_filtro = obtener_configuracion().obtener_config_filtro()
+        config_cache = obtener_configuracion().obtener_config_cache()
+
+        self.canal: CanalInvalidacion | None = (
+            obtener_canal_invalidacion()
+            if config_filtro["Rebuild"] > 0 or float(config_cache["Size"]) > 0
+            else None
+        )
+        self.filtro_nombres: FiltroNombres | None = (
+            FiltroNombres(
+                config_filtro["Rebuild"], config_filtro["ErrorRate"], self.canal
+            )
+            if config_filtro["Rebuild"] > 0
+            else None
+        )
+        self.cache: CacheUsuarios | None = (
+            CacheUsuarios(
+                int(config_cache["Size"]), float(config_cache["Ttl"]), self.canal
+            )
+            if float(config_cache["Size"]) > 0
+            else None
+        )
+
         self.__logs.debug("Servicio de usuarios inicializado")
 
-    def crear_usuario(self, usuario: Usuario):
+    def reconstruir_filtro(self, bd: BasedeDatos) -> bool:
+        """Reconstruye el filtro de nombres si venció, leyendo la tabla con "bd".
+
+        La llama ReconstructorFiltro desde su propio hilo y con su propia
+        conexión, nunca una petición. Si falla se conserva el filtro anterior.
+
+        Args:
+            bd (BasedeDatos): Manejador propio del hilo que reconstruye
+
+        Retorna:
+            bool: True si el filtro se reconstruyó
+        """
+        if self.filtro_nombres is None:
+            return False
+
+        def cargar() -> tuple[int, Iterator[str]]:
+            total = bd.contar("usuario")
+            filas = bd.leer_flujo("usuario", campos=["nombre"], orden="id")
+            return total, (str(fila["nombre"]) for fila in filas)
+
+        try:
+            reconstruido = self.filtro_nombres.reconstruir_si_vencido(cargar)
+        except Exception:
+            self.__logs.exception("No se pudo construir el filtro de nombres")
+            return False
+
+        if reconstruido:
+            self.__logs.info(
+                "Se reconstruyo el filtro de nombres",
+                **self.filtro_nombres.estadisticas(),
+            )
+        return reconstruido
+
+    def invalidar(
+        self,
+        id_usuario: int | None = None,
+        nombre: str | None = None,
+        nuevo: str | None = None,
+    ) -> None:
+        """Descarta copias de un usuario tras una escritura confirmada.
+
+        También la usa ServicioUsuarioAsync, que comparte cache, filtro y canal.
+
+        Args:
+            id_usuario (int|None): Id del usuario modificado o eliminado
+            nombre (str|None): Nombre del usuario modificado o eliminado
+            nuevo (str|None): Nombre creado (alta o renombre)
+        """
+        self.__invalidar_muchos(
+            [] if id_usuario is None else [id_usuario],
+            [] if nombre is None else [nombre],
+            [] if nuevo is None else [nuevo],
+        )
+
+    def __invalidar_muchos(
+        self, ids: list[int], nombres: list[str], nuevos: list[str]
+    ) -> None:
+        """Como invalidar(), con una sola publicación para todo un lote."""
+        if not (ids or nombres or nuevos):
+            return
+
+        if self.cache is not None:
+            self.cache.invalidar_muchos(ids, nombres)
+
+        altas = None
+        if self.canal is not None:
+            claves = [clave for id_ in ids for clave in claves_invalidacion(id_)]
+            for nombre in nombres + nuevos:
+                claves += claves_invalidacion(nombre=nombre)
+            altas = self.canal.publicar(claves, alta=bool(nuevos))
+
+        if self.filtro_nombres is not None:
+            for nuevo in nuevos:
+                self.filtro_nombres.agregar(nuevo, altas)
+
+    def puede_existir(self, nombre: str) -> bool:
+        """Consulta el filtro de nombres sin tocar la base de datos.
+
+        Mientras ReconstructorFiltro no lo haya construido (o si está
+        desactivado), todo nombre puede existir y se consulta como siempre.
+        """
+        if self.filtro_nombres is None:
+            return True
+
+        return self.filtro_nombres.puede_existir(nombre)
+
+    def validar_campos(self, campos: list[str] | None) -> list[str]:
+        """Valida una proyección de columnas de la tabla usuario.
+
+        Raises:
+            ValueError: Si se pide un campo que no existe en la tabla
+        """
+        campos = list(campos or CAMPOS_USUARIO)
+
+        invalidos = [campo for campo in campos if campo not in CAMPOS_USUARIO]
+        if invalidos:
+            raise ValueError(f"Campos invalidos: {', '.join(invalidos)}")
+
+        return campos
+
+    def crear_usuario(self, usuario: Usuario) -> ResultadoEscritura:
         """Crea un nuevo usuario en la base de datos.
 
+        La llave única de "nombre" detecta los duplicados en el mismo INSERT,
+        sin consultar antes si el nombre existe.
+
         Args:
             usuario (Usuario): Objeto Usuario con datos requeridos
 
@@ -36,6 +191,10 @@ class ServicioUsuario:
             2. Ejecuta INSERT en la base de datos
             3. Registra operación en logs
 
+        Returns:
+            ResultadoEscritura: EXITO con el id generado, o DUPLICADO si el
+                nombre ya existe
+
         Raises:
             ValueError: Si faltan campos obligatorios
             DatabaseError: Si falla la operación SQL
@@ -45,8 +204,56 @@ class ServicioUsuario:
             "nombre": usuario.nombre,
             "password": usuario.password,
         }
-        self.bd.crear("usuario", datos_usuario)
-        self.__logs.info("Se creo el usuario exitosamente", id=usuario.id)
+        resultado = self.bd.crear("usuario", datos_usuario)
+
+        if not resultado.exito:
+            self.__logs.warning("El usuario ya existe", nombre=usuario.nombre)
+            return resultado
+
+        self.invalidar(nombre=usuario.nombre, nuevo=usuario.nombre)
+
+        self.__logs.info("Se creo el usuario exitosamente", id=resultado.id_generado)
+        return resultado
+
+    def crear_usuarios(
+        self, usuarios: list[Usuario], tamano_lote: int = 500
+    ) -> list[ResultadoEscritura]:
+        """Crea varios usuarios con un INSERT de varias filas por lote.
+
+        Args:
+            usuarios (list[Usuario]): Usuarios a crear (contraseñas ya cifradas)
+            tamano_lote (int): Usuarios por sentencia INSERT
+
+        Returns:
+            list[ResultadoEscritura]: Un resultado por usuario, en el mismo
+                orden: EXITO con el id generado o DUPLICADO si el nombre existe
+
+        Raises:
+            DatabaseError: Si falla la operación SQL; no se crea ningún usuario
+
+        Ejemplo:
+            servicio.crear_usuarios([Usuario(nombre="ana", password="***")])
+        """
+        self.__logs.info("Se estan creando usuarios en lote", total=len(usuarios))
+        resultados = self.bd.crear_muchos(
+            "usuario",
+            [
+                {"nombre": usuario.nombre, "password": usuario.password}
+                for usuario in usuarios
+            ],
+            llave="nombre",
+            tamano_lote=tamano_lote,
+        )
+
+        creados = [
+            usuario.nombre
+            for usuario, resultado in zip(usuarios, resultados)
+            if resultado.exito
+        ]
+        self.__invalidar_muchos([], creados, creados)
+
+        self.__logs.info("Se crearon usuarios en lote", creados=len(creados))
+        return resultados
 
     def obtener_usuarios(self) -> list[Usuario]:
         """Obtiene todos los usuarios registrados
@@ -84,9 +291,104 @@ class ServicioUsuario:
         self.__logs.info("Se obtuvieron exitosamente los usuarios")
         return usuarios or []
 
+    def obtener_pagina_usuarios(
+        self,
+        limite: int,
+        despues_de: int | None = None,
+        campos: list[str] | None = None,
+        prefijo: str | None = None,
+    ) -> list[dict[str, str | int]]:
+        """Obtiene una página de usuarios ordenada por id
+
+        La página empieza después del id "despues_de", así que cada página cuesta
+        lo mismo sin importar cuántos usuarios existan antes de ella.
+
+        Args:
+            limite (int): Máximo de usuarios en la página
+            despues_de (int|None): Último id de la página anterior
+            campos (list[str]|None): Columnas a retornar (default: CAMPOS_USUARIO).
+                El id siempre se incluye para poder pedir la siguiente página.
+            prefijo (str|None): Filtra usuarios cuyo nombre empieza con el prefijo
+
+        Returns:
+            list[dict]: Usuarios de la página con solo los campos pedidos
+
+        Raises:
+            ValueError: Si se pide un campo que no existe en la tabla
+
+        Ejemplo:
+            pagina = servicio.obtener_pagina_usuarios(50, despues_de=120, campos=["nombre"])
+        """
+        campos = self.validar_campos(campos)
+
+        if "id" not in campos:
+            campos.insert(0, "id")
+
+        self.__logs.info("Se esta consiguiendo una pagina de usuarios", limite=limite)
+        resultados = self.bd.leer(
+            "usuario",
+            campos=campos,
+            prefijos={"nombre": prefijo} if prefijo else None,
+            orden="id",
+            despues_de=despues_de,
+            limite=limite,
+        )
+
+        return [
+            dict(resultado) for resultado in resultados if isinstance(resultado, dict)
+        ]
+
+    def iterar_usuarios(
+        self, campos: list[str] | None = None, tamano_lote: int = 500
+    ) -> Iterator[dict[str, str | int]]:
+        """Recorre todos los usuarios ordenados por id, uno a la vez
+
+        Las filas llegan directamente del cursor sin buffer de la base de datos,
+        sin copiarse a listas intermedias.
+
+        Args:
+            campos (list[str]|None): Columnas a retornar (default: CAMPOS_USUARIO)
+            tamano_lote (int): Filas leídas del servidor por lote
+
+        Returns:
+            Iterator[dict]: Usuarios con solo los campos pedidos
+
+        Raises:
+            ValueError: Si se pide un campo que no existe en la tabla
+
+        Ejemplo:
+            for usuario in servicio.iterar_usuarios(["id", "nombre"]):
+                ...
+        """
+        campos = self.validar_campos(campos)
+
+        self.__logs.info("Se estan recorriendo los usuarios")
+        return self.bd.leer_flujo(
+            "usuario", campos=campos, orden="id", tamano_lote=tamano_lote
+        )
+
+    def contar_usuarios(self, prefijo: str | None = None) -> int:
+        """Cuenta los usuarios registrados
+
+        Args:
+            prefijo (str|None): Cuenta solo usuarios cuyo nombre empieza con el prefijo
+
+        Returns:
+            int: Número de usuarios
+
+        Ejemplo:
+            total = servicio.contar_usuarios("adm")
+        """
+        return self.bd.contar(
+            "usuario", prefijos={"nombre": prefijo} if prefijo else None
+        )
+
     def obtener_usuarios_con_nombre(self, nombre: str) -> Usuario | None:
         """Busca usuario por nombre exacto.
 
+        Si el filtro de nombres descarta el nombre, retorna None sin consultar
+        la base de datos; si el usuario está en la cache, lo retorna de ahí.
+
         Args:
             nombre (str): Nombre a buscar (case-sensitive)
 
@@ -96,6 +398,16 @@ class ServicioUsuario:
         Ejemplo:
             obtener_usuarios_con_nombre("admin")
         """
+        if not self.puede_existir(nombre):
+            self.__logs.debug("El filtro descarto el usuario", nombre=nombre)
+            return None
+
+        if self.cache is not None:
+            usuario = self.cache.obtener_por_nombre(nombre)
+            if usuario is not None:
+                return usuario
+            marca = self.cache.marca()
+
         self.__logs.info("Se esta consiguiendo el usuario", nombre=nombre)
         resultados = self.bd.leer("usuario", {"nombre": nombre})
 
@@ -107,28 +419,77 @@ class ServicioUsuario:
 
         if isinstance(resultado, dict):
             self.__logs.info("Se logro conseguir el usuario", nombre=nombre)
-            return Usuario(
+            usuario = Usuario(
                 id=int(str(resultado["id"])),
                 nombre=str(resultado["nombre"]),
                 password=str(resultado["password"]),
             )
 
+            if self.cache is not None:
+                self.cache.guardar(usuario, marca, nombre)
+
+            return usuario
+
         self.__logs.error("No se pudo conseguir el usuario", nombre=nombre)
         return None
 
+    def obtener_usuario_por_id(self, id_usuario: int) -> Usuario | None:
+        """Busca usuario por su llave primaria.
+
+        Usa la búsqueda indexada "WHERE id = %s" en lugar de recorrer la tabla,
+        o la cache si el usuario ya fue leído.
+
+        Args:
+            id_usuario (int): ID del usuario a buscar
+
+        Retorna:
+            Usuario | None: Objeto Usuario si se encuentra, None en caso contrario
+
+        Ejemplo:
+            obtener_usuario_por_id(5)
+        """
+        if self.cache is not None:
+            usuario = self.cache.obtener_por_id(id_usuario)
+            if usuario is not None:
+                return usuario
+            marca = self.cache.marca()
+
+        self.__logs.info("Se esta consiguiendo el usuario", user_id=id_usuario)
+        resultados = self.bd.leer("usuario", {"id": id_usuario})
+
+        if resultados and isinstance(resultados[0], dict):
+            self.__logs.info("Se logro conseguir el usuario", user_id=id_usuario)
+            resultado = resultados[0]
+            usuario = Usuario(
+                id=int(str(resultado["id"])),
+                nombre=str(resultado["nombre"]),
+                password=str(resultado["password"]),
+            )
+
+            if self.cache is not None:
+                self.cache.guardar(usuario, marca)
+
+            return usuario
+
+        self.__logs.error("No se pudo conseguir el usuario", user_id=id_usuario)
+        return None
+
     def actualizar_usuario(
         self, nombre: str, datos_actualizados: dict[str, str]
-    ) -> int:
+    ) -> ResultadoEscritura:
         """Actualiza los datos de un usuario existente
 
-        Modifica los campos especificados de un usuario en la base de datos.
+        Modifica los campos especificados con un solo UPDATE, sin leer antes
+        el registro: la base de datos indica si el usuario no existe o si el
+        nombre nuevo ya está en uso.
 
         Args:
             nombre (str): Nombre del usuario a actualizar
             datos_actualizados (dict[str, str]): Campos y valores nuevos a modificar
 
         Returns:
-            int: Número de registros actualizados. 0 si no se realizaron cambios.
+            ResultadoEscritura: EXITO, NO_ENCONTRADO si el usuario no existe o
+                DUPLICADO si el nombre nuevo pertenece a otro usuario
 
         Raises:
             DatabaseError: Si falla la operación de actualización
@@ -137,12 +498,50 @@ class ServicioUsuario:
             servicio.actualizar_usuario("admin", {"password": "nueva_clave"})
         """
         self.__logs.info("se esta intentando actualizar el usuario", nombre=nombre)
-        usuario = self.obtener_usuarios_con_nombre(nombre)
+        resultado = self.bd.actualizar(
+            "usuario", datos_actualizados, {"nombre": nombre}
+        )
 
-        if not usuario:
-            return 0
+        if resultado.exito:
+            nuevo = datos_actualizados.get("nombre")
+            self.invalidar(nombre=nombre, nuevo=nuevo if nuevo != nombre else None)
 
-        return self.bd.actualizar("usuario", datos_actualizados, {"nombre": nombre})
+        return resultado
+
+    def actualizar_usuarios(
+        self, cambios: list[tuple[str, dict[str, str]]]
+    ) -> list[ResultadoEscritura]:
+        """Actualiza varios usuarios en una sola conexión y transacción.
+
+        Args:
+            cambios (list[tuple]): Pares (nombre actual, campos nuevos) como
+                en actualizar_usuario()
+
+        Returns:
+            list[ResultadoEscritura]: Un resultado por cambio, en el mismo orden
+
+        Raises:
+            DatabaseError: Si falla la operación; no se aplica ningún cambio
+
+        Ejemplo:
+            servicio.actualizar_usuarios([("ana", {"password": "***"})])
+        """
+        self.__logs.info("Se estan actualizando usuarios en lote", total=len(cambios))
+        resultados = self.bd.actualizar_muchos(
+            "usuario",
+            [(datos, {"nombre": nombre}) for nombre, datos in cambios],
+        )
+
+        nombres: list[str] = []
+        nuevos: list[str] = []
+        for (nombre, datos), resultado in zip(cambios, resultados):
+            if resultado.exito:
+                nombres.append(nombre)
+                if datos.get("nombre", nombre) != nombre:
+                    nuevos.append(datos["nombre"])
+        self.__invalidar_muchos([], nombres, nuevos)
+
+        return resultados
 
     def borrar_usuario(self, nombre: str) -> int:
         """Elimina un usuario del sistema
@@ -162,4 +561,285 @@ class ServicioUsuario:
             servicio.borrar_usuario("usuario_inactivo")
         """
         self.__logs.info("Se logro eliminar el usuario", nombre=nombre)
-        return self.bd.eliminar("usuario", {"nombre": nombre})
+        filas = self.bd.eliminar("usuario", {"nombre": nombre})
+
+        self.invalidar(nombre=nombre)
+
+        return filas
+
+    def borrar_usuario_por_id(self, id_usuario: int) -> int:
+        """Elimina un usuario por su llave primaria
+
+        Ejecuta un solo "DELETE ... WHERE id = %s" sin leer antes el registro.
+
+        Args:
+            id_usuario (int): ID del usuario a eliminar
+
+        Returns:
+            int: Número de registros eliminados. 0 si el usuario no existe.
+
+        Raises:
+            DatabaseError: Si falla la operación de eliminación
+
+        Ejemplo:
+            servicio.borrar_usuario_por_id(5)
+        """
+        self.__logs.info("Se esta eliminando el usuario", user_id=id_usuario)
+        filas = self.bd.eliminar("usuario", {"id": id_usuario})
+
+        self.invalidar(id_usuario)
+
+        return filas
+
+    def borrar_usuarios_por_id(
+        self, ids: list[int], tamano_lote: int = 500
+    ) -> list[ResultadoEscritura]:
+        """Elimina varios usuarios con un "DELETE ... WHERE id IN (...)" por lote.
+
+        Args:
+            ids (list[int]): IDs de los usuarios a eliminar
+            tamano_lote (int): IDs por sentencia DELETE
+
+        Returns:
+            list[ResultadoEscritura]: Un resultado por id, en el mismo orden:
+                EXITO o NO_ENCONTRADO
+
+        Raises:
+            DatabaseError: Si falla la operación; no se elimina ningún usuario
+
+        Ejemplo:
+            servicio.borrar_usuarios_por_id([3, 5, 8])
+        """
+        self.__logs.info("Se estan eliminando usuarios en lote", total=len(ids))
+        resultados = self.bd.eliminar_muchos("usuario", "id", ids, tamano_lote)
+
+        self.__invalidar_muchos(
+            [id_ for id_, resultado in zip(ids, resultados) if resultado.exito], [], []
+        )
+
+        return resultados
+
+
+def _usuario_de_fila(fila: dict) -> Usuario:
+    """Usuario a partir de una fila completa de la tabla usuario."""
+    return Usuario(
+        id=int(str(fila["id"])),
+        nombre=str(fila["nombre"]),
+        password=str(fila["password"]),
+    )
+
+
+class ReconstructorFiltro(threading.Thread):
+    """Hilo daemon que mantiene al día el filtro de nombres de un worker.
+
+    Construye el filtro al iniciar y lo reconstruye cuando vence (ver
+    FiltroNombres.vencido()), con su propio BasedeDatos; la conexión vuelve
+    al pool después de cada reconstrucción. Así ninguna petición paga la
+    lectura de la tabla completa. Si la base de datos no responde, el error
+    se registra y se reintenta en la siguiente revisión.
+
+    Atributos:
+        servicio (ServicioUsuario): Servicio dueño del filtro
+        espera (float): Segundos entre revisiones de vencimiento
+    """
+
+    def __init__(
+        self,
+        servicio: ServicioUsuario,
+        crear_bd: Callable[[], BasedeDatos] | None = None,
+    ) -> None:
+        """Prepara el hilo; se inicia con start().
+
+        Args:
+            servicio (ServicioUsuario): Servicio dueño del filtro
+            crear_bd (Callable|None): Crea el BasedeDatos del hilo; por defecto
+                uno que lanza el error de conexión en vez de terminar el proceso
+        """
+        super().__init__(name="omni-filtro-nombres", daemon=True)
+        self.__logs = Logs()
+        self.servicio: ServicioUsuario = servicio
+        intervalo = servicio.filtro_nombres.intervalo if servicio.filtro_nombres else 0
+        self.espera: float = max(1.0, intervalo / 10)
+        self.__crear_bd = crear_bd or (lambda: BasedeDatos(salir_si_falla=False))
+        self.__detener = threading.Event()
+
+    def run(self) -> None:
+        """Revisa el filtro hasta que se llame a detener()."""
+        bd: BasedeDatos | None = None
+
+        while True:
+            if self.servicio.filtro_nombres and self.servicio.filtro_nombres.vencido():
+                try:
+                    # Conectar antes evita que una caída cuente como intento
+                    # del filtro: se reintenta en la siguiente revisión
+                    bd = bd or self.__crear_bd()
+                    bd.conectar()
+                    self.servicio.reconstruir_filtro(bd)
+                except Exception:
+                    self.__logs.exception("No se pudo reconstruir el filtro de nombres")
+                finally:
+                    if bd is not None:
+                        bd.desconectar()
+
+            if self.__detener.wait(self.espera):
+                return
+
+    def detener(self) -> None:
+        """Pide al hilo que termine tras la revisión en curso."""
+        self.__detener.set()
+
+
+class ServicioUsuarioAsync:
+    """Versión asíncrona de las operaciones de ServicioUsuario por registro.
+
+    Usa un BasedeDatosAsync y comparte con el ServicioUsuario del proceso su
+    filtro de nombres, su cache y su canal de invalidación, así que las
+    escrituras de las vistas síncronas y asíncronas se ven entre sí.
+
+    Attributes:
+        bd (BasedeDatosAsync): Base de datos asíncrona
+        servicio (ServicioUsuario): Servicio síncrono con cache, filtro y canal
+    """
+
+    def __init__(self, bd: BasedeDatosAsync, servicio: ServicioUsuario) -> None:
+        """Inicializa el servicio sobre la base de datos asíncrona"""
+        self.bd: BasedeDatosAsync = bd
+        self.servicio: ServicioUsuario = servicio
+        self.__logs = Logs()
+
+    async def crear_usuario(self, usuario: Usuario) -> ResultadoEscritura:
+        """Crea un nuevo usuario; ver ServicioUsuario.crear_usuario()."""
+        self.__logs.info("Se esta creando un nuevo usuario:", nombre=usuario.nombre)
+        resultado = await self.bd.crear(
+            "usuario", {"nombre": usuario.nombre, "password": usuario.password}
+        )
+
+        if not resultado.exito:
+            self.__logs.warning("El usuario ya existe", nombre=usuario.nombre)
+            return resultado
+
+        self.servicio.invalidar(nombre=usuario.nombre, nuevo=usuario.nombre)
+
+        self.__logs.info("Se creo el usuario exitosamente", id=resultado.id_generado)
+        return resultado
+
+    async def obtener_pagina_usuarios(
+        self,
+        limite: int,
+        despues_de: int | None = None,
+        campos: list[str] | None = None,
+        prefijo: str | None = None,
+    ) -> list[dict[str, str | int]]:
+        """Una página de usuarios; ver ServicioUsuario.obtener_pagina_usuarios().
+
+        Raises:
+            ValueError: Si se pide un campo que no existe en la tabla
+        """
+        campos = self.servicio.validar_campos(campos)
+
+        if "id" not in campos:
+            campos.insert(0, "id")
+
+        self.__logs.info("Se esta consiguiendo una pagina de usuarios", limite=limite)
+        return await self.bd.leer(
+            "usuario",
+            campos=campos,
+            prefijos={"nombre": prefijo} if prefijo else None,
+            orden="id",
+            despues_de=despues_de,
+            limite=limite,
+        )
+
+    async def contar_usuarios(self, prefijo: str | None = None) -> int:
+        """Cuenta los usuarios; ver ServicioUsuario.contar_usuarios()."""
+        return await self.bd.contar(
+            "usuario", prefijos={"nombre": prefijo} if prefijo else None
+        )
+
+    async def obtener_usuarios_con_nombre(self, nombre: str) -> Usuario | None:
+        """Busca usuario por nombre exacto, con el filtro y la cache compartidos.
+
+        Retorna:
+            Usuario | None: Objeto Usuario si se encuentra, None en caso contrario
+        """
+        if not self.servicio.puede_existir(nombre):
+            self.__logs.debug("El filtro descarto el usuario", nombre=nombre)
+            return None
+
+        cache = self.servicio.cache
+        if cache is not None:
+            usuario = cache.obtener_por_nombre(nombre)
+            if usuario is not None:
+                return usuario
+            marca = cache.marca()
+
+        self.__logs.info("Se esta consiguiendo el usuario", nombre=nombre)
+        resultados = await self.bd.leer("usuario", {"nombre": nombre})
+
+        if not resultados:
+            self.__logs.error("No se pudo conseguir el usuario", nombre=nombre)
+            return None
+
+        usuario = _usuario_de_fila(resultados[0])
+        if cache is not None:
+            cache.guardar(usuario, marca, nombre)
+
+        self.__logs.info("Se logro conseguir el usuario", nombre=nombre)
+        return usuario
+
+    async def obtener_usuario_por_id(self, id_usuario: int) -> Usuario | None:
+        """Busca usuario por su llave primaria, con la cache compartida.
+
+        Retorna:
+            Usuario | None: Objeto Usuario si se encuentra, None en caso contrario
+        """
+        cache = self.servicio.cache
+        if cache is not None:
+            usuario = cache.obtener_por_id(id_usuario)
+            if usuario is not None:
+                return usuario
+            marca = cache.marca()
+
+        self.__logs.info("Se esta consiguiendo el usuario", user_id=id_usuario)
+        resultados = await self.bd.leer("usuario", {"id": id_usuario})
+
+        if not resultados:
+            self.__logs.error("No se pudo conseguir el usuario", user_id=id_usuario)
+            return None
+
+        usuario = _usuario_de_fila(resultados[0])
+        if cache is not None:
+            cache.guardar(usuario, marca)
+
+        self.__logs.info("Se logro conseguir el usuario", user_id=id_usuario)
+        return usuario
+
+    async def actualizar_usuario(
+        self, nombre: str, datos_actualizados: dict[str, str]
+    ) -> ResultadoEscritura:
+        """Actualiza un usuario; ver ServicioUsuario.actualizar_usuario()."""
+        self.__logs.info("se esta intentando actualizar el usuario", nombre=nombre)
+        resultado = await self.bd.actualizar(
+            "usuario", datos_actualizados, {"nombre": nombre}
+        )
+
+        if resultado.exito:
+            nuevo = datos_actualizados.get("nombre")
+            self.servicio.invalidar(
+                nombre=nombre, nuevo=nuevo if nuevo != nombre else None
+            )
+
+        return resultado
+
+    async def borrar_usuario_por_id(self, id_usuario: int) -> int:
+        """Elimina un usuario por su llave primaria.
+
+        Returns:
+            int: Número de registros eliminados. 0 si el usuario no existe.
+        """
+        self.__logs.info("Se esta eliminando el usuario", user_id=id_usuario)
+        filas = await self.bd.eliminar("usuario", {"id": id_usuario})
+
+        self.servicio.invalidar(id_usuario)
+
+        return filas
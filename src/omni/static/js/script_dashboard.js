@@ -35,57 +35,90 @@ document.addEventListener("DOMContentLoaded", function() {
         return;
     }
 
-    // Se asegura que ciertas cosas pasen solo si se puede verificar la sesión
-    function cargarUsuarios() {
-        fetch(`/api/users?timestamp=${Date.now()}`, {
-            method: "GET",
-            credentials: "include"
-        }).then(response => {
-            if (!response.ok) throw new Error("HTTP error " + response.status);
-            return response.json();
-        }).then(data => {
-            if (data.success && userTableBody) {
-                userTableBody.innerHTML = "";
+    // Boton para pedir la siguiente pagina de usuarios
+    const loadMoreBtn = document.createElement('button');
+    loadMoreBtn.className = "btn btn-more";
+    loadMoreBtn.textContent = "Cargar más";
+    loadMoreBtn.style.display = "none";
+    userTableBody.closest('table').after(loadMoreBtn);
 
-                data.usuarios.forEach((usuario, index) => {
-                    const row = document.createElement('tr');
-                    const passwordLength = Math.max(8, Math.min(22, Math.floor(usuario.password.length / 4))) / 2;
+    const PASSWORD_MASK_LENGTH = 8;
+    const PAGE_SIZE = 100;
+    let siguienteId = null;
+    let filasCargadas = 0;
 
-                    const cells = Array.from({ length: 5 }, () => document.createElement('td'));
+    // Agrega una pagina de usuarios al final de la tabla
+    function agregarUsuarios(usuarios) {
+        const fragment = document.createDocumentFragment();
 
-                    cells[0].textContent = index + 1;
-                    cells[1].textContent = usuario.id;
-                    cells[2].textContent = usuario.nombre;
+        usuarios.forEach(usuario => {
+            const row = document.createElement('tr');
+            const cells = Array.from({ length: 5 }, () => document.createElement('td'));
 
-                    const passwordSpan = document.createElement('span');
-                    passwordSpan.className = "password-mask";
-                    passwordSpan.dataset.originalLength = passwordLength;
-                    passwordSpan.textContent = "*".repeat(passwordLength);
+            filasCargadas += 1;
+            cells[0].textContent = filasCargadas;
+            cells[1].textContent = usuario.id;
+            cells[2].textContent = usuario.nombre;
 
-                    const eyeBtn = document.createElement('button');
-                    eyeBtn.className = "btn btn-eye";
-                    eyeBtn.dataset.id = usuario.id;
-                    eyeBtn.dataset.visible = "false";
-                    eyeBtn.dataset.timeout = "";
-                    eyeBtn.textContent = "👁️";
+            const passwordSpan = document.createElement('span');
+            passwordSpan.className = "password-mask";
+            passwordSpan.dataset.originalLength = PASSWORD_MASK_LENGTH;
+            passwordSpan.textContent = "*".repeat(PASSWORD_MASK_LENGTH);
 
-                    cells[3].append(passwordSpan, eyeBtn)
+            const eyeBtn = document.createElement('button');
+            eyeBtn.className = "btn btn-eye";
+            eyeBtn.dataset.id = usuario.id;
+            eyeBtn.dataset.visible = "false";
+            eyeBtn.dataset.timeout = "";
+            eyeBtn.textContent = "👁️";
 
-                    const edtBtn = document.createElement('a');
-                    edtBtn.className = "btn btn-edt";
-                    edtBtn.href = `/edit-user?id=${usuario.id}`;
-                    edtBtn.textContent = "✏️";
+            cells[3].append(passwordSpan, eyeBtn)
 
-                    const delBtn = document.createElement('button');
-                    delBtn.className = "btn btn-del";
-                    delBtn.dataset.id = usuario.id;
-                    delBtn.textContent = "🗑️";
+            const edtBtn = document.createElement('a');
+            edtBtn.className = "btn btn-edt";
+            edtBtn.href = `/edit-user?id=${usuario.id}`;
+            edtBtn.textContent = "✏️";
 
-                    cells[4].append(edtBtn, delBtn)
+            const delBtn = document.createElement('button');
+            delBtn.className = "btn btn-del";
+            delBtn.dataset.id = usuario.id;
+            delBtn.textContent = "🗑️";
 
-                    row.append(...cells);
-                    userTableBody.appendChild(row)
-                });
+            cells[4].append(edtBtn, delBtn)
+
+            row.append(...cells);
+            fragment.appendChild(row);
+        });
+
+        userTableBody.appendChild(fragment);
+    }
+
+    // Pide una pagina de usuarios; sin "despuesDe" reinicia la tabla
+    // Solo se piden id y nombre, la contraseña se consulta bajo demanda
+    function cargarUsuarios(despuesDe = null) {
+        const params = new URLSearchParams({
+            limit: PAGE_SIZE,
+            fields: "id,nombre",
+            timestamp: Date.now(),
+        });
+        if (despuesDe !== null) params.set("after_id", despuesDe);
+
+        fetch(`/api/users?${params}`, {
+            method: "GET",
+            credentials: "include"
+        }).then(response => {
+            if (!response.ok) throw new Error("HTTP error " + response.status);
+            return response.json();
+        }).then(data => {
+            if (data.success && userTableBody) {
+                if (despuesDe === null) {
+                    userTableBody.innerHTML = "";
+                    filasCargadas = 0;
+                }
+
+                agregarUsuarios(data.usuarios);
+                siguienteId = data.siguiente;
+                loadMoreBtn.style.display = siguienteId === null ? "none" : "";
             }
         }).catch(error => {
             console.error("Error cargando usuarios", error);
@@ -93,6 +126,10 @@ document.addEventListener("DOMContentLoaded", function() {
         });
     }
 
+    loadMoreBtn.addEventListener("click", function() {
+        if (siguienteId !== null) cargarUsuarios(siguienteId);
+    });
+
     // Verificar si se activo la sesion
     fetch("/api/session", {
         method: "POST",
@@ -223,5 +260,5 @@ document.addEventListener("DOMContentLoaded", function() {
         }
     });
 
-    window.addEventListener('focus', cargarUsuarios);
+    window.addEventListener('focus', () => cargarUsuarios());
 });
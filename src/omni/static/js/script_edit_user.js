@@ -47,19 +47,16 @@ document.addEventListener('DOMContentLoaded', function() {
      *   - No exponer detalles de error internos (ej: "Usuario no existe").
      *
     */
-    fetch('/api/users').then(response => {
-        if (!response.ok) {
+    fetch(`/api/users/${parseInt(userId)}`).then(response => {
+        if (response.status === 401) {
             window.location.href = '/login';
             throw new Error('Unauthorized');
         }
         return response.json();
     }).then(data => {
         if (data.success) {
-            const user = data.usuarios.find(u => u.id === parseInt(userId));
-            if (user) {
-                currentName = user.nombre;
-                fullnameInput.value = user.nombre;
-            }
+            currentName = data.usuario.nombre;
+            fullnameInput.value = data.usuario.nombre;
         }
     });
 
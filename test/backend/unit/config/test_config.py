@@ -0,0 +1,24 @@
+import dataclasses
+import pytest
+from omni.modules.config import Configuracion, obtener_configuracion
+
+
+def test_configuracion_compartida():
+    assert obtener_configuracion() is obtener_configuracion()
+
+
+def test_configuracion_inmutable():
+    config = obtener_configuracion()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.APP_PORT = 80  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    "valor, esperado",
+    [("False", False), ("false", False), ("0", False), ("True", True), ("1", True)],
+)
+def test_app_debug_booleano(monkeypatch, valor, esperado):
+    monkeypatch.setenv("APP_DEBUG", valor)
+
+    assert Configuracion.cargar().APP_DEBUG is esperado
@@ -0,0 +1,241 @@
+import pytest
+from unittest.mock import Mock
+from mysql.connector import errors
+from mysql.connector.abstracts import MySQLConnectionAbstract
+from omni.modules.database import (
+    BasedeDatos,
+    EstadoEscritura,
+    estadisticas_sentencias,
+)
+
+
+@pytest.fixture
+def conexion():
+    conexion = Mock(spec=MySQLConnectionAbstract)
+    conexion.in_transaction = False
+    conexion.cursor.return_value.fetchall.return_value = []
+    return conexion
+
+
+@pytest.fixture
+def bd(conexion):
+    pool = Mock()
+    pool.obtener.return_value = conexion
+    return BasedeDatos(pool)
+
+
+def test_leer_pagina_keyset(bd, conexion):
+    bd.leer(
+        "usuario",
+        campos=["id", "nombre"],
+        prefijos={"nombre": "a_b%"},
+        orden="id",
+        despues_de=10,
+        limite=5,
+    )
+
+    conexion.cursor.return_value.execute.assert_called_once_with(
+        "SELECT `id`, `nombre` FROM `usuario` WHERE `nombre` LIKE %s AND `id` > %s"
+        " ORDER BY `id` LIMIT %s",
+        ["a\\_b\\%%", 10, 5],
+    )
+
+
+def test_contar(bd, conexion):
+    conexion.cursor.return_value.fetchall.return_value = [{"total": 7}]
+
+    assert bd.contar("usuario") == 7
+    conexion.cursor.return_value.execute.assert_called_once_with(
+        "SELECT COUNT(*) AS `total` FROM `usuario`"
+    )
+
+
+def test_leer_flujo_por_lotes(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.fetchmany.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+
+    filas = list(bd.leer_flujo("usuario", campos=["id"], orden="id", tamano_lote=2))
+
+    assert filas == [{"id": 1}, {"id": 2}, {"id": 3}]
+    cursor.fetchall.assert_not_called()
+    cursor.fetchmany.assert_called_with(2)
+
+
+def test_crear_reporta_duplicado(bd, conexion):
+    conexion.cursor.return_value.execute.side_effect = errors.IntegrityError(
+        msg="Duplicate entry", errno=1062
+    )
+
+    resultado = bd.crear("usuario", {"nombre": "ana", "password": "x"})
+
+    assert resultado.estado is EstadoEscritura.DUPLICADO
+    conexion.rollback.assert_called_once()
+
+
+def test_crear_propaga_otras_violaciones(bd, conexion):
+    conexion.cursor.return_value.execute.side_effect = errors.IntegrityError(
+        msg="Column cannot be null", errno=1048
+    )
+
+    with pytest.raises(errors.IntegrityError):
+        bd.crear("usuario", {"nombre": None})
+
+
+def test_actualizar_sin_filas_es_no_encontrado(bd, conexion):
+    conexion.cursor.return_value.rowcount = 0
+
+    resultado = bd.actualizar("usuario", {"password": "x"}, {"nombre": "nadie"})
+
+    assert resultado.estado is EstadoEscritura.NO_ENCONTRADO
+    assert not resultado.exito
+
+
+def test_crear_muchos_por_lotes(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.lastrowid = 20
+    cursor.fetchall.side_effect = [
+        [{"id": 20, "nombre": "ana"}],
+        [{"id": 22, "nombre": "eva"}],
+    ]
+    registros = [
+        {"nombre": nombre, "password": "x"} for nombre in ["ana", "luis", "ana", "eva"]
+    ]
+
+    resultados = bd.crear_muchos("usuario", registros, "nombre", tamano_lote=2)
+
+    assert [r.estado for r in resultados] == [
+        EstadoEscritura.EXITO,
+        EstadoEscritura.DUPLICADO,
+        EstadoEscritura.DUPLICADO,
+        EstadoEscritura.EXITO,
+    ]
+    assert [r.id_generado for r in resultados] == [20, None, None, 22]
+    assert cursor.execute.call_count == 4
+    assert (
+        cursor.execute.call_args_list[0]
+        .args[0]
+        .startswith(
+            "INSERT INTO `usuario` (`nombre`, `password`) VALUES (%s, %s), (%s, %s)"
+        )
+    )
+    conexion.commit.assert_called_once()
+
+
+def test_crear_muchos_solo_ids_de_su_insert(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.lastrowid = 20
+    # "luis" lo insertó otra transacción a la vez, con un id fuera del bloque
+    cursor.fetchall.return_value = [{"id": 21, "nombre": "ana"}]
+    registros = [{"nombre": nombre, "password": "x"} for nombre in ["ana", "luis"]]
+
+    resultados = bd.crear_muchos("usuario", registros, "nombre")
+
+    consulta, parametros = cursor.execute.call_args_list[1].args
+    assert consulta.endswith("AND `id` >= %s AND `id` < %s")
+    assert parametros == ["ana", "luis", 20, 22]
+    assert [r.estado for r in resultados] == [
+        EstadoEscritura.EXITO,
+        EstadoEscritura.DUPLICADO,
+    ]
+
+
+def test_actualizar_muchos_continua_tras_duplicado(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.rowcount = 1
+    cursor.execute.side_effect = [
+        None,
+        errors.IntegrityError(msg="Duplicate entry", errno=1062),
+        None,
+    ]
+
+    resultados = bd.actualizar_muchos(
+        "usuario",
+        [({"nombre": n}, {"nombre": n + "_"}) for n in ["a", "b", "c"]],
+    )
+
+    assert [r.estado for r in resultados] == [
+        EstadoEscritura.EXITO,
+        EstadoEscritura.DUPLICADO,
+        EstadoEscritura.EXITO,
+    ]
+    conexion.commit.assert_called_once()
+
+
+def test_eliminar_muchos_reporta_no_encontrados(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.fetchall.return_value = [{"id": 3}]
+
+    resultados = bd.eliminar_muchos("usuario", "id", [3, 4])
+
+    assert [r.estado for r in resultados] == [
+        EstadoEscritura.EXITO,
+        EstadoEscritura.NO_ENCONTRADO,
+    ]
+    cursor.execute.assert_called_with("DELETE FROM `usuario` WHERE `id` IN (%s)", [3])
+
+
+def test_transaccion_un_solo_commit(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.rowcount = 1
+    cursor.fetchall.return_value = [{"total": 1}]
+
+    with bd.transaccion() as tx:
+        if tx.contar("usuario", {"id": 5}):
+            tx.eliminar("usuario", {"id": 5})
+        tx.crear("usuario", {"nombre": "ana"})
+
+    conexion.commit.assert_called_once()
+    conexion.rollback.assert_not_called()
+    conexion.cursor.assert_called_once()
+
+
+def test_transaccion_revierte_todo(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.rowcount = 1
+    cursor.execute.side_effect = [None, errors.ProgrammingError(msg="error")]
+
+    with pytest.raises(errors.ProgrammingError):
+        with bd.transaccion() as tx:
+            tx.actualizar("usuario", {"password": "x"}, {"id": 1})
+            tx.eliminar("usuario", {"id": 2})
+
+    conexion.commit.assert_not_called()
+    conexion.rollback.assert_called_once()
+
+
+def test_transaccion_duplicado_no_revierte(bd, conexion):
+    cursor = conexion.cursor.return_value
+    cursor.execute.side_effect = [
+        errors.IntegrityError(msg="Duplicate entry", errno=1062),
+        None,
+    ]
+    cursor.rowcount = 1
+
+    with bd.transaccion() as tx:
+        assert tx.crear("usuario", {"nombre": "ana"}).estado is (
+            EstadoEscritura.DUPLICADO
+        )
+        with tx.transaccion():
+            tx.crear("usuario", {"nombre": "eva"})
+
+    conexion.rollback.assert_not_called()
+    conexion.commit.assert_called_once()
+
+
+def test_sentencias_preparadas_por_conexion(conexion):
+    pool = Mock()
+    pool.obtener.return_value = conexion
+    bd = BasedeDatos(pool, preparadas=True)
+    antes = estadisticas_sentencias()
+
+    bd.leer("usuario", {"nombre": "ana"})
+    bd.leer("usuario", {"nombre": "eva"})
+
+    despues = estadisticas_sentencias()
+    assert despues["preparadas"] - antes["preparadas"] == 1
+    assert despues["reutilizadas"] - antes["reutilizadas"] == 1
+    assert despues["aciertos"] - antes["aciertos"] >= 1
+    conexion.cursor.assert_any_call(prepared=True, dictionary=True)
+    conexion.cursor.return_value.execute.assert_called_with(
+        "SELECT * FROM `usuario` WHERE `nombre` = %s", ["eva"]
+    )
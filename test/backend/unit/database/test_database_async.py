@@ -0,0 +1,18 @@
+import asyncio
+import threading
+import pytest
+from omni.modules import database_async
+from omni.modules.database_async import BasedeDatosAsync, en_bucle
+
+
+def test_en_bucle_ejecuta_en_el_hilo_del_bucle():
+    async def hilo_actual():
+        return threading.current_thread().name
+
+    assert asyncio.run(en_bucle(hilo_actual())) == "omni-bd-async"
+
+
+@pytest.mark.skipif(database_async.aiomysql is not None, reason="aiomysql instalado")
+def test_sin_aiomysql_indica_el_extra():
+    with pytest.raises(RuntimeError, match=r"omni\[async\]"):
+        BasedeDatosAsync()
@@ -0,0 +1,157 @@
+import os
+import threading
+import pytest
+from flask import Flask
+from unittest.mock import Mock, patch
+from mysql.connector import errors
+from mysql.connector.abstracts import MySQLConnectionAbstract
+from omni.modules.database import (
+    BasedeDatos,
+    PoolConexiones,
+    liberar_bd,
+    obtener_bd,
+    obtener_pool,
+)
+
+
+def nueva_conexion(*args, **kwargs):
+    conexion = Mock(spec=MySQLConnectionAbstract)
+    conexion.in_transaction = False
+    conexion.is_connected.return_value = True
+    return conexion
+
+
+@pytest.fixture
+def mock_connect():
+    with patch(
+        "omni.modules.database.mysql.connector.connect", side_effect=nueva_conexion
+    ) as connect:
+        yield connect
+
+
+def test_pool_reutiliza_conexiones(mock_connect):
+    pool = PoolConexiones({}, minimo=1, maximo=2)
+
+    conexion = pool.obtener()
+    pool.liberar(conexion)
+
+    assert pool.obtener() is conexion
+    assert mock_connect.call_count == 1
+    conexion.cmd_query.assert_called_once_with(
+        "SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED"
+    )
+
+
+def test_pool_agotado(mock_connect):
+    pool = PoolConexiones({}, minimo=0, maximo=1, tiempo_espera=0.01)
+    pool.obtener()
+
+    with pytest.raises(errors.PoolError):
+        pool.obtener()
+
+    assert pool.estadisticas()["en_uso"] == 1
+
+
+def test_pool_recicla_conexiones_inactivas(mock_connect):
+    pool = PoolConexiones({}, minimo=0, maximo=2, tiempo_inactivo=0)
+
+    conexion = pool.obtener()
+    pool.liberar(conexion)
+
+    assert pool.obtener() is not conexion
+    conexion.close.assert_called_once()
+    assert pool.estadisticas()["recicladas"] == 1
+    assert pool.estadisticas()["creadas"] == 2
+
+
+def test_ping_lento_no_bloquea_el_pool(mock_connect):
+    pool = PoolConexiones({}, minimo=0, maximo=2, verificar_despues=0)
+    lenta, rapida = pool.obtener(), pool.obtener()
+
+    en_ping, continuar = threading.Event(), threading.Event()
+
+    def ping_lento():
+        en_ping.set()
+        continuar.wait(5)
+        return False
+
+    lenta.is_connected.side_effect = ping_lento
+    pool.liberar(lenta)
+
+    hilo = threading.Thread(target=pool.obtener)
+    hilo.start()
+    assert en_ping.wait(5)
+
+    # Mientras el otro hilo hace ping, el pool sigue atendiendo
+    obtenidas = []
+
+    def usar_rapida():
+        pool.liberar(rapida)
+        obtenidas.append(pool.obtener())
+
+    otro = threading.Thread(target=usar_rapida)
+    otro.start()
+    otro.join(2)
+    atendido = not otro.is_alive()
+
+    continuar.set()
+    hilo.join(5)
+    otro.join(5)
+
+    assert atendido
+    assert obtenidas == [rapida]
+
+    lenta.close.assert_called_once()
+    assert pool.estadisticas()["recicladas"] == 1
+    assert pool.estadisticas()["en_uso"] == 2
+
+
+def test_bd_devuelve_conexion_al_pool(mock_connect):
+    pool = PoolConexiones({}, minimo=0, maximo=1)
+    bd = BasedeDatos(pool)
+
+    bd.leer("usuario")
+    bd.leer("usuario")
+
+    assert mock_connect.call_count == 1
+    assert pool.estadisticas()["en_uso"] == 0
+    assert pool.estadisticas()["libres"] == 1
+
+
+def test_bd_sin_servidor_lanza_error_si_no_debe_salir():
+    pool = PoolConexiones({}, minimo=0, maximo=1)
+    bd = BasedeDatos(pool, salir_si_falla=False)
+
+    with patch(
+        "omni.modules.database.mysql.connector.connect",
+        side_effect=errors.InterfaceError("sin servidor"),
+    ):
+        with pytest.raises(errors.InterfaceError):
+            bd.conectar()
+
+    assert pool.estadisticas()["abiertas"] == 0
+
+
+def test_bd_por_peticion(mock_connect):
+    app = Flask(__name__)
+    app.teardown_appcontext(liberar_bd)
+
+    with app.app_context():
+        primera = obtener_bd()
+        assert obtener_bd() is primera
+
+    with app.app_context():
+        assert obtener_bd() is not primera
+
+
+def test_pool_nuevo_tras_fork():
+    pool_padre = obtener_pool()
+    lectura, escritura = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        os.write(escritura, b"1" if obtener_pool() is not pool_padre else b"0")
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    assert os.read(lectura, 1) == b"1"
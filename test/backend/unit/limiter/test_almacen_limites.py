@@ -0,0 +1,61 @@
+import multiprocessing
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+from omni.modules.almacen_limites import AlmacenMemoriaAcotada, AlmacenSQLite
+
+
+def golpear(uri: str, veces: int) -> None:
+    limitador = FixedWindowRateLimiter(storage_from_string(uri))
+    for _ in range(veces):
+        limitador.hit(parse("100/minute"), "127.0.0.1")
+
+
+def test_memoria_desaloja_lru():
+    almacen = AlmacenMemoriaAcotada(max_claves=2)
+
+    almacen.incr("a", 60)
+    almacen.incr("b", 60)
+    almacen.incr("a", 60)
+    almacen.incr("c", 60)
+
+    assert almacen.get("a") == 2
+    assert almacen.get("b") == 0
+    assert almacen.get("c") == 1
+    assert almacen.desalojados == 1
+
+
+def test_memoria_reinicia_ventana_vencida():
+    almacen = AlmacenMemoriaAcotada()
+
+    almacen.incr("a", 0)
+
+    assert almacen.get("a") == 0
+    assert almacen.incr("a", 60) == 1
+
+
+def test_sqlite_compartido_entre_procesos(tmp_path):
+    uri = f"omni-sqlite://{tmp_path / 'limites.db'}"
+    contexto = multiprocessing.get_context("fork")
+    procesos = [contexto.Process(target=golpear, args=(uri, 5)) for _ in range(3)]
+
+    for proceso in procesos:
+        proceso.start()
+    for proceso in procesos:
+        proceso.join()
+
+    almacen = storage_from_string(uri)
+    assert isinstance(almacen, AlmacenSQLite)
+    limitador = FixedWindowRateLimiter(almacen)
+    assert limitador.get_window_stats(parse("100/minute"), "127.0.0.1").remaining == 85
+
+
+def test_sqlite_acota_claves(tmp_path):
+    almacen = AlmacenSQLite(f"omni-sqlite://{tmp_path / 'limites.db'}", max_claves=2)
+    almacen.LIMPIAR_CADA = 1
+
+    for clave in ("a", "b", "c"):
+        almacen.incr(clave, 60)
+
+    assert almacen.get("a") == 0
+    assert almacen.get("c") == 1
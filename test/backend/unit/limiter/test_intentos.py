@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import patch
+from omni.app import Applicacion
+from omni.modules.intentos import ControlIntentos, VentanaDeslizante
+
+
+@pytest.fixture
+def cliente():
+    app = Applicacion()
+    app.flask_app.config["TESTING"] = True
+    return app.flask_app.test_client()
+
+
+def test_ventana_desliza_por_cubetas():
+    ventana = VentanaDeslizante(10, cubetas=10)
+
+    ventana.registrar("a", ahora=0.5)
+    ventana.registrar("a", ahora=4.5)
+    assert ventana.registrar("a", ahora=9.5) == 3
+
+    assert ventana.contar("a", ahora=10.5) == 2
+    assert ventana.contar("a", ahora=14.5) == 1
+    assert ventana.contar("a", ahora=19.5) == 0
+    assert len(ventana) == 0
+
+
+def test_ventana_calcula_espera():
+    ventana = VentanaDeslizante(10, cubetas=10)
+
+    ventana.registrar("a", ahora=0.5)
+    ventana.registrar("a", ahora=4.5)
+
+    assert ventana.espera("a", 3, ahora=5.0) == 0
+    assert ventana.espera("a", 2, ahora=5.0) == pytest.approx(5.0)
+    assert ventana.espera("a", 1, ahora=5.0) == pytest.approx(9.0)
+
+
+def test_ventana_acota_claves():
+    ventana = VentanaDeslizante(10, max_claves=2)
+
+    for clave in ("a", "b", "c"):
+        ventana.registrar(clave, ahora=0)
+
+    assert len(ventana) == 2
+    assert ventana.contar("a", ahora=0) == 0
+    assert ventana.desalojados == 1
+
+
+def test_control_por_ip_y_usuario():
+    control = ControlIntentos(fallos_usuario=3, fallos_ip=2, ventana=60)
+
+    control.registrar_fallo("Jose", "10.0.0.1")
+    control.registrar_fallo("jose", "10.0.0.1")
+
+    assert control.espera("Jose", "10.0.0.1") > 0
+    assert control.espera("Jose", "10.0.0.2") == 0
+
+    control.registrar_fallo("Jose", "10.0.0.2")
+
+    assert control.espera("Jose", "10.0.0.3") > 0
+
+
+def test_login_frenado_sin_consultar_servicio(cliente):
+    control = ControlIntentos(fallos_usuario=10, fallos_ip=2, ventana=60)
+    fallo = {"success": False, "message": "Contraseña incorrecta"}
+
+    with (
+        patch(
+            "omni.modules.routes_auth.obtener_control_intentos", return_value=control
+        ),
+        patch(
+            "omni.modules.services_auth.ServicioAutenticacion.iniciar_sesion",
+            return_value=fallo,
+        ) as iniciar_sesion,
+    ):
+        for _ in range(2):
+            respuesta = cliente.post(
+                "/api/login", json={"nombre": "Jose", "password": "x"}
+            )
+            assert respuesta.status_code == 401
+
+        respuesta = cliente.post("/api/login", json={"nombre": "Jose", "password": "x"})
+
+    assert respuesta.status_code == 429
+    assert int(respuesta.headers["Retry-After"]) > 0
+    assert iniciar_sesion.call_count == 2
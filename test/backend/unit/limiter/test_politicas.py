@@ -0,0 +1,49 @@
+import os
+import stat
+import pytest
+from unittest.mock import MagicMock, patch
+from omni.app import Applicacion
+from omni.modules.config import obtener_configuracion
+from omni.modules.limiter import Limitador
+
+
+@pytest.fixture
+def cliente():
+    app = Applicacion()
+    app.flask_app.config["TESTING"] = True
+    return app.flask_app.test_client()
+
+
+def test_paginas_y_estaticos_exentos(cliente):
+    for _ in range(60):
+        assert cliente.get("/login").status_code == 200
+        assert cliente.get("/static/css/style_login.css").status_code == 200
+
+
+def test_api_usa_su_politica(cliente):
+    politica = obtener_configuracion().obtener_config_limites()["Users"]
+    por_minuto = int(politica.split(";")[-1].split()[0])
+
+    for _ in range(por_minuto):
+        assert cliente.get("/api/users").status_code == 401
+
+    assert cliente.get("/api/users").status_code == 429
+
+
+def test_almacen_prod_en_carpeta_privada(monkeypatch, tmp_path):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    config = MagicMock()
+    config.obtener_config_limites.return_value = {"StorageUri": ""}
+    config.obtener_config_app.return_value = {"Server": "prod"}
+    config.obtener_config_bd.return_value = {"database": "OmniGuard"}
+
+    with patch("omni.modules.limiter.obtener_configuracion", return_value=config):
+        uri = Limitador.uri_almacenamiento()
+        carpeta = tmp_path / f"omniguard-{os.getuid()}"
+
+        assert uri == f"omni-sqlite://{carpeta / 'limites-OmniGuard.db'}"
+        assert stat.S_IMODE(carpeta.stat().st_mode) == 0o700
+
+        carpeta.chmod(0o777)
+        with pytest.raises(PermissionError):
+            Limitador.uri_almacenamiento()
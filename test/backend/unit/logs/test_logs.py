@@ -0,0 +1,106 @@
+import io
+import json
+import queue
+import uuid
+import logging
+from omni.modules.config import obtener_configuracion
+from omni.modules.logging import (
+    EscuchadorCola,
+    FormateadorJSON,
+    Logs,
+    ManejadorCola,
+    vaciar_logs,
+)
+
+
+def nuevo_registro(nivel: int, mensaje: str) -> logging.LogRecord:
+    return logging.LogRecord("OmniGuard", nivel, __file__, 1, mensaje, None, None)
+
+
+def test_logs_no_acumula_manejadores():
+    logs = [Logs() for _ in range(5)]
+
+    assert len(logs[0].logger.handlers) == 1
+    assert all(log.logger is logs[0].logger for log in logs)
+
+
+def test_registro_se_escribe_una_vez():
+    _ = [Logs() for _ in range(3)]
+    logs = Logs()
+    mensaje = f"registro-unico-{uuid.uuid4()}"
+
+    logs.critical(mensaje)
+    vaciar_logs()
+
+    archivo_logs = str(obtener_configuracion().obtener_config_log()["File"])
+    with open(archivo_logs, encoding="utf-8") as archivo:
+        assert archivo.read().count(mensaje) == 1
+
+
+def test_cola_descarta_el_mas_antiguo():
+    cola: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+    manejador = ManejadorCola(cola, "drop-oldest")
+
+    for mensaje in ("uno", "dos", "tres"):
+        manejador.handle(nuevo_registro(logging.INFO, mensaje))
+
+    assert manejador.descartados == 1
+    assert [cola.get_nowait().msg for _ in range(2)] == ["dos", "tres"]
+
+
+def test_cola_descarta_debug():
+    cola: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=1)
+    manejador = ManejadorCola(cola, "drop-debug")
+
+    manejador.handle(nuevo_registro(logging.INFO, "uno"))
+    manejador.handle(nuevo_registro(logging.DEBUG, "dos"))
+
+    assert manejador.descartados == 1
+    assert cola.qsize() == 1
+
+
+def test_formato_json_incluye_campos_extra():
+    registro = nuevo_registro(logging.INFO, "Intento de ingreso")
+    registro.nombre = "admin"
+    registro.user_id = 7
+
+    datos = json.loads(FormateadorJSON().format(registro))
+
+    assert datos["message"] == "Intento de ingreso"
+    assert datos["level"] == "INFO"
+    assert datos["nombre"] == "admin"
+    assert datos["user_id"] == 7
+
+
+def test_logs_atribuye_al_llamador(caplog):
+    with caplog.at_level(logging.INFO, logger="OmniGuard"):
+        Logs().info("desde la prueba", tabla="usuario", stack_info=True)
+
+    registro = caplog.records[-1]
+    assert registro.funcName == "test_logs_atribuye_al_llamador"
+    assert registro.tabla == "usuario"
+    assert registro.stack_info
+
+
+def test_cola_conserva_excepcion_en_json():
+    salida = io.StringIO()
+    destino = logging.StreamHandler(salida)
+    destino.setFormatter(FormateadorJSON())
+    cola: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=10)
+    escuchador = EscuchadorCola(cola, destino)
+    logger = logging.getLogger("OmniGuard.prueba_cola")
+    logger.propagate = False
+    logger.addHandler(ManejadorCola(cola, "block"))
+
+    escuchador.start()
+    try:
+        raise ValueError("fallo de prueba")
+    except ValueError:
+        logger.error("Fallo", exc_info=True, stack_info=True, extra={"campo": 1})
+    escuchador.stop()
+
+    datos = json.loads(salida.getvalue())
+    assert datos["message"] == "Fallo"
+    assert "ValueError: fallo de prueba" in datos["exception"]
+    assert "stack" in datos
+    assert datos["campo"] == 1
@@ -0,0 +1,65 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from omni.app import Applicacion
+from omni.modules.config import Configuracion
+from omni.modules.services_auth import ServicioAutenticacionAsync
+from omni.modules.services_user import ServicioUsuarioAsync
+
+pytest.importorskip("asgiref")
+
+
+@pytest.fixture
+def servicio():
+    servicio = MagicMock(spec=ServicioAutenticacionAsync)
+    servicio.servicio_usuario = MagicMock(spec=ServicioUsuarioAsync)
+    return servicio
+
+
+@pytest.fixture
+def client(monkeypatch, servicio):
+    monkeypatch.setenv("DB_ASYNC", "True")
+    monkeypatch.setattr("omni.modules.config._configuracion", Configuracion.cargar())
+    monkeypatch.setattr("omni.modules.services_auth._servicio_auth_async", servicio)
+
+    with patch("omni.modules.routes_async._requerir_aiomysql"):
+        app = Applicacion()
+    app.flask_app.config["TESTING"] = True
+    return app.flask_app.test_client()
+
+
+def test_login_async(client, servicio):
+    servicio.iniciar_sesion = AsyncMock(
+        return_value={"success": True, "message": "Inicio de sesión exitoso"}
+    )
+
+    response = client.post("/api/login", json={"nombre": "ana", "password": "x"})
+
+    assert response.status_code == 200
+    servicio.iniciar_sesion.assert_awaited_once_with("ana", "x")
+
+
+def test_login_async_datos_incompletos(client, servicio):
+    servicio.iniciar_sesion = AsyncMock()
+
+    response = client.post("/api/login", json={"nombre": "ana"})
+
+    assert response.status_code == 400
+    servicio.iniciar_sesion.assert_not_awaited()
+
+
+def test_obtener_usuarios_async(client, servicio):
+    with client.session_transaction() as sesion:
+        sesion["usuario_id"] = 1
+        sesion["usuario_nombre"] = "admin"
+
+    usuarios = [{"id": 1, "nombre": "admin"}, {"id": 2, "nombre": "user1"}]
+    servicio.servicio_usuario.obtener_pagina_usuarios = AsyncMock(return_value=usuarios)
+    servicio.servicio_usuario.contar_usuarios = AsyncMock(return_value=2)
+
+    response = client.get("/api/users?limit=2")
+
+    assert response.status_code == 200
+    assert response.json["usuarios"] == usuarios
+    assert response.headers["X-Total-Count"] == "2"
+    servicio.servicio_usuario.contar_usuarios.assert_awaited_once()
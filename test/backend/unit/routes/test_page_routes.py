@@ -0,0 +1,45 @@
+import pytest
+from omni.app import Applicacion
+
+
+@pytest.fixture
+def client():
+    app = Applicacion()
+    app.flask_app.config["TESTING"] = True
+    return app.flask_app.test_client()
+
+
+def test_login_prerenderizado_con_etag(client):
+    primera = client.get("/login")
+    segunda = client.get("/login")
+
+    assert primera.status_code == 200
+    assert b"OmniGuard - Login" in primera.data
+    assert primera.headers["ETag"] == segunda.headers["ETag"]
+    assert primera.data == segunda.data
+
+    revalidada = client.get(
+        "/login", headers={"If-None-Match": primera.headers["ETag"]}
+    )
+    assert revalidada.status_code == 304
+    assert revalidada.data == b""
+
+
+def test_dashboard_sustituye_el_nombre_escapado(client):
+    with client.session_transaction() as sesion:
+        sesion["usuario_id"] = 1
+        sesion["usuario_nombre"] = "<ana>"
+
+    response = client.get("/dashboard")
+
+    assert response.status_code == 200
+    assert b"Bienvenido, &lt;ana&gt;!" in response.data
+    assert b"\x00" not in response.data
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    with client.session_transaction() as sesion:
+        sesion["usuario_nombre"] = "luis"
+
+    otra = client.get("/dashboard", headers={"If-None-Match": response.headers["ETag"]})
+    assert otra.status_code == 200
+    assert b"Bienvenido, luis!" in otra.data
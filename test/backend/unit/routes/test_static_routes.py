@@ -0,0 +1,55 @@
+import gzip
+import pytest
+from omni.app import Applicacion
+from omni.modules.estaticos import construir_estaticos, url_estatico
+
+
+@pytest.fixture
+def app(tmp_path):
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "app.js").write_text("console.log('omni');\n" * 50)
+    (tmp_path / "icon.png").write_bytes(b"\x89PNG")
+
+    app = Applicacion().flask_app
+    app.config["TESTING"] = True
+    app.static_folder = str(tmp_path)
+    return app
+
+
+def test_sin_manifiesto_sirve_el_original(app):
+    with app.test_request_context():
+        assert url_estatico("js/app.js") == "/static/js/app.js"
+
+    response = app.test_client().get("/static/js/app.js")
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.mimetype == "application/javascript"
+
+
+def test_archivo_con_huella_inmutable_y_comprimido(app):
+    manifiesto = construir_estaticos(app.static_folder)
+    entrada = manifiesto["js/app.js"]
+
+    assert entrada["codificaciones"][-1] == "gzip"
+    assert manifiesto["icon.png"]["codificaciones"] == []
+
+    with app.test_request_context():
+        url = url_estatico("js/app.js")
+    assert url == f"/static/{entrada['archivo']}"
+
+    client = app.test_client()
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert gzip.decompress(response.data).startswith(b"console.log")
+
+    plano = client.get(url)
+    assert "Content-Encoding" not in plano.headers
+    assert plano.headers["ETag"] == f'"{entrada["etag"]}"'
+
+    revalidado = client.get(url, headers={"If-None-Match": plano.headers["ETag"]})
+    assert revalidado.status_code == 304
@@ -1,5 +1,11 @@
+import json
+import asyncio
 import pytest
+from flask import session
 from omni.app import Applicacion
+from omni.modules.routes import require_login
+from omni.modules.database import EstadoEscritura, ResultadoEscritura
+from omni.modules.models import Usuario
 from unittest.mock import patch
 
 
@@ -34,3 +40,97 @@ def test_eliminar_usuario_error(mock_service, client):
         response = client.delete("/api/users/delete/999")
 
         assert response.status_code == 500
+
+
+def test_exportar_usuarios_ndjson(client):
+    with client.session_transaction() as sesion:
+        sesion["usuario_id"] = 1
+        sesion["usuario_nombre"] = "admin"
+
+    usuarios = [{"id": 1, "nombre": "admin"}, {"id": 2, "nombre": "user1"}]
+
+    with patch(
+        "omni.modules.services_user.ServicioUsuario.iterar_usuarios",
+        return_value=iter(usuarios),
+    ):
+        response = client.get("/api/users/export?format=ndjson")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert [json.loads(linea) for linea in response.data.splitlines()] == usuarios
+
+
+def test_eliminar_usuarios_en_lote(client):
+    with client.session_transaction() as sesion:
+        sesion["usuario_id"] = 1
+        sesion["usuario_nombre"] = "admin"
+
+    resultados = [
+        ResultadoEscritura(EstadoEscritura.EXITO, 1),
+        ResultadoEscritura(EstadoEscritura.NO_ENCONTRADO),
+    ]
+
+    with patch(
+        "omni.modules.services_user.ServicioUsuario.borrar_usuarios_por_id",
+        return_value=resultados,
+    ) as borrar:
+        response = client.delete("/api/users/bulk", json={"ids": [3, 4]})
+
+    assert response.status_code == 200
+    assert response.json["exitos"] == 1
+    assert response.json["resultados"] == [
+        {"id": 3, "estado": "exito"},
+        {"id": 4, "estado": "no_encontrado"},
+    ]
+    borrar.assert_called_once_with([3, 4], 500)
+
+
+def test_crear_usuarios_en_lote_invalido(client):
+    with client.session_transaction() as sesion:
+        sesion["usuario_id"] = 1
+        sesion["usuario_nombre"] = "admin"
+
+    response = client.post("/api/users/bulk", json={"usuarios": [{"nombre": "a"}]})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("consulta", ["limit=abc", "limit=0", "after_id=abc"])
+def test_obtener_usuarios_parametros_invalidos(client, consulta):
+    with client.session_transaction() as sesion:
+        sesion["usuario_id"] = 1
+        sesion["usuario_nombre"] = "admin"
+
+    response = client.get(f"/api/users?{consulta}")
+
+    assert response.status_code == 400
+
+
+def test_obtener_usuario_por_id(client):
+    with client.session_transaction() as sesion:
+        sesion["usuario_id"] = 1
+        sesion["usuario_nombre"] = "admin"
+
+    with patch(
+        "omni.modules.services_user.ServicioUsuario.obtener_usuario_por_id",
+        side_effect=[Usuario("ana", "cifrada", 7), None],
+    ):
+        encontrado = client.get("/api/users/7")
+        no_encontrado = client.get("/api/users/8")
+
+    assert encontrado.status_code == 200
+    assert encontrado.json["usuario"] == {"id": 7, "nombre": "ana"}
+    assert no_encontrado.status_code == 404
+
+
+def test_require_login_en_vista_async(client):
+    @require_login
+    async def vista():
+        return "ok"
+
+    with client.application.test_request_context("/api/users"):
+        _, codigo = asyncio.run(vista())
+        session["usuario_id"] = 1
+        assert asyncio.run(vista()) == "ok"
+
+    assert codigo == 401
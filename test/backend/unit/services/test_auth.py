@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import Mock
+from omni.modules.database import EstadoEscritura, ResultadoEscritura
 from omni.modules.models import Usuario
 from omni.modules.services_auth import ServicioAutenticacion
 
@@ -8,6 +9,7 @@ from omni.modules.services_auth import ServicioAutenticacion
 def mock_bd():
     bd = Mock()
     bd.leer.return_value = []
+    bd.crear.return_value = ResultadoEscritura(EstadoEscritura.EXITO, 1, 1)
     return bd
 
 
@@ -16,16 +18,17 @@ def test_registro_usuario_exitoso(mock_bd):
     result = servicio.registrar_usuario("usuario_test", "ContraSegura")
 
     assert result["success"] is True
+    assert result["codigo"] == 201
     assert "registrado correctamente" in str(result["message"])
 
 
 def test_registro_usuario_duplicado(mock_bd):
-    mock_bd.leer.return_value = [
-        {"id": 1, "nombre": "usuario_test", "password": "hashed"}
-    ]
+    mock_bd.crear.return_value = ResultadoEscritura(EstadoEscritura.DUPLICADO)
 
     servicio = ServicioAutenticacion(mock_bd)
     result = servicio.registrar_usuario("usuario_test", "ContraNUEVA")
 
     assert result["success"] is False
+    assert result["codigo"] == 409
     assert "ya existe" in str(result["message"])
+    mock_bd.leer.assert_not_called()
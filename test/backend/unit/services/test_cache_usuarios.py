@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import Mock
+from omni.modules.cache_usuarios import CacheUsuarios
+from omni.modules.database import EstadoEscritura, ResultadoEscritura
+from omni.modules.services_user import ServicioUsuario
+from omni.modules.models import Usuario
+
+
+@pytest.fixture
+def mock_db():
+    db = Mock()
+    db.leer.return_value = [{"id": 1, "nombre": "admin", "password": "hash1"}]
+    db.actualizar.return_value = ResultadoEscritura(EstadoEscritura.EXITO, 1)
+    db.eliminar.return_value = 1
+    return db
+
+
+def test_cache_por_nombre_e_id():
+    cache = CacheUsuarios()
+    cache.guardar(Usuario(id=1, nombre="admin", password="x"), cache.marca(), "admin")
+
+    assert cache.obtener_por_nombre("admin") == Usuario(
+        id=1, nombre="admin", password="x"
+    )
+    assert cache.obtener_por_id(1) is not None
+    assert cache.obtener_por_nombre("otro") is None
+    assert cache.estadisticas()["aciertos"] == 2
+    assert cache.estadisticas()["fallos"] == 1
+
+
+def test_cache_vence_y_desaloja():
+    cache = CacheUsuarios(max_entradas=1, ttl=0)
+    cache.guardar(Usuario(id=1, nombre="a", password="x"), cache.marca(), "a")
+
+    assert cache.obtener_por_nombre("a") is None
+
+    cache.ttl = 60
+    cache.guardar(Usuario(id=1, nombre="a", password="x"), cache.marca(), "a")
+    cache.guardar(Usuario(id=2, nombre="b", password="x"), cache.marca(), "b")
+
+    assert cache.obtener_por_nombre("a") is None
+    assert cache.obtener_por_nombre("b") is not None
+    assert cache.desalojos == 1
+
+
+def test_cache_ignora_lectura_anterior_a_invalidar():
+    cache = CacheUsuarios()
+    marca = cache.marca()
+
+    cache.invalidar(1)
+    cache.guardar(Usuario(id=1, nombre="a", password="viejo"), marca, "a")
+
+    assert cache.obtener_por_nombre("a") is None
+
+
+def test_servicio_usa_cache(mock_db):
+    servicio = ServicioUsuario(mock_db)
+
+    servicio.obtener_usuarios_con_nombre("admin")
+    servicio.obtener_usuarios_con_nombre("admin")
+    servicio.obtener_usuario_por_id(1)
+
+    mock_db.leer.assert_called_once_with("usuario", {"nombre": "admin"})
+
+
+@pytest.mark.parametrize(
+    "escritura",
+    [
+        lambda servicio: servicio.actualizar_usuario("admin", {"password": "n"}),
+        lambda servicio: servicio.borrar_usuario("ADMIN"),
+        lambda servicio: servicio.borrar_usuario_por_id(1),
+    ],
+)
+def test_servicio_invalida_al_escribir(mock_db, escritura):
+    servicio = ServicioUsuario(mock_db)
+    servicio.obtener_usuarios_con_nombre("admin")
+
+    escritura(servicio)
+    mock_db.leer.reset_mock()
+    servicio.obtener_usuarios_con_nombre("admin")
+
+    mock_db.leer.assert_called_once_with("usuario", {"nombre": "admin"})
+
+
+def test_cache_invalida_por_nombre_normalizado():
+    cache = CacheUsuarios(max_entradas=2)
+    cache.guardar(Usuario(id=1, nombre="José", password="x"), cache.marca(), "jose")
+    cache.guardar(Usuario(id=2, nombre="ana", password="x"), cache.marca())
+    cache.guardar(Usuario(id=3, nombre="luis", password="x"), cache.marca())
+
+    cache.invalidar(nombre="JOSE ")
+    cache.invalidar(nombre="Ana")
+
+    assert cache.obtener_por_id(1) is None
+    assert cache.obtener_por_id(2) is None
+    assert cache.obtener_por_id(3) is not None
@@ -0,0 +1,79 @@
+import threading
+import pytest
+from cryptography.fernet import Fernet
+from omni.modules.cifrado import (
+    CifradoSaturado,
+    PoolCifrado,
+    calibrar_scrypt,
+    cifrar,
+    descifrar,
+    rotar,
+    unir_claves,
+    verificar,
+)
+
+
+@pytest.fixture
+def clave():
+    return Fernet.generate_key().decode()
+
+
+def test_cifrar_y_verificar_en_el_pool(clave):
+    pool = PoolCifrado(trabajadores=2, max_cola=4)
+
+    token = pool.ejecutar(cifrar, clave, ["secreto"])[0]
+
+    assert pool.ejecutar(verificar, clave, token, "secreto")
+    assert not pool.ejecutar(verificar, clave, token, "otro")
+    assert pool.estadisticas()["completadas"] == 3
+    pool.cerrar()
+
+
+def test_rechaza_al_superar_la_cola():
+    pool = PoolCifrado(trabajadores=1, max_cola=1)
+    liberar = threading.Event()
+
+    en_curso = pool.enviar(liberar.wait)
+    en_cola = pool.enviar(liberar.wait)
+
+    with pytest.raises(CifradoSaturado):
+        pool.enviar(liberar.wait)
+
+    estadisticas = pool.estadisticas()
+    assert estadisticas["en_curso"] == 1
+    assert estadisticas["en_cola"] == 1
+    assert estadisticas["rechazadas"] == 1
+
+    liberar.set()
+    en_curso.result(timeout=5)
+    en_cola.result(timeout=5)
+    pool.cerrar()
+    assert pool.estadisticas()["en_cola"] == 0
+
+
+def test_sin_trabajadores_ejecuta_en_el_hilo():
+    pool = PoolCifrado(trabajadores=0)
+
+    assert pool.ejecutar(threading.current_thread) is threading.current_thread()
+
+
+def test_calibrar_scrypt_respeta_la_memoria():
+    resultado = calibrar_scrypt(objetivo_ms=10_000, max_memoria=128 * 8 * 2048)
+
+    assert resultado["n"] == 2048
+    assert resultado["memoria"] <= 128 * 8 * 2048
+
+
+def test_rotar_con_clave_anterior(clave):
+    anterior = Fernet.generate_key().decode()
+    claves = unir_claves(clave, f" {anterior}, ")
+    viejo = cifrar(anterior, ["secreto"])[0]
+    actual = cifrar(claves, ["otro"])[0]
+
+    nuevo, igual, ilegible = rotar(claves, [viejo, actual, "basura"])
+
+    assert claves == f"{clave},{anterior}"
+    assert descifrar(clave, nuevo) == "secreto"
+    assert igual == actual
+    assert ilegible is None
+    assert verificar(claves, viejo, "secreto")
@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import Mock
+from mysql.connector import errors
+from omni.modules.database import EstadoEscritura, ResultadoEscritura
+from omni.modules.filtro_nombres import FiltroBloom, FiltroNombres
+from omni.modules.services_user import ReconstructorFiltro, ServicioUsuario
+from omni.modules.models import Usuario
+
+
+@pytest.fixture
+def mock_db():
+    db = Mock()
+    db.contar.return_value = 2
+    db.leer_flujo.side_effect = lambda *args, **kwargs: iter(
+        [{"nombre": "admin"}, {"nombre": "José"}]
+    )
+    db.leer.return_value = [{"id": 1, "nombre": "admin", "password": "hash1"}]
+    db.crear.return_value = ResultadoEscritura(EstadoEscritura.EXITO, 1, 3)
+    return db
+
+
+def test_bloom_sin_falsos_negativos():
+    filtro = FiltroBloom(1000, tasa_error=0.01)
+    nombres = [f"usuario{i}" for i in range(1000)]
+
+    for nombre in nombres:
+        filtro.agregar(nombre)
+
+    assert all(nombre in filtro for nombre in nombres)
+    falsos = sum(f"otro{i}" in filtro for i in range(10000))
+    assert falsos < 300
+
+
+def test_filtro_sin_construir_no_descarta():
+    filtro = FiltroNombres()
+
+    assert filtro.puede_existir("cualquiera")
+
+
+def test_filtro_ignora_mayusculas_y_acentos():
+    filtro = FiltroNombres()
+    filtro.reconstruir_si_vencido(lambda: (1, ["José"]))
+
+    assert filtro.puede_existir("jose ")
+    assert not filtro.puede_existir("maria")
+
+
+def test_servicio_descarta_sin_consultar(mock_db):
+    servicio = ServicioUsuario(mock_db)
+    assert servicio.reconstruir_filtro(mock_db)
+
+    assert servicio.obtener_usuarios_con_nombre("nadie") is None
+    mock_db.leer.assert_not_called()
+
+    assert servicio.obtener_usuarios_con_nombre("admin") is not None
+    mock_db.leer.assert_called_once_with("usuario", {"nombre": "admin"})
+
+
+def test_servicio_agrega_usuarios_creados(mock_db):
+    servicio = ServicioUsuario(mock_db)
+    servicio.reconstruir_filtro(mock_db)
+
+    servicio.crear_usuario(Usuario(nombre="nuevo", password="hash"))
+
+    assert servicio.filtro_nombres is not None
+    assert servicio.filtro_nombres.puede_existir("nuevo")
+
+
+def test_consulta_no_reconstruye_el_filtro(mock_db):
+    servicio = ServicioUsuario(mock_db)
+
+    assert servicio.puede_existir("nadie")
+    mock_db.contar.assert_not_called()
+    mock_db.leer_flujo.assert_not_called()
+
+
+def test_reconstructor_usa_su_propia_bd(mock_db):
+    servicio = ServicioUsuario(Mock())
+    reconstructor = ReconstructorFiltro(servicio, crear_bd=lambda: mock_db)
+
+    reconstructor.start()
+    reconstructor.detener()
+    reconstructor.join(timeout=5)
+
+    assert not servicio.puede_existir("nadie")
+    mock_db.leer_flujo.assert_called_once()
+    mock_db.desconectar.assert_called_once()
+
+
+def test_reconstructor_reintenta_si_no_hay_bd(mock_db):
+    servicio = ServicioUsuario(Mock())
+    crear_bd = Mock(side_effect=[errors.InterfaceError("sin servidor"), mock_db])
+    reconstructor = ReconstructorFiltro(servicio, crear_bd=crear_bd)
+    reconstructor.espera = 0.01
+
+    reconstructor.start()
+    for _ in range(500):
+        if mock_db.leer_flujo.called:
+            break
+        reconstructor.join(timeout=0.01)
+    reconstructor.detener()
+    reconstructor.join(timeout=5)
+
+    assert crear_bd.call_count == 2
+    assert not servicio.puede_existir("nadie")
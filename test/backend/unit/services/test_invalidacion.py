@@ -0,0 +1,98 @@
+import os
+import multiprocessing
+import pytest
+from omni.modules.cache_usuarios import CacheUsuarios
+from omni.modules.filtro_nombres import FiltroNombres
+from omni.modules.invalidacion import CanalInvalidacion, claves_invalidacion
+from omni.modules.models import Usuario
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    return str(tmp_path / "invalidacion.bin")
+
+
+def publicar(ruta: str, veces: int, id_usuario: int, alta: bool) -> None:
+    canal = CanalInvalidacion(ruta)
+    for _ in range(veces):
+        canal.publicar(claves_invalidacion(id_usuario, "nombre"), alta=alta)
+    canal.cerrar()
+
+
+def en_procesos(*argumentos: tuple) -> None:
+    contexto = multiprocessing.get_context("fork")
+    procesos = [contexto.Process(target=publicar, args=args) for args in argumentos]
+    for proceso in procesos:
+        proceso.start()
+    for proceso in procesos:
+        proceso.join()
+        assert proceso.exitcode == 0
+
+
+def test_otro_proceso_invalida_la_cache(ruta):
+    cache = CacheUsuarios(canal=CanalInvalidacion(ruta))
+    for id_usuario in (1, 2):
+        usuario = Usuario(id=id_usuario, nombre=f"u{id_usuario}", password="x")
+        cache.guardar(usuario, cache.marca(), usuario.nombre)
+
+    en_procesos((ruta, 1, 1, False))
+
+    assert cache.obtener_por_nombre("u1") is None
+    assert cache.obtener_por_id(2) is not None
+
+
+def test_publicaciones_concurrentes_no_se_pierden(ruta):
+    en_procesos(*[(ruta, 200, i, i % 2 == 0) for i in range(4)])
+
+    canal = CanalInvalidacion(ruta)
+    assert canal.version_global() == 2 * 4 * 200
+    assert canal.version_altas() == 2 * 200
+
+
+def test_lectura_durante_escritura_no_se_guarda(ruta):
+    cache = CacheUsuarios(canal=CanalInvalidacion(ruta))
+    marca = cache.marca()
+
+    en_procesos((ruta, 1, 1, False))
+    cache.guardar(Usuario(id=1, nombre="u1", password="viejo"), marca, "u1")
+
+    assert cache.obtener_por_id(1) is None
+
+
+def test_filtro_consulta_tras_alta_en_otro_proceso(ruta):
+    canal = CanalInvalidacion(ruta)
+    filtro = FiltroNombres(canal=canal)
+    filtro.reconstruir_si_vencido(lambda: (1, ["admin"]))
+    filtro.agregar("propio", canal.publicar(claves_invalidacion(nombre="propio"), True))
+
+    assert not filtro.puede_existir("nuevo")
+
+    en_procesos((ruta, 1, 5, True))
+
+    assert filtro.puede_existir("nuevo")
+
+
+def test_canal_rechaza_archivo_ajeno(ruta, monkeypatch):
+    with open(ruta, "wb"):
+        pass
+    os.chmod(ruta, 0o644)
+
+    with pytest.raises(PermissionError):
+        CanalInvalidacion(ruta)
+
+    os.chmod(ruta, 0o600)
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+    with pytest.raises(PermissionError):
+        CanalInvalidacion(ruta)
+
+
+def test_canal_no_sigue_enlaces(ruta, tmp_path):
+    destino = tmp_path / "destino"
+    destino.write_bytes(b"")
+    os.symlink(destino, ruta)
+
+    with pytest.raises(OSError):
+        CanalInvalidacion(ruta)
+    assert destino.read_bytes() == b""
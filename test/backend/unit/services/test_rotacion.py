@@ -0,0 +1,92 @@
+import json
+import stat
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+from cryptography.fernet import Fernet
+from omni.modules.cifrado import cifrar, descifrar, unir_claves
+from omni.modules.database import EstadoEscritura, ResultadoEscritura
+from omni.modules.rotacion import RotacionClaves, main
+
+
+@pytest.fixture
+def claves():
+    return unir_claves(Fernet.generate_key().decode(), Fernet.generate_key().decode())
+
+
+@pytest.fixture
+def mock_db(claves):
+    anterior = claves.split(",")[1]
+    filas = [
+        {"id": i, "password": cifrar(anterior, [f"pass{i}"])[0]} for i in range(1, 6)
+    ]
+
+    def leer(tabla, campos, orden, despues_de, limite):
+        return [fila for fila in filas if fila["id"] > despues_de][:limite]
+
+    db = Mock()
+    db.leer.side_effect = leer
+    db.actualizar_muchos.side_effect = lambda tabla, cambios: [
+        ResultadoEscritura(EstadoEscritura.EXITO, 1) for _ in cambios
+    ]
+    db.filas = filas
+    return db
+
+
+def test_rotacion_por_lotes(mock_db, claves, tmp_path):
+    publicar = Mock()
+    rotacion = RotacionClaves(
+        mock_db,
+        claves,
+        str(tmp_path / "progreso.json"),
+        lote=2,
+        procesos=0,
+        filas_por_segundo=0,
+        publicar=publicar,
+    )
+
+    avance = rotacion.ejecutar()
+
+    assert avance["ultimo_id"] == 5
+    assert avance["rotadas"] == 5
+    assert mock_db.actualizar_muchos.call_count == 3
+    datos, condiciones = mock_db.actualizar_muchos.call_args_list[0].args[1][0]
+    assert condiciones == {"id": 1, "password": mock_db.filas[0]["password"]}
+    assert descifrar(claves.split(",")[0], datos["password"]) == "pass1"
+    publicar.assert_any_call(["id:1", "id:2"])
+    assert json.loads((tmp_path / "progreso.json").read_text())["ultimo_id"] == 5
+
+
+def test_rotacion_continua_desde_el_progreso(mock_db, claves, tmp_path):
+    ruta = str(tmp_path / "progreso.json")
+    rotacion = RotacionClaves(
+        mock_db, claves, ruta, lote=2, procesos=0, filas_por_segundo=0, publicar=Mock()
+    )
+    rotacion.guardar_progreso(dict(rotacion.cargar_progreso(), ultimo_id=3))
+
+    avance = rotacion.ejecutar()
+
+    assert avance["leidas"] == 2
+    assert mock_db.leer.call_args_list[0].kwargs["despues_de"] == 3
+
+    otra = RotacionClaves(mock_db, unir_claves(Fernet.generate_key().decode()), ruta)
+    assert otra.cargar_progreso()["ultimo_id"] == 0
+
+
+def test_progreso_por_defecto_en_carpeta_de_estado(claves, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+    nueva, anterior = claves.split(",")
+    config = MagicMock()
+    config.obtener_config_app.return_value = {"Key": nueva, "PreviousKeys": anterior}
+    config.obtener_config_bd.return_value = {"database": "OmniGuard"}
+
+    with (
+        patch("omni.modules.rotacion.obtener_configuracion", return_value=config),
+        patch("omni.modules.rotacion.BasedeDatos"),
+        patch("omni.modules.rotacion.RotacionClaves") as rotacion,
+    ):
+        rotacion.return_value.ejecutar.return_value = {"ilegibles": 0}
+        assert main([]) == 0
+
+    carpeta = tmp_path / "omniguard"
+    assert rotacion.call_args.args[2] == str(carpeta / "rotacion-OmniGuard.json")
+    assert stat.S_IMODE(carpeta.stat().st_mode) == 0o700
@@ -1,6 +1,8 @@
+import asyncio
 import pytest
-from unittest.mock import Mock, call
-from omni.modules.services_user import ServicioUsuario
+from unittest.mock import AsyncMock, Mock, call
+from omni.modules.database import EstadoEscritura, ResultadoEscritura
+from omni.modules.services_user import ServicioUsuario, ServicioUsuarioAsync
 from omni.modules.models import Usuario
 
 
@@ -11,7 +13,7 @@ def mock_db():
         {"id": 1, "nombre": "admin", "password": "hash1"},
         {"id": 2, "nombre": "user1", "password": "hash2"},
     ]
-    db.actualizar.return_value = 1
+    db.actualizar.return_value = ResultadoEscritura(EstadoEscritura.EXITO, 1)
     db.eliminar.return_value = 1
     return db
 
@@ -27,12 +29,14 @@ def test_obtener_usuarios(mock_db):
 
 def test_actualizar_usuario_exitoso(mock_db):
     servicio = ServicioUsuario(mock_db)
-    filas_afectadas = servicio.actualizar_usuario("admin", {"password": "new_hash"})
+    resultado = servicio.actualizar_usuario("admin", {"password": "new_hash"})
 
-    assert filas_afectadas == 1
+    assert resultado.exito
+    assert resultado.filas == 1
     mock_db.actualizar.assert_called_once_with(
         "usuario", {"password": "new_hash"}, {"nombre": "admin"}
     )
+    mock_db.leer.assert_not_called()
 
 
 def test_borrar_usuario_exitoso(mock_db):
@@ -41,3 +45,68 @@ def test_borrar_usuario_exitoso(mock_db):
 
     assert filas_afectadas == 1
     mock_db.eliminar.assert_called_once_with("usuario", {"nombre": "user1"})
+
+
+def test_obtener_usuario_por_id(mock_db):
+    mock_db.leer.return_value = [{"id": 2, "nombre": "user1", "password": "hash2"}]
+
+    servicio = ServicioUsuario(mock_db)
+    usuario = servicio.obtener_usuario_por_id(2)
+
+    assert usuario == Usuario(id=2, nombre="user1", password="hash2")
+    mock_db.leer.assert_called_once_with("usuario", {"id": 2})
+
+
+def test_borrar_usuario_por_id(mock_db):
+    servicio = ServicioUsuario(mock_db)
+    filas_afectadas = servicio.borrar_usuario_por_id(2)
+
+    assert filas_afectadas == 1
+    mock_db.eliminar.assert_called_once_with("usuario", {"id": 2})
+    mock_db.leer.assert_not_called()
+
+
+def test_obtener_pagina_usuarios(mock_db):
+    mock_db.leer.return_value = [{"id": 3, "nombre": "ana"}]
+
+    servicio = ServicioUsuario(mock_db)
+    pagina = servicio.obtener_pagina_usuarios(2, despues_de=2, campos=["nombre"])
+
+    assert pagina == [{"id": 3, "nombre": "ana"}]
+    mock_db.leer.assert_called_once_with(
+        "usuario",
+        campos=["id", "nombre"],
+        prefijos=None,
+        orden="id",
+        despues_de=2,
+        limite=2,
+    )
+
+
+def test_obtener_pagina_usuarios_campo_invalido(mock_db):
+    servicio = ServicioUsuario(mock_db)
+
+    with pytest.raises(ValueError):
+        servicio.obtener_pagina_usuarios(10, campos=["email"])
+
+    mock_db.leer.assert_not_called()
+
+
+def test_servicio_async_invalida_con_el_servicio_sincrono(mock_db):
+    bd_async = AsyncMock()
+    bd_async.actualizar.return_value = ResultadoEscritura(EstadoEscritura.EXITO, 1)
+    servicio = ServicioUsuario(mock_db)
+    servicio.invalidar = Mock()
+
+    resultado = asyncio.run(
+        ServicioUsuarioAsync(bd_async, servicio).actualizar_usuario(
+            "admin", {"nombre": "root"}
+        )
+    )
+
+    assert resultado.exito
+    bd_async.actualizar.assert_awaited_once_with(
+        "usuario", {"nombre": "root"}, {"nombre": "admin"}
+    )
+    servicio.invalidar.assert_called_once_with(nombre="admin", nuevo="root")
+    mock_db.actualizar.assert_not_called()